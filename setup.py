@@ -24,15 +24,31 @@ This script can be used to compile the cython code:
 > python setup.py build_ext --inplace
 """
 
+import sys
+
 import numpy as np
 from Cython.Build import cythonize
 from setuptools import Extension, setup
 
+# Flags to compile the parallel loops with OpenMP. The default compiler on
+# macOS does not support OpenMP, in this case the loops run serially.
+if sys.platform == "win32":
+    openmp_compile_args = ["/openmp"]
+    openmp_link_args = []
+elif sys.platform == "darwin":
+    openmp_compile_args = []
+    openmp_link_args = []
+else:
+    openmp_compile_args = ["-fopenmp"]
+    openmp_link_args = ["-fopenmp"]
+
 extensions = [
     Extension(
         "beamme.geometric_search.cython_lib",
         ["src/beamme/geometric_search/cython_lib.pyx"],
         include_dirs=[np.get_include()],
+        extra_compile_args=openmp_compile_args,
+        extra_link_args=openmp_link_args,
     )
 ]
 
@@ -29,6 +29,8 @@ from typing import Optional as _Optional
 class BaseMeshItem:
     """Base class for all objects that are related to a mesh."""
 
+    __slots__ = ("data", "i_global")
+
     def __init__(self, data: _Optional[_Any] = None):
         """Create the base object.
 
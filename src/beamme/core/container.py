@@ -22,9 +22,80 @@
 """This module implements containers to manage boundary conditions and geometry
 sets in one object."""
 
+import functools as _functools
+
+
+def _reset_ids(method):
+    """Wrap a list method, such that the ids of the items are reset before
+    the list is modified."""
+
+    @_functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        """Reset the ids and call the wrapped method."""
+        self._ids = None
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+class _ItemList(list):
+    """A list that stores a set with the ids of its items.
+
+    The set is created on demand and updated when items are appended.
+    All other in-place modifications of the list reset the set.
+    """
+
+    _ids = None
+
+    def __getstate__(self):
+        """The ids are not copied, since they are only valid for the items
+        in this list."""
+        return None
+
+    def get_ids(self) -> set:
+        """Return the set with the ids of the items in this list."""
+        if self._ids is None:
+            self._ids = set(map(id, self))
+        return self._ids
+
+    def append(self, item):
+        """Append the item and add its id to the set."""
+        super().append(item)
+        if self._ids is not None:
+            self._ids.add(id(item))
+
+    __setitem__ = _reset_ids(list.__setitem__)
+    __delitem__ = _reset_ids(list.__delitem__)
+    __iadd__ = _reset_ids(list.__iadd__)
+    __imul__ = _reset_ids(list.__imul__)
+    clear = _reset_ids(list.clear)
+    extend = _reset_ids(list.extend)
+    insert = _reset_ids(list.insert)
+    pop = _reset_ids(list.pop)
+    remove = _reset_ids(list.remove)
+
 
 class ContainerBase(dict):
-    """A base class for containers."""
+    """A base class for containers.
+
+    To efficiently check if an item is in the list corresponding to a key,
+    the lists store a set with the ids of their items. Lists that are
+    assigned to the container are converted to such a list, i.e., the
+    container holds a copy of the assigned list.
+    """
+
+    def __setitem__(self, key, item_list):
+        """Set the list corresponding to key."""
+        if not isinstance(item_list, _ItemList):
+            item_list = _ItemList(item_list)
+        super().__setitem__(key, item_list)
+
+    def has_item(self, key, item) -> bool:
+        """Check if the item is in the list corresponding to key.
+
+        The items are compared by their identity.
+        """
+        return key in self.keys() and id(item) in self[key].get_ids()
 
     def append(self, key, item):
         """Append item to this container and check if the item is already in
@@ -42,9 +113,8 @@ class ContainerBase(dict):
             )
         if key not in self.keys():
             self[key] = []
-        else:
-            if item in self[key]:
-                raise ValueError("The item is already in this container!")
+        if id(item) in self[key].get_ids():
+            raise ValueError("The item is already in this container!")
         self[key].append(item)
 
     def extend(self, container):
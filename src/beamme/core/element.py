@@ -27,6 +27,8 @@ from beamme.core.base_mesh_item import BaseMeshItem as _BaseMeshItem
 class Element(_BaseMeshItem):
     """A base class for an FEM element in the mesh."""
 
+    __slots__ = ("nodes", "material", "vtk_cell_data")
+
     def __init__(self, nodes=None, material=None, **kwargs):
         super().__init__(**kwargs)
 
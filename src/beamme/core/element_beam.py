@@ -36,9 +36,66 @@ from beamme.core.rotation import Rotation as _Rotation
 from beamme.core.vtk_writer import add_point_data_node_sets as _add_point_data_node_sets
 
 
+def _get_hermite_shape_functions(xi):
+    """Return the Hermite shape functions for the positions and tangents
+    between two successive nodes.
+
+    Args:
+        xi: Parameter coordinates in the interval [-1, 1].
+
+    Returns:
+        The shape function matrices (len(xi) x 2) for the nodal positions
+        and the nodal tangents (scaled with the distance between the nodes).
+    """
+    xi = _np.asarray(xi, dtype=float)
+    shape_functions_pos = _np.array(
+        [
+            0.25 * (2.0 + xi) * (1.0 - xi) ** 2,
+            0.25 * (2.0 - xi) * (1.0 + xi) ** 2,
+        ]
+    ).transpose()
+    shape_functions_tan = _np.array(
+        [
+            0.125 * (1.0 + xi) * (1.0 - xi) ** 2,
+            -0.125 * (1.0 - xi) * (1.0 + xi) ** 2,
+        ]
+    ).transpose()
+    return shape_functions_pos, shape_functions_tan
+
+
+def check_beam_node(node, pos, rot, arc_length, name):
+    """Check if the given node matches with the position and rotation and
+    optionally also the arc length of a beam function.
+
+    Args:
+        node: The node that is checked.
+        pos: Position from the beam function.
+        rot: Rotation from the beam function.
+        arc_length: Arc length from the beam function, if this is None, the
+            arc length is not checked.
+        name: Name of the node for the error messages.
+    """
+
+    if _np.linalg.norm(pos - node.coordinates) > _bme.eps_pos:
+        raise ValueError(
+            f"{name} position does not match with function! Got {pos} from function but "
+            + f"given node value is {node.coordinates}"
+        )
+    if not node.rotation == rot:
+        raise ValueError(f"{name} rotation does not match with function!")
+
+    if arc_length is not None:
+        if _np.abs(node.arc_length - arc_length) > _bme.eps_pos:
+            raise ValueError(
+                f"Arc lengths don't match, got {node.arc_length} and {arc_length}"
+            )
+
+
 class Beam(_Element):
     """A base class for a beam element."""
 
+    __slots__ = ()
+
     # An array that defines the parameter positions of the element nodes,
     # in ascending order.
     nodes_create: _Any = []
@@ -91,24 +148,6 @@ class Beam(_Element):
         if len(self.nodes) > 0:
             raise ValueError("The beam should not have any local nodes yet!")
 
-        def check_node(node, pos, rot, arc_length, name):
-            """Check if the given node matches with the position and rotation
-            and optionally also the arc length."""
-
-            if _np.linalg.norm(pos - node.coordinates) > _bme.eps_pos:
-                raise ValueError(
-                    f"{name} position does not match with function! Got {pos} from function but "
-                    + f"given node value is {node.coordinates}"
-                )
-            if not node.rotation == rot:
-                raise ValueError(f"{name} rotation does not match with function!")
-
-            if arc_length is not None:
-                if _np.abs(node.arc_length - arc_length) > _bme.eps_pos:
-                    raise ValueError(
-                        f"Arc lengths don't match, got {node.arc_length} and {arc_length}"
-                    )
-
         # Flags if nodes are given
         has_start_node = start_node is not None
         has_end_node = end_node is not None
@@ -125,10 +164,10 @@ class Beam(_Element):
 
             # Check if the position and rotation match existing nodes
             if i == 0 and has_start_node:
-                check_node(start_node, pos, rot, arc_length, "start_node")
+                check_beam_node(start_node, pos, rot, arc_length, "start_node")
                 self.nodes = [start_node]
             elif (i == len(self.nodes_create) - 1) and has_end_node:
-                check_node(end_node, pos, rot, arc_length, "end_node")
+                check_beam_node(end_node, pos, rot, arc_length, "end_node")
 
             # Create the node
             if (i > 0 or not has_start_node) and (
@@ -190,6 +229,41 @@ class Beam(_Element):
                 f"Beam of type {type(self)} can not have a material of type {type(self.material)}!"
             )
 
+    def get_centerline_coordinates(self, *, n_segments_between_nodes=1):
+        """Return the points of a polyline along the beam centerline.
+
+        Args:
+            n_segments_between_nodes: Number of polyline segments between
+                successive nodes. For 1, the polyline connects the nodes. For
+                values greater than 1, a Hermite interpolation of the
+                centerline is assumed, the same as in `get_vtk`.
+
+        Returns:
+            Array with the coordinates of the polyline points, starting at the
+            first node of the element.
+        """
+
+        nodal_coordinates = _np.array([node.coordinates for node in self.nodes])
+        if n_segments_between_nodes == 1:
+            return nodal_coordinates
+
+        xi = _np.linspace(-1, 1, n_segments_between_nodes + 1)[:-1]
+        shape_functions_pos, shape_functions_tan = _get_hermite_shape_functions(xi)
+        tangents = _np.array(
+            [node.rotation.get_rotation_matrix()[:, 0] for node in self.nodes]
+        )
+        coordinates = []
+        for i_segment in range(len(self.nodes) - 1):
+            positions = nodal_coordinates[i_segment : i_segment + 2]
+            length_factor = _np.linalg.norm(positions[1] - positions[0])
+            coordinates.append(
+                shape_functions_pos @ positions
+                + length_factor
+                * (shape_functions_tan @ tangents[i_segment : i_segment + 2])
+            )
+        coordinates.append(nodal_coordinates[-1:])
+        return _np.concatenate(coordinates)
+
     def get_vtk(
         self,
         vtk_writer_beam,
@@ -277,18 +351,9 @@ class Beam(_Element):
             # all segments that we need. Drop the first and last value, since they represent the
             # nodes which we have already added above.
             xi = _np.linspace(-1, 1, beam_centerline_visualization_segments + 1)[1:-1]
-            hermite_shape_functions_pos = _np.array(
-                [
-                    0.25 * (2.0 + xi) * (1.0 - xi) ** 2,
-                    0.25 * (2.0 - xi) * (1.0 + xi) ** 2,
-                ]
-            ).transpose()
-            hermite_shape_functions_tan = _np.array(
-                [
-                    0.125 * (1.0 + xi) * (1.0 - xi) ** 2,
-                    -0.125 * (1.0 - xi) * (1.0 + xi) ** 2,
-                ]
-            ).transpose()
+            hermite_shape_functions_pos, hermite_shape_functions_tan = (
+                _get_hermite_shape_functions(xi)
+            )
 
             point_connectivity = _np.zeros(n_points, dtype=int)
 
@@ -22,11 +22,15 @@
 """This module implements a basic class to manage geometry in the input
 file."""
 
+from operator import attrgetter as _attrgetter
 from typing import KeysView as _KeysView
 from typing import Sequence as _Sequence
 from typing import Union as _Union
 from typing import cast as _cast
 
+import numpy as _np
+from numpy.typing import NDArray as _NDArray
+
 import beamme.core.conf as _conf
 from beamme.core.base_mesh_item import BaseMeshItem as _BaseMeshItem
 from beamme.core.conf import bme as _bme
@@ -84,7 +88,10 @@ class GeometrySetBase(_BaseMeshItem):
         else:
             raise ValueError(f'Got unexpected value link nodes="{link_to_nodes}"')
         for node in node_list:
-            node.node_sets_link.append(self)
+            if node.node_sets_link is None:
+                node.node_sets_link = [self]
+            else:
+                node.node_sets_link.append(self)
 
     def check_replaced_nodes(self) -> None:
         """Check if nodes in this set have to be replaced.
@@ -144,25 +151,113 @@ class GeometrySetBase(_BaseMeshItem):
             'The "get_all_nodes" method has to be overwritten in the derived class'
         )
 
+    def get_node_indices(self) -> _NDArray:
+        """Determine the global indices of all nodes associated with this set.
+
+        The global indices have to be assigned to the nodes before calling
+        this function.
+
+        Returns:
+            A sorted array with the unique global indices of all nodes
+            associated with this set.
+        """
+        nodes = self.get_all_nodes()
+        return _np.unique(
+            _np.fromiter(
+                map(_attrgetter("i_global"), nodes), dtype=int, count=len(nodes)
+            )
+        )
+
     def dump_to_list(self):
         """Return a list with the legacy strings of this geometry set."""
 
-        # Sort nodes based on their global index
-        nodes = sorted(self.get_all_nodes(), key=lambda n: n.i_global)
+        node_indices = self.get_node_indices()
 
-        if not nodes:
+        if len(node_indices) == 0:
             raise ValueError("Writing empty geometry sets is not supported")
 
+        d_type = self.geometry_set_names[self.geometry_type]
+        d_id = self.i_global + 1
         return [
-            {
-                "type": "NODE",
-                "node_id": node.i_global + 1,
-                "d_type": self.geometry_set_names[self.geometry_type],
-                "d_id": self.i_global + 1,
-            }
-            for node in nodes
+            {"type": "NODE", "node_id": node_id, "d_type": d_type, "d_id": d_id}
+            for node_id in (node_indices + 1).tolist()
         ]
 
+    def _get_members(self) -> dict:
+        """Return the dictionary with the explicitly contained items of this
+        set."""
+        raise NotImplementedError(
+            'The "_get_members" method has to be overwritten in the derived class'
+        )
+
+    def _create_from_members(self, members: dict):
+        """Return a new geometry set of the same kind and geometry type as
+        this set, that contains the given items."""
+        raise NotImplementedError(
+            'The "_create_from_members" method has to be overwritten in the '
+            "derived class"
+        )
+
+    def _get_other_members(self, other) -> dict:
+        """Return the dictionary with the explicitly contained items of the
+        other set.
+
+        Args:
+            other: Geometry set of the same kind and geometry type as this set.
+        """
+        if not (
+            isinstance(other, type(self)) and other.geometry_type is self.geometry_type
+        ):
+            raise TypeError(
+                f"Set operations are only possible with a {type(self)} of the "
+                f"geometry type {self.geometry_type}, got {type(other)}"
+            )
+        return other._get_members()
+
+    def union(self, other):
+        """Create a new geometry set with the items of this set and the other
+        set.
+
+        Args:
+            other: Geometry set of the same kind and geometry type as this set.
+
+        Returns:
+            A new geometry set, the items are ordered as in this set,
+            followed by the items that are only in the other set.
+        """
+        other_members = self._get_other_members(other)
+        return self._create_from_members(self._get_members() | other_members)
+
+    def intersection(self, other):
+        """Create a new geometry set with the items contained in this set and
+        in the other set.
+
+        Args:
+            other: Geometry set of the same kind and geometry type as this set.
+
+        Returns:
+            A new geometry set, the items are ordered as in this set.
+        """
+        other_members = self._get_other_members(other)
+        return self._create_from_members(
+            {item: None for item in self._get_members() if item in other_members}
+        )
+
+    def difference(self, other):
+        """Create a new geometry set with the items of this set that are not
+        contained in the other set.
+
+        Args:
+            other: Geometry set of the same kind and geometry type as this set.
+
+        Returns:
+            A new geometry set, the items are ordered as in this set.
+        """
+        other_members = self._get_other_members(other)
+        return self._create_from_members(
+            {item: None for item in self._get_members() if item not in other_members}
+        )
+
     def __add__(self, other):
         """Create a new geometry set with the combined geometries from this set
         and the other set.
@@ -320,6 +415,22 @@ class GeometrySet(GeometrySetBase):
         """
         return GeometrySet(list(self.geometry_objects[self.geometry_type].keys()))
 
+    def _get_members(self) -> dict[_Node | _Element, None]:
+        """Return the dictionary with the explicitly contained items of this
+        set."""
+        return self.geometry_objects[self.geometry_type]
+
+    def _create_from_members(
+        self, members: dict[_Node | _Element, None]
+    ) -> "GeometrySet":
+        """Return a new geometry set of the same geometry type as this set,
+        that contains the given items."""
+        geometry_set = GeometrySet.__new__(GeometrySet)
+        GeometrySetBase.__init__(geometry_set, self.geometry_type)
+        geometry_set.geometry_objects = {geo: {} for geo in _bme.geo}
+        geometry_set.geometry_objects[self.geometry_type] = members
+        return geometry_set
+
 
 class GeometrySetNodes(GeometrySetBase):
     """Geometry set which is defined by nodes and not explicit geometry."""
@@ -423,6 +534,18 @@ class GeometrySetNodes(GeometrySetBase):
             nodes=list(self.nodes.keys()),
         )
 
+    def _get_members(self) -> dict[_Node, None]:
+        """Return the dictionary with the explicitly contained items of this
+        set."""
+        return self.nodes
+
+    def _create_from_members(self, members: dict[_Node, None]) -> "GeometrySetNodes":
+        """Return a new geometry set of the same geometry type as this set,
+        that contains the given items."""
+        geometry_set = GeometrySetNodes(self.geometry_type)
+        geometry_set.nodes = members
+        return geometry_set
+
 
 class GeometryName(dict):
     """Group node geometry sets together.
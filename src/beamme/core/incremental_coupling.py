@@ -0,0 +1,152 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018-2025 BeamMe Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""This module implements the state of incremental node couplings in a
+mesh."""
+
+from beamme.core.conf import bme as _bme
+from beamme.core.coupling import Coupling as _Coupling
+from beamme.core.coupling import coupling_factory as _coupling_factory
+from beamme.core.node import Node as _Node
+from beamme.geometric_search.incremental import (
+    IncrementalClosePointSearch as _IncrementalClosePointSearch,
+)
+from beamme.utils.nodes import filter_nodes as _filter_nodes
+from beamme.utils.nodes import get_nodal_coordinates as _get_nodal_coordinates
+
+
+class IncrementalCoupling:
+    """Couple the nodes of a mesh step by step.
+
+    The already processed end nodes are stored in a persistent search
+    structure. Each call of `couple_new_nodes` only queries and inserts
+    the nodes that were added to the mesh since the last call. Groups of
+    coupled nodes that get new partners are replaced with a single
+    coupling for the extended group, so the final couplings are the same
+    as for a full coupling pass over all nodes.
+
+    The state references the nodes and couplings of the mesh. If the mesh
+    is copied, the state is copied together with the nodes and couplings,
+    so the incremental coupling can be continued on the copy.
+    """
+
+    def __init__(self, coupling_type, coupling_dof_type):
+        """Initialize the empty coupling state.
+
+        Args:
+            coupling_type: Type of point coupling.
+            coupling_dof_type: Coupled DOFs, see `Mesh.couple_nodes`.
+        """
+
+        self.coupling_type = coupling_type
+        self.coupling_dof_type = coupling_dof_type
+
+        self.search = _IncrementalClosePointSearch()
+
+        # All mesh nodes that have been processed (including middle nodes).
+        self.mesh_nodes: list[_Node] = []
+
+        # The processed end nodes, they are in the same order as the points in
+        # the search structure.
+        self.nodes: list[_Node] = []
+
+        # Union-find data structure for the groups of coupled nodes. For the
+        # root of each group we store the indices of the nodes in the group
+        # and the corresponding coupling conditions.
+        self.parent: list[int] = []
+        self.group_nodes: dict[int, list[int]] = {}
+        self.group_couplings: dict[int, list[_Coupling]] = {}
+
+    def _find_root(self, index: int) -> int:
+        """Return the root of the group of the given node index."""
+        parent = self.parent
+        root = index
+        while parent[root] != root:
+            root = parent[root]
+        while parent[index] != root:
+            parent[index], index = root, parent[index]
+        return root
+
+    def couple_new_nodes(self, mesh) -> None:
+        """Couple the end nodes that were added to the mesh since the last
+        call.
+
+        Args:
+            mesh: The mesh that contains the nodes. Only appending nodes to
+                the mesh is supported between the calls, and the already
+                processed nodes must not be moved.
+        """
+
+        n_processed = len(self.mesh_nodes)
+        if mesh.nodes[:n_processed] != self.mesh_nodes:
+            raise ValueError(
+                "The nodes of the mesh were modified since the last incremental "
+                "coupling, only appending nodes is supported!"
+            )
+        new_mesh_nodes = mesh.nodes[n_processed:]
+        self.mesh_nodes.extend(new_mesh_nodes)
+        new_nodes = _filter_nodes(new_mesh_nodes, middle_nodes=False)
+        if len(new_nodes) == 0:
+            return
+
+        i_first_new = len(self.nodes)
+        self.nodes.extend(new_nodes)
+        self.parent.extend(range(i_first_new, len(self.nodes)))
+        pairs = self.search.add_points(_get_nodal_coordinates(new_nodes))
+
+        # Merge the groups. The root of a group is always its smallest index,
+        # so the nodes in the couplings are in the order of the node list.
+        modified_roots = set()
+        removed_couplings = []
+        for i_node_1, i_node_2 in pairs.tolist():
+            root_1 = self._find_root(i_node_1)
+            root_2 = self._find_root(i_node_2)
+            if root_1 == root_2:
+                continue
+            root, merged_root = min(root_1, root_2), max(root_1, root_2)
+            self.parent[merged_root] = root
+            self.group_nodes[root] = self.group_nodes.pop(root, [root]) + (
+                self.group_nodes.pop(merged_root, [merged_root])
+            )
+            removed_couplings.extend(self.group_couplings.pop(root, []))
+            removed_couplings.extend(self.group_couplings.pop(merged_root, []))
+            modified_roots.discard(merged_root)
+            modified_roots.add(root)
+
+        # Replace the couplings of all modified groups.
+        if len(removed_couplings) > 0:
+            removed_ids = set(map(id, removed_couplings))
+            coupling_list = mesh.boundary_conditions[self.coupling_type, _bme.geo.point]
+            coupling_list[:] = [
+                coupling
+                for coupling in coupling_list
+                if id(coupling) not in removed_ids
+            ]
+        for root in sorted(modified_roots):
+            node_indices = sorted(self.group_nodes[root])
+            self.group_nodes[root] = node_indices
+            couplings = _coupling_factory(
+                [self.nodes[i_node] for i_node in node_indices],
+                self.coupling_type,
+                self.coupling_dof_type,
+            )
+            self.group_couplings[root] = couplings
+            mesh.add(couplings)
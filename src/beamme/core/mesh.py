@@ -23,8 +23,10 @@
 elements, sets, ...) for a meshed geometry."""
 
 import copy as _copy
+import itertools as _itertools
 import os as _os
 import warnings as _warnings
+from operator import attrgetter as _attrgetter
 from typing import Dict as _Dict
 from typing import List as _List
 from typing import Optional as _Optional
@@ -48,18 +50,29 @@ from beamme.core.function import Function as _Function
 from beamme.core.geometry_set import GeometryName as _GeometryName
 from beamme.core.geometry_set import GeometrySetBase as _GeometrySetBase
 from beamme.core.geometry_set import GeometrySetContainer as _GeometrySetContainer
+from beamme.core.geometry_set import GeometrySetNodes as _GeometrySetNodes
+from beamme.core.incremental_coupling import (
+    IncrementalCoupling as _IncrementalCoupling,
+)
 from beamme.core.material import Material as _Material
+from beamme.core.mesh_instance import MeshInstance as _MeshInstance
+from beamme.core.nodal_arrays import NodalArrays as _NodalArrays
 from beamme.core.node import Node as _Node
 from beamme.core.node import NodeCosserat as _NodeCosserat
+from beamme.core.node_element_adjacency import (
+    NodeElementAdjacency as _NodeElementAdjacency,
+)
+from beamme.core.node_spatial_index import NodeSpatialIndex as _NodeSpatialIndex
 from beamme.core.rotation import Rotation as _Rotation
 from beamme.core.rotation import add_rotations as _add_rotations
+from beamme.core.rotation import get_rotation_vectors as _get_rotation_vectors
 from beamme.core.rotation import rotate_coordinates as _rotate_coordinates
 from beamme.core.vtk_writer import VTKWriter as _VTKWriter
 from beamme.geometric_search.find_close_points import (
     find_close_points as _find_close_points,
 )
 from beamme.geometric_search.find_close_points import (
-    point_partners_to_partner_indices as _point_partners_to_partner_indices,
+    find_close_points_segmented as _find_close_points_segmented,
 )
 from beamme.utils.environment import is_testing as _is_testing
 from beamme.utils.nodes import filter_nodes as _filter_nodes
@@ -69,6 +82,84 @@ from beamme.utils.nodes import get_nodal_coordinates as _get_nodal_coordinates
 from beamme.utils.nodes import get_nodal_quaternions as _get_nodal_quaternions
 from beamme.utils.nodes import get_nodes_by_function as _get_nodes_by_function
 
+# Types of attributes that don't have to be deep copied.
+_ATOMIC_TYPES = frozenset([type(None), bool, int, float, str])
+
+
+def _get_slot_names(cls) -> tuple:
+    """Return the names of all slots of a class, including the ones of its
+    base classes."""
+    return tuple(
+        name
+        for base in reversed(cls.__mro__)
+        for name in base.__dict__.get("__slots__", ())
+        if name not in ("__dict__", "__weakref__")
+    )
+
+
+def _copy_mesh_items(
+    items: list, replaced_names: set, replaced_attributes, deep_copy_items: list
+) -> list:
+    """Return shallow copies of mesh items with some replaced attributes.
+
+    Args:
+        items: The items to be copied.
+        replaced_names: Names of all attributes that can be replaced.
+        replaced_attributes: Iterable with a dictionary for each item, that
+            contains the attributes which are set in the copy instead of the
+            ones of the original item.
+        deep_copy_items: If an item has further attributes that are not
+            atomic, the original item, the copy and the names of these
+            attributes are appended to this list, so the attributes can be
+            deep copied once all items are copied.
+
+    Returns:
+        The copied items.
+    """
+
+    # The names of the slots that are not replaced and a getter for their
+    # values are stored for each class.
+    class_slots = {}
+
+    new_items = []
+    for item, item_replaced_attributes in zip(items, replaced_attributes):
+        cls = item.__class__
+        slots = class_slots.get(cls)
+        if slots is None:
+            names = tuple(
+                name for name in _get_slot_names(cls) if name not in replaced_names
+            )
+            getter = _attrgetter(*names) if len(names) > 1 else None
+            slots = class_slots[cls] = (names, getter)
+        names, getter = slots
+
+        new_item = cls.__new__(cls)
+        if getter is not None:
+            values = getter(item)
+        else:
+            values = tuple(getattr(item, name) for name in names)
+        for name, value in zip(names, values):
+            setattr(new_item, name, value)
+
+        # Subclasses without slots store their attributes in a dictionary.
+        attributes = getattr(item, "__dict__", None)
+        if attributes is not None:
+            new_item.__dict__.update(attributes)
+            dict_names = tuple(
+                name for name in attributes if name not in replaced_names
+            )
+            names = names + dict_names
+            values = (*values, *map(attributes.__getitem__, dict_names))
+
+        for name, value in item_replaced_attributes.items():
+            setattr(new_item, name, value)
+        new_items.append(new_item)
+
+        if not _ATOMIC_TYPES.issuperset(map(type, values)):
+            deep_copy_items.append((item, new_item, names))
+
+    return new_items
+
 
 class Mesh:
     """A class that contains a full mesh, i.e. Nodes, Elements, Boundary
@@ -83,6 +174,18 @@ class Mesh:
         self.functions = []
         self.geometry_sets = _GeometrySetContainer()
         self.boundary_conditions = _BoundaryConditionContainer()
+        self.mesh_instances = []
+
+        # Contiguous arrays with the nodal data, a map from the nodes to
+        # their index in the node list, the node-element adjacency and the
+        # spatial index of the nodes, they are created on demand.
+        self._nodal_arrays = None
+        self._node_index_map = None
+        self._node_element_adjacency = None
+        self._node_spatial_index = None
+
+        # State of the incremental node coupling.
+        self._incremental_coupling = None
 
     @staticmethod
     def get_base_mesh_item_type(item):
@@ -104,6 +207,7 @@ class Mesh:
             _Element,
             _GeometrySetBase,
             _GeometryName,
+            _MeshInstance,
         ):
             if isinstance(item, cls):
                 return cls
@@ -134,6 +238,7 @@ class Mesh:
                     _Element: self.add_element,
                     _GeometrySetBase: self.add_geometry_set,
                     _GeometryName: self.add_geometry_name,
+                    _MeshInstance: self.add_mesh_instance,
                     list: self.add_list,
                 }
                 if base_type in base_type_to_method_map:
@@ -156,6 +261,7 @@ class Mesh:
         self.add(mesh.functions)
         self.geometry_sets.extend(mesh.geometry_sets)
         self.boundary_conditions.extend(mesh.boundary_conditions)
+        self.add(mesh.mesh_instances)
 
     def add_bc(self, bc):
         """Add a boundary condition to this mesh."""
@@ -208,6 +314,12 @@ class Mesh:
         for key in keys:
             self.add(geometry_name[key])
 
+    def add_mesh_instance(self, mesh_instance):
+        """Add mesh instances to this mesh."""
+        if mesh_instance in self.mesh_instances:
+            raise ValueError("The mesh instance is already in this mesh!")
+        self.mesh_instances.append(mesh_instance)
+
     def add_list(self, add_list: _List, **kwargs) -> None:
         """Add a list of items to this mesh.
 
@@ -254,19 +366,130 @@ class Mesh:
                 for item in add_list:
                     self.add(item, **kwargs)
 
+    def _get_node_index_map(self) -> _Dict[_Node, int]:
+        """Return a map from the nodes of this mesh to their index in the node
+        list.
+
+        The map is stored in the mesh and is only recreated if the node
+        list was replaced or its length changed, e.g., if nodes were
+        appended to the list. Other in-place modifications of the node
+        list are not detected, therefore, the methods of the mesh that
+        modify the node list in-place update or reset the map.
+        """
+        index = self._node_index_map
+        if index is None or index[0] is not self.nodes or index[1] != len(self.nodes):
+            index = (
+                self.nodes,
+                len(self.nodes),
+                {node: i for i, node in enumerate(self.nodes)},
+            )
+            self._node_index_map = index
+        return index[2]
+
     def replace_node(self, old_node, new_node):
-        """Replace the first node with the second node."""
+        """Replace the first node with the second node.
+
+        Only the node list of this mesh is modified. To replace nodes
+        everywhere in the mesh use `replace_nodes`.
+
+        The nodes are looked up in the node index map. Removing the node
+        from the node list shifts the indices of the following nodes, so
+        the cost of this method is proportional to the number of nodes
+        after the replaced node.
+        """
+
+        node_index_map = self._get_node_index_map()
 
         # Check that the new node is in mesh.
-        if new_node not in self.nodes:
+        if new_node not in node_index_map:
             raise ValueError("The new node is not in the mesh!")
 
-        for i, node in enumerate(self.nodes):
-            if node == old_node:
-                del self.nodes[i]
-                break
-        else:
+        i_node = node_index_map.pop(old_node, None)
+        if i_node is None:
             raise ValueError("The node that should be replaced is not in the mesh")
+        del self.nodes[i_node]
+        for i, node in enumerate(self.nodes[i_node:], start=i_node):
+            node_index_map[node] = i
+        self._node_index_map = (self.nodes, len(self.nodes), node_index_map)
+
+    def replace_nodes(self, node_map: _Dict[_Node, _Node]) -> None:
+        """Replace multiple nodes in this mesh at once.
+
+        The replaced nodes are substituted in all elements and all geometry
+        sets of this mesh (including the ones of boundary conditions) and
+        are then removed from the node list in a single pass. Compared to
+        replacing each node individually with `Node.replace_with`, this
+        scales linearly with the mesh size.
+
+        Args:
+            node_map: Dictionary where the keys are the nodes that will be
+                replaced and the values are the nodes that replace them. If a
+                replacing node is itself replaced, the final node of this chain
+                is used.
+        """
+
+        if len(node_map) == 0:
+            return
+
+        node_index_map = self._get_node_index_map()
+
+        # Map each replaced node directly to the final node that replaces it.
+        replacement_map: _Dict[_Node, _Node] = {}
+        for old_node, new_node in node_map.items():
+            if not isinstance(old_node, type(new_node)):
+                raise TypeError(
+                    "A node can only be replaced by a node with the same type. "
+                    + f"Got {type(old_node)} and {type(new_node)}"
+                )
+            if old_node not in node_index_map:
+                raise ValueError("The node that should be replaced is not in the mesh")
+            chain = [old_node]
+            while new_node in node_map and new_node not in replacement_map:
+                if new_node in chain:
+                    raise ValueError("The given node replacements contain a cycle")
+                chain.append(new_node)
+                new_node = node_map[new_node]
+            new_node = replacement_map.get(new_node, new_node)
+            if new_node not in node_index_map:
+                raise ValueError("The new node is not in the mesh!")
+            for node in chain:
+                replacement_map[node] = new_node
+
+        # Replace the nodes in the elements connected to the replaced nodes.
+        replaced_nodes = replacement_map.keys()
+        for element in self.get_connected_elements(replaced_nodes):
+            for i_node, node in enumerate(element.nodes):
+                if node in replacement_map:
+                    element.nodes[i_node] = replacement_map[node]
+
+        # Replace the explicitly contained nodes in the geometry sets. The
+        # nodes are replaced in the order of the given map, to get the same
+        # ordering in the sets as for individually replaced nodes.
+        replacement_order = {node: i for i, node in enumerate(replacement_map)}
+        geometry_sets = {
+            id(geometry_set): geometry_set
+            for geometry_list in self.geometry_sets.values()
+            for geometry_set in geometry_list
+        }
+        for bc_list in self.boundary_conditions.values():
+            for bc in bc_list:
+                geometry_sets[id(bc.geometry_set)] = bc.geometry_set
+        for geometry_set in geometry_sets.values():
+            nodes_in_set = geometry_set.get_node_dict()
+            if not replaced_nodes.isdisjoint(nodes_in_set):
+                replaced_nodes_in_set = [
+                    node for node in nodes_in_set if node in replacement_map
+                ]
+                replaced_nodes_in_set.sort(key=replacement_order.__getitem__)
+                for node in replaced_nodes_in_set:
+                    geometry_set.replace_node(node, replacement_map[node])
+
+        # Remove the replaced nodes from the mesh and set the link to the
+        # master nodes.
+        self.nodes[:] = [node for node in self.nodes if node not in replacement_map]
+        self._node_index_map = None
+        for old_node, new_node in replacement_map.items():
+            old_node.master_node = new_node.get_master_node()
 
     def get_unique_geometry_sets(
         self,
@@ -302,7 +525,7 @@ class Mesh:
         if is_link_nodes:
             # First clear all links in existing nodes.
             for node in self.nodes:
-                node.node_sets_link = []
+                node.node_sets_link = None
 
         # Make a copy of the sets in this mesh.
         mesh_sets = self.geometry_sets.copy()
@@ -319,8 +542,8 @@ class Mesh:
                     # Only add set if it is not already in the container.
                     # For example if multiple Neumann boundary conditions
                     # are applied on the same node set.
-                    if bc.geometry_set not in mesh_sets[geom_key]:
-                        mesh_sets[geom_key].append(bc.geometry_set)
+                    if not mesh_sets.has_item(geom_key, bc.geometry_set):
+                        mesh_sets.append(geom_key, bc.geometry_set)
 
         for key in mesh_sets.keys():
             i_global_offset = 0
@@ -342,12 +565,112 @@ class Mesh:
 
         Also add a link to this mesh.
         """
-        for element in self.elements:
-            for node in element.nodes:
-                node.element_link.append(element)
-        for node in self.nodes:
+        node_elements = self.get_node_element_adjacency().get_node_elements()
+        for node, elements in zip(self.nodes, node_elements):
+            node.element_link = elements
             node.mesh = self
 
+    def get_node_element_adjacency(self) -> _NodeElementAdjacency:
+        """Return the adjacency between the nodes and elements of this mesh.
+
+        The adjacency is created on the first call and reused as long as
+        the nodes and elements of the mesh do not change.
+
+        Returns:
+            The node-element adjacency of this mesh.
+        """
+        if (
+            self._node_element_adjacency is None
+            or not self._node_element_adjacency.is_valid(self.nodes, self.elements)
+        ):
+            self._node_element_adjacency = _NodeElementAdjacency(
+                self.nodes, self.elements, self._get_node_index_map()
+            )
+        return self._node_element_adjacency
+
+    def get_connected_elements(self, nodes) -> _List[_Element]:
+        """Return all elements of this mesh that are connected to at least one
+        of the given nodes.
+
+        Args:
+            nodes: Nodes of this mesh.
+
+        Returns:
+            The connected elements in the order of the element list.
+        """
+        node_index_map = self._get_node_index_map()
+        node_indices = [node_index_map[node] for node in nodes]
+        adjacency = self.get_node_element_adjacency()
+        return [
+            self.elements[i_element]
+            for i_element in adjacency.get_element_indices(node_indices)
+        ]
+
+    def get_expanded_mesh(self) -> "Mesh":
+        """Return a mesh in which all mesh instances are expanded to concrete
+        nodes and elements.
+
+        The returned mesh contains the items of this mesh (not copies of
+        them) and the items of the expanded instances. If this mesh does not
+        contain mesh instances, the mesh itself is returned.
+
+        Returns:
+            The mesh with the expanded mesh instances.
+        """
+
+        if len(self.mesh_instances) == 0:
+            return self
+
+        instance_meshes = [
+            instance_mesh
+            for mesh_instance in self.mesh_instances
+            for instance_mesh in mesh_instance.get_meshes()
+        ]
+
+        mesh = Mesh()
+        mesh.add_mesh(self)
+        mesh.mesh_instances = []
+
+        # Add the nodes and elements of all instances at once, so the
+        # duplicate check is only performed once.
+        mesh.add([node for item in instance_meshes for node in item.nodes])
+        mesh.add([element for item in instance_meshes for element in item.elements])
+        for instance_mesh in instance_meshes:
+            mesh.add(instance_mesh.materials)
+            mesh.add(instance_mesh.functions)
+            mesh.geometry_sets.extend(instance_mesh.geometry_sets)
+            mesh.boundary_conditions.extend(instance_mesh.boundary_conditions)
+        return mesh
+
+    def _check_no_mesh_instances(self, operation: str) -> None:
+        """Raise an error if this mesh contains mesh instances.
+
+        Args:
+            operation: Description of the operation that is not possible
+                for mesh instances.
+        """
+        if len(self.mesh_instances) > 0:
+            raise ValueError(
+                f"A mesh with mesh instances can not be {operation}! Use "
+                "Mesh.get_expanded_mesh to expand the mesh instances first."
+            )
+
+    def get_nodal_arrays(self) -> _NodalArrays:
+        """Return contiguous arrays with the coordinates and quaternions of all
+        nodes in this mesh.
+
+        The nodes are bound to the returned arrays, i.e., modifying the
+        arrays directly modifies the nodes. The arrays are created on the
+        first call and reused as long as the nodes of the mesh do not
+        change.
+
+        Returns:
+            The nodal arrays of this mesh.
+        """
+        if self._nodal_arrays is None or not self._nodal_arrays.is_valid(self.nodes):
+            self._nodal_arrays = _NodalArrays(self.nodes)
+        return self._nodal_arrays
+
     def translate(self, vector):
         """Translate all beam nodes of this mesh.
 
@@ -356,8 +679,9 @@ class Mesh:
         vector: _np.array, list
             3D vector that will be added to all nodes.
         """
-        for node in self.nodes:
-            node.coordinates += vector
+        self.get_nodal_arrays().coordinates += vector
+        for mesh_instance in self.mesh_instances:
+            mesh_instance.translate(vector)
 
     def rotate(
         self,
@@ -376,22 +700,26 @@ class Mesh:
                 changed.
         """
 
-        # Get array with all quaternions for the nodes.
-        rot1 = _get_nodal_quaternions(self.nodes)
+        if len(self.mesh_instances) > 0:
+            if not isinstance(rotation, _Rotation) or only_rotate_triads:
+                raise ValueError(
+                    "Mesh instances can only be rotated with a single rotation "
+                    "of the nodal positions and rotations!"
+                )
+            for mesh_instance in self.mesh_instances:
+                mesh_instance.rotate(rotation, origin=origin)
+            if len(self.nodes) == 0:
+                return
+
+        nodal_arrays = self.get_nodal_arrays()
 
         # Apply the rotation to the rotation of all nodes.
-        rot_new = _add_rotations(rotation, rot1)
+        nodal_arrays.set_quaternions(_add_rotations(rotation, nodal_arrays.quaternions))
 
         if not only_rotate_triads:
-            # Get array with all positions for the nodes.
-            pos = _get_nodal_coordinates(self.nodes)
-            pos_new = _rotate_coordinates(pos, rotation, origin=origin)
-
-        for i, node in enumerate(self.nodes):
-            if isinstance(node, _NodeCosserat):
-                node.rotation.q = rot_new[i, :]
-            if not only_rotate_triads:
-                node.coordinates = pos_new[i, :]
+            nodal_arrays.coordinates[:] = _rotate_coordinates(
+                nodal_arrays.coordinates, rotation, origin=origin
+            )
 
     def reflect(self, normal_vector, origin=None, flip_beams: bool = False) -> None:
         """Reflect all nodes of the mesh with respect to a plane defined by its
@@ -418,12 +746,15 @@ class Mesh:
                 along the beam is reversed.
         """
 
+        self._check_no_mesh_instances("reflected")
+
         # Normalize the normal vector.
         normal_vector = _np.asarray(normal_vector) / _np.linalg.norm(normal_vector)
 
         # Get array with all quaternions and positions for the nodes.
-        pos = _get_nodal_coordinates(self.nodes)
-        rot1 = _get_nodal_quaternions(self.nodes)
+        nodal_arrays = self.get_nodal_arrays()
+        pos = nodal_arrays.coordinates.copy()
+        rot1 = nodal_arrays.quaternions
 
         # Check if origin has to be added.
         if origin is not None:
@@ -469,10 +800,8 @@ class Mesh:
                 element.flip()
 
         # Set the new positions and rotations.
-        for i, node in enumerate(self.nodes):
-            node.coordinates = pos_new[i, :]
-            if isinstance(node, _NodeCosserat):
-                node.rotation.q = rot_new[i, :]
+        nodal_arrays.coordinates[:] = pos_new
+        nodal_arrays.set_quaternions(rot_new)
 
     def wrap_around_cylinder(
         self, radius: float | None = None, advanced_warning: bool = True
@@ -492,7 +821,10 @@ class Mesh:
             cases (up to 100,000 elements) this check can be left activated.
         """
 
-        pos = _get_nodal_coordinates(self.nodes)
+        self._check_no_mesh_instances("wrapped around a cylinder")
+
+        nodal_arrays = self.get_nodal_arrays()
+        pos = nodal_arrays.coordinates.copy()
         quaternions = _np.zeros([len(self.nodes), 4])
 
         # The x coordinate is the radius, the y coordinate the arc length.
@@ -509,31 +841,37 @@ class Mesh:
                     #
                     # To be exactly sure, we could check the rotations here,
                     # i.e. if they are also in plane.
-                    element_warning = []
-                    for i_element, element in enumerate(self.elements):
-                        element_coordinates = _np.zeros([len(element.nodes), 3])
-                        for i_node, node in enumerate(element.nodes):
-                            element_coordinates[i_node, :] = node.coordinates
-                        is_yz = (
-                            _np.max(
-                                _np.abs(
-                                    element_coordinates[:, 0]
-                                    - element_coordinates[0, 0]
+                    adjacency = self.get_node_element_adjacency()
+                    element_node_indices = adjacency.element_node_indices
+                    element_coordinates = pos[element_node_indices]
+                    is_missing = element_node_indices < 0
+                    if _np.any(is_missing):
+                        # Element nodes that are not in the mesh.
+                        element_coordinates[is_missing] = _get_nodal_coordinates(
+                            list(
+                                _itertools.compress(
+                                    _itertools.chain(
+                                        *(element.nodes for element in self.elements)
+                                    ),
+                                    is_missing,
                                 )
                             )
-                            < _bme.eps_pos
                         )
-                        is_xz = (
-                            _np.max(
-                                _np.abs(
-                                    element_coordinates[:, 1]
-                                    - element_coordinates[0, 1]
-                                )
-                            )
-                            < _bme.eps_pos
+                    element_starts = adjacency.element_offsets[:-1]
+                    n_nodes_per_element = _np.diff(adjacency.element_offsets)
+                    coordinate_difference = _np.abs(
+                        element_coordinates[:, :2]
+                        - _np.repeat(
+                            element_coordinates[element_starts, :2],
+                            n_nodes_per_element,
+                            axis=0,
                         )
-                        if not (is_yz or is_xz):
-                            element_warning.append(i_element)
+                    )
+                    max_difference = _np.maximum.reduceat(
+                        coordinate_difference, element_starts, axis=0
+                    )
+                    is_in_plane = _np.any(max_difference < _bme.eps_pos, axis=1)
+                    element_warning = _np.flatnonzero(~is_in_plane)
                     if len(element_warning) != 0:
                         _warnings.warn(
                             "There are elements which are not "
@@ -579,8 +917,7 @@ class Mesh:
         self.rotate(quaternions, only_rotate_triads=True)
 
         # Set the new position for the nodes.
-        for i, node in enumerate(self.nodes):
-            node.coordinates = pos[i, :]
+        nodal_arrays.coordinates[:] = pos
 
     def couple_nodes(
         self,
@@ -589,6 +926,8 @@ class Mesh:
         reuse_matching_nodes=False,
         coupling_type=_bme.bc.point_coupling,
         coupling_dof_type=_bme.coupling_dof.fix,
+        incremental=False,
+        periods=None,
     ):
         """Search through nodes and connect all nodes with the same
         coordinates.
@@ -610,6 +949,21 @@ class Mesh:
                 nodes together.
             bme.coupling_dof.joint: Fix all positional DOFs of the nodes
                 together.
+        incremental: bool
+            If this is true, only the nodes that were added to the mesh since
+            the last incremental call are checked for coupling. The already
+            processed end nodes are stored in a persistent search structure
+            and existing couplings are extended if new partners are found,
+            i.e., the final couplings are the same as for a single call with
+            all nodes. Between incremental calls, nodes can only be appended
+            to the mesh and the processed nodes must not be moved.
+        periods: list(float)
+            Period of each spatial dimension, i.e., the edge lengths of a
+            periodic box, see `find_close_points`. If this is given, nodes
+            with the same coordinates modulo the periodic box are coupled,
+            e.g., to create periodic couplings for representative volume
+            elements. This can not be combined with reusing matching nodes
+            or an incremental coupling.
         """
 
         # Check that a coupling BC is given.
@@ -621,100 +975,131 @@ class Mesh:
                 "Only coupling conditions can be applied in 'couple_nodes'!"
             )
 
+        if periods is not None and (reuse_matching_nodes or incremental):
+            raise ValueError(
+                "Periodic couplings can not be combined with reusing matching "
+                "nodes or an incremental coupling!"
+            )
+
+        if incremental:
+            if nodes is not None or reuse_matching_nodes:
+                raise ValueError(
+                    "Incremental coupling is only possible for all nodes of the "
+                    "mesh and without reusing matching nodes!"
+                )
+            self._check_no_mesh_instances("coupled")
+            if self._incremental_coupling is None:
+                self._incremental_coupling = _IncrementalCoupling(
+                    coupling_type, coupling_dof_type
+                )
+            elif (
+                self._incremental_coupling.coupling_type != coupling_type
+                or self._incremental_coupling.coupling_dof_type != coupling_dof_type
+            ):
+                raise ValueError(
+                    "The coupling type of an incremental coupling can not be changed!"
+                )
+            self._incremental_coupling.couple_new_nodes(self)
+            return
+
         # Get the nodes that should be checked for coupling. Middle nodes are
         # not checked, as coupling can only be applied to the boundary nodes.
         if nodes is None:
+            self._check_no_mesh_instances("coupled")
             node_list = self.nodes
         else:
             node_list = nodes
         node_list = _filter_nodes(node_list, middle_nodes=False)
-        partner_nodes = _find_close_nodes(node_list)
+        partner_nodes = _find_close_nodes(node_list, periods=periods)
         if len(partner_nodes) == 0:
             # If no partner nodes were found, end this function.
             return
 
         if reuse_matching_nodes:
             # Check if there are nodes with the same rotation. If there are the
-            # nodes are reused, and no coupling is inserted.
-
-            # Set the links to all nodes in the mesh. In this case we have to use
-            # "all_nodes" since we also have to replace nodes that are in existing
-            # GeometrySetNodes.
-            self.unlink_nodes()
-            self.get_unique_geometry_sets(link_to_nodes="explicitly_contained_nodes")
-            self.set_node_links()
-
-            # Go through partner nodes.
-            for node_list in partner_nodes:
-                # Get array with rotation vectors.
-                rotation_vectors = _np.zeros([len(node_list), 3])
-                for i, node in enumerate(node_list):
-                    if isinstance(node, _NodeCosserat):
-                        rotation_vectors[i, :] = node.rotation.get_rotation_vector()
-                    else:
-                        # For the case of nodes that belong to solid elements,
-                        # we define the following default value:
-                        rotation_vectors[i, :] = [4 * _np.pi, 0, 0]
-
-                # Use find close points function to find nodes with the
-                # same rotation.
-                partners, n_partners = _find_close_points(
-                    rotation_vectors, tol=_bme.eps_quaternion
+            # nodes are reused, and no coupling is inserted. The rotations of
+            # the nodes of all position groups are compared in a single
+            # segmented search, i.e., only nodes within the same group are
+            # matched.
+            group_sizes = [len(group) for group in partner_nodes]
+            candidate_nodes = list(_itertools.chain(*partner_nodes))
+            group_offsets = _np.concatenate(([0], _np.cumsum(group_sizes)))
+
+            # For the case of nodes that belong to solid elements, the dummy
+            # quaternion results in the rotation vector [4 * pi, 0, 0].
+            is_cosserat = _np.fromiter(
+                (isinstance(node, _NodeCosserat) for node in candidate_nodes),
+                dtype=bool,
+                count=len(candidate_nodes),
+            )
+            rotation_vectors = _np.zeros((len(candidate_nodes), 3))
+            rotation_vectors[:, 0] = 4 * _np.pi
+            rotation_vectors[is_cosserat] = _get_rotation_vectors(
+                _get_nodal_quaternions(
+                    list(_itertools.compress(candidate_nodes, is_cosserat))
                 )
+            )
+            partners, n_partners = _find_close_points_segmented(
+                rotation_vectors, group_offsets, tol=_bme.eps_quaternion
+            )
 
-                # Check if nodes with the same rotations were found.
-                if n_partners == 0:
-                    self.add(
-                        _coupling_factory(node_list, coupling_type, coupling_dof_type)
+            # The first node of each set of nodes with the same rotation will
+            # remain, the other ones will be replaced with this one.
+            has_partner = partners != -1
+            group_ids = _np.repeat(_np.arange(len(partner_nodes)), group_sizes)
+            partners[has_partner] += (_np.cumsum(n_partners) - n_partners)[
+                group_ids[has_partner]
+            ]
+            _, first_indices, inverse = _np.unique(
+                partners[has_partner], return_index=True, return_inverse=True
+            )
+            master_indices = _np.arange(len(candidate_nodes))
+            master_indices[has_partner] = _np.flatnonzero(has_partner)[
+                first_indices[inverse]
+            ]
+            is_master = master_indices == _np.arange(len(candidate_nodes))
+
+            # Couple the remaining nodes of each group.
+            for i_start, i_end in zip(group_offsets[:-1], group_offsets[1:]):
+                coupling_nodes = list(
+                    _itertools.compress(
+                        candidate_nodes[i_start:i_end], is_master[i_start:i_end]
                     )
-                else:
-                    # There are nodes that need to be combined.
-                    combining_nodes = []
-                    coupling_nodes = []
-                    found_partner_id = [None for _i in range(n_partners)]
-
-                    # Add the nodes that need to be combined and add the nodes
-                    # that will be coupled.
-                    for i, partner in enumerate(partners):
-                        if partner == -1:
-                            # This node does not have a partner with the same
-                            # rotation.
-                            coupling_nodes.append(node_list[i])
-
-                        elif found_partner_id[partner] is not None:
-                            # This node has already a processed partner, add
-                            # this one to the combining nodes.
-                            combining_nodes[found_partner_id[partner]].append(
-                                node_list[i]
-                            )
-
-                        else:
-                            # This is the first node of a partner set that was
-                            # found. This one will remain, the other ones will
-                            # be replaced with this one.
-                            new_index = len(combining_nodes)
-                            found_partner_id[partner] = new_index
-                            combining_nodes.append([node_list[i]])
-                            coupling_nodes.append(node_list[i])
-
-                    # Add the coupling nodes.
-                    if len(coupling_nodes) > 1:
-                        self.add(
-                            _coupling_factory(
-                                coupling_nodes, coupling_type, coupling_dof_type
-                            )
+                )
+                if len(coupling_nodes) > 1:
+                    self.add(
+                        _coupling_factory(
+                            coupling_nodes, coupling_type, coupling_dof_type
                         )
+                    )
 
-                    # Replace the identical nodes.
-                    for combine_list in combining_nodes:
-                        master_node = combine_list[0]
-                        for node in combine_list[1:]:
-                            node.replace_with(master_node)
+            # Replace the identical nodes at once.
+            replaced_indices = _np.flatnonzero(~is_master)
+            replaced_indices = replaced_indices[
+                _np.argsort(master_indices[replaced_indices], kind="stable")
+            ]
+            self.replace_nodes(
+                {
+                    candidate_nodes[i_node]: candidate_nodes[i_master]
+                    for i_node, i_master in zip(
+                        replaced_indices.tolist(),
+                        master_indices[replaced_indices].tolist(),
+                    )
+                }
+            )
 
         else:
-            # Connect close nodes with a coupling.
+            # Connect close nodes with a coupling. Periodically coupled nodes
+            # are not at the same position.
             for node_list in partner_nodes:
-                self.add(_coupling_factory(node_list, coupling_type, coupling_dof_type))
+                self.add(
+                    _coupling_factory(
+                        node_list,
+                        coupling_type,
+                        coupling_dof_type,
+                        check_overlapping_nodes=periods is None,
+                    )
+                )
 
     def unlink_nodes(self):
         """Delete the linked arrays and global indices in all nodes."""
@@ -730,45 +1115,236 @@ class Mesh:
         directions."""
         return _get_min_max_nodes(self.nodes, *args, **kwargs)
 
-    def check_overlapping_elements(self, raise_error=True):
+    def get_node_spatial_index(self) -> _NodeSpatialIndex:
+        """Return the spatial index of the nodes in this mesh.
+
+        The index is created on the first call and reused as long as the
+        nodes of the mesh are not changed or transformed.
+
+        Returns:
+            The spatial index of the nodes.
+        """
+        nodal_arrays = self.get_nodal_arrays()
+        if self._node_spatial_index is None or not self._node_spatial_index.is_valid(
+            nodal_arrays
+        ):
+            self._node_spatial_index = _NodeSpatialIndex(nodal_arrays)
+        return self._node_spatial_index
+
+    def _get_node_set(self, node_indices: _NDArray) -> _GeometrySetNodes:
+        """Return a point set with the nodes at the given indices."""
+        return _GeometrySetNodes(
+            _bme.geo.point, [self.nodes[i_node] for i_node in node_indices]
+        )
+
+    def nodes_in_box(
+        self,
+        min_coordinates,
+        max_coordinates,
+        *,
+        tol: float = _bme.eps_pos,
+        middle_nodes: bool = False,
+    ) -> _GeometrySetNodes:
+        """Return a point set with all nodes in an axis aligned box.
+
+        Args:
+            min_coordinates: Minimal coordinates of the box.
+            max_coordinates: Maximal coordinates of the box.
+            tol: Tolerance for the bounds of the box.
+            middle_nodes: If this is true, middle nodes of a beam are also
+                returned.
+
+        Returns:
+            A point set with the found nodes in the order of the node list.
+        """
+        return self._get_node_set(
+            self.get_node_spatial_index().nodes_in_box(
+                min_coordinates, max_coordinates, tol=tol, middle_nodes=middle_nodes
+            )
+        )
+
+    def nodes_in_sphere(
+        self,
+        center,
+        radius: float,
+        *,
+        tol: float = _bme.eps_pos,
+        middle_nodes: bool = False,
+    ) -> _GeometrySetNodes:
+        """Return a point set with all nodes in a sphere.
+
+        Args:
+            center: Center of the sphere.
+            radius: Radius of the sphere.
+            tol: Tolerance for the radius of the sphere.
+            middle_nodes: If this is true, middle nodes of a beam are also
+                returned.
+
+        Returns:
+            A point set with the found nodes in the order of the node list.
+        """
+        return self._get_node_set(
+            self.get_node_spatial_index().nodes_in_sphere(
+                center, radius, tol=tol, middle_nodes=middle_nodes
+            )
+        )
+
+    def nodes_on_plane(
+        self,
+        normal,
+        point,
+        tol: float = _bme.eps_pos,
+        *,
+        middle_nodes: bool = False,
+    ) -> _GeometrySetNodes:
+        """Return a point set with all nodes on a plane.
+
+        Args:
+            normal: Normal vector of the plane.
+            point: Point on the plane.
+            tol: Maximal distance of the nodes to the plane.
+            middle_nodes: If this is true, middle nodes of a beam are also
+                returned.
+
+        Returns:
+            A point set with the found nodes in the order of the node list.
+        """
+        return self._get_node_set(
+            self.get_node_spatial_index().nodes_on_plane(
+                normal, point, tol=tol, middle_nodes=middle_nodes
+            )
+        )
+
+    def nodes_on_cylinder(
+        self,
+        axis,
+        point,
+        radius: float,
+        tol: float = _bme.eps_pos,
+        *,
+        middle_nodes: bool = False,
+    ) -> _GeometrySetNodes:
+        """Return a point set with all nodes on the surface of an infinite
+        cylinder.
+
+        Args:
+            axis: Direction of the cylinder axis.
+            point: Point on the cylinder axis.
+            radius: Radius of the cylinder.
+            tol: Maximal distance of the nodes to the cylinder surface.
+            middle_nodes: If this is true, middle nodes of a beam are also
+                returned.
+
+        Returns:
+            A point set with the found nodes in the order of the node list.
+        """
+        return self._get_node_set(
+            self.get_node_spatial_index().nodes_on_cylinder(
+                axis, point, radius, tol=tol, middle_nodes=middle_nodes
+            )
+        )
+
+    def check_overlapping_elements(self, raise_error=True) -> _NDArray:
         """Check if there are overlapping elements in the mesh.
 
         This is done by checking if all middle nodes of beam elements
         have unique coordinates in the mesh.
+
+        Args:
+            raise_error: If an error or only a warning should be raised if
+                overlapping elements are found.
+
+        Returns:
+            Array with the sorted index pairs of the overlapping elements
+            (n_pairs x 2).
         """
 
-        # Number of middle nodes.
-        middle_nodes = [node for node in self.nodes if node.is_middle_node]
+        overlapping_element_pairs = _np.zeros((0, 2), dtype=int)
 
-        # Only check if there are middle nodes.
-        if len(middle_nodes) == 0:
-            return
+        # Get the indices of the middle nodes.
+        middle_node_indices = _np.flatnonzero(
+            _np.fromiter(
+                map(_attrgetter("is_middle_node"), self.nodes),
+                dtype=bool,
+                count=len(self.nodes),
+            )
+        )
 
-        # Get array with middle nodes.
-        coordinates = _np.zeros([len(middle_nodes), 3])
-        for i, node in enumerate(middle_nodes):
-            coordinates[i, :] = node.coordinates
+        # Only check if there are middle nodes.
+        if len(middle_node_indices) == 0:
+            return overlapping_element_pairs
 
         # Check if there are double entries in the coordinates.
-        has_partner, partner = _find_close_points(coordinates)
-        partner_indices = _point_partners_to_partner_indices(has_partner, partner)
-        if partner > 0:
-            if raise_error:
-                raise ValueError(
-                    "There are multiple middle nodes with the "
-                    "same coordinates. Per default this raises an error! "
-                    "This check can be turned of with "
-                    "bme.check_overlapping_elements=False"
-                )
-            else:
-                _warnings.warn(
-                    "There are multiple middle nodes with the same coordinates!"
-                )
+        has_partner, partner = _find_close_points(
+            self.get_nodal_arrays().coordinates[middle_node_indices]
+        )
+        if partner == 0:
+            return overlapping_element_pairs
 
-            # Add the partner index to the middle nodes.
-            for i_partner, partners in enumerate(partner_indices):
-                for i_node in partners:
-                    middle_nodes[i_node].element_partner_index = i_partner
+        if raise_error:
+            raise ValueError(
+                "There are multiple middle nodes with the "
+                "same coordinates. Per default this raises an error! "
+                "This check can be turned of with "
+                "bme.check_overlapping_elements=False"
+            )
+        else:
+            _warnings.warn("There are multiple middle nodes with the same coordinates!")
+
+        # Sort the overlapping middle nodes by their cluster label.
+        has_partner = _np.asarray(has_partner)
+        is_overlapping = has_partner != -1
+        labels = has_partner[is_overlapping]
+        order = _np.argsort(labels, kind="stable")
+        labels = labels[order]
+        overlapping_node_indices = middle_node_indices[is_overlapping][order]
+
+        # Add the partner index to the middle nodes.
+        for i_node, i_partner in zip(
+            overlapping_node_indices.tolist(), labels.tolist()
+        ):
+            self.nodes[i_node].element_partner_index = i_partner
+
+        # Get the element of each overlapping middle node. A middle node
+        # belongs to exactly one element, so we only have to look up the
+        # nodes of the elements in a map of the overlapping nodes.
+        overlapping_node_map = {
+            self.nodes[i_node]: i
+            for i, i_node in enumerate(overlapping_node_indices.tolist())
+        }
+        element_nodes = list(map(_attrgetter("nodes"), self.elements))
+        n_element_nodes = sum(map(len, element_nodes))
+        element_node_positions = _np.fromiter(
+            map(
+                overlapping_node_map.get,
+                _itertools.chain(*element_nodes),
+                _itertools.repeat(-1),
+            ),
+            dtype=int,
+            count=n_element_nodes,
+        )
+        is_overlapping_node = element_node_positions != -1
+        element_indices = _np.empty(len(overlapping_node_indices), dtype=int)
+        element_indices[element_node_positions[is_overlapping_node]] = _np.repeat(
+            _np.arange(len(element_nodes)), list(map(len, element_nodes))
+        )[is_overlapping_node]
+
+        # Create all pairs within each cluster, i.e., each node is paired with
+        # all following nodes in its cluster.
+        cluster_starts = _np.flatnonzero(
+            _np.concatenate(([True], labels[1:] != labels[:-1]))
+        )
+        cluster_sizes = _np.diff(_np.append(cluster_starts, len(labels)))
+        cluster_ends = _np.repeat(cluster_starts + cluster_sizes, cluster_sizes)
+        n_following = cluster_ends - _np.arange(len(labels)) - 1
+        first = _np.repeat(_np.arange(len(labels)), n_following)
+        pair_offsets = _np.repeat(_np.cumsum(n_following) - n_following, n_following)
+        second = first + 1 + _np.arange(len(first)) - pair_offsets
+        overlapping_element_pairs = _np.sort(
+            _np.stack((element_indices[first], element_indices[second]), axis=1),
+            axis=1,
+        )
+        return _np.unique(overlapping_element_pairs, axis=0).reshape(-1, 2)
 
     def get_vtk_representation(
         self, *, overlapping_elements=True, coupling_sets=False, **kwargs
@@ -784,6 +1360,15 @@ class Mesh:
             If coupling sets should also be displayed.
         """
 
+        # Expand the mesh instances, so they can be represented.
+        mesh = self.get_expanded_mesh()
+        if mesh is not self:
+            return mesh.get_vtk_representation(
+                overlapping_elements=overlapping_elements,
+                coupling_sets=coupling_sets,
+                **kwargs,
+            )
+
         # Object to store VKT data (and write it to file)
         vtk_writer_beam = _VTKWriter()
         vtk_writer_solid = _VTKWriter()
@@ -1007,5 +1592,89 @@ class Mesh:
         """Return a deep copy of this mesh.
 
         The functions and materials will not be deep copied.
+
+        Instead of a generic deep copy of all nodes and elements, the
+        nodal data is copied in bulk from the nodal arrays and the element
+        connectivity is rebuilt from the node indices. The links of the
+        nodes to elements, sets and the mesh are not copied, they are
+        recreated when they are needed. All other items are deep copied
+        with the already copied nodes and elements.
         """
-        return _copy.deepcopy(self)
+
+        # The materials and functions are shared between the meshes.
+        memo = {id(item): item for item in self.materials + self.functions}
+
+        # Copy the nodes and bind them to copies of the nodal arrays.
+        nodal_arrays = self.get_nodal_arrays()
+        replaced_node_attributes = [
+            {
+                "coordinates": coordinates,
+                "element_link": None,
+                "node_sets_link": None,
+                "mesh": None,
+            }
+            for coordinates in nodal_arrays.coordinates.copy()
+        ]
+        for attributes, quaternion in zip(
+            _itertools.compress(replaced_node_attributes, nodal_arrays.is_cosserat),
+            nodal_arrays.quaternions[nodal_arrays.is_cosserat],
+        ):
+            rotation = _Rotation.__new__(_Rotation)
+            rotation.q = quaternion
+            attributes["rotation"] = rotation
+        deep_copy_items = []
+        new_nodes = _copy_mesh_items(
+            self.nodes,
+            {"coordinates", "rotation", "element_link", "node_sets_link", "mesh"},
+            replaced_node_attributes,
+            deep_copy_items,
+        )
+        memo.update(zip(map(id, self.nodes), new_nodes))
+
+        # Copy the elements and rebuild the connectivity from the node indices.
+        element_nodes = list(map(_attrgetter("nodes"), self.elements))
+        node_indices = list(
+            map(self._get_node_index_map().get, _itertools.chain(*element_nodes))
+        )
+        if None in node_indices:
+            # Some elements have nodes which are not in this mesh.
+            new_element_nodes = [_copy.deepcopy(nodes, memo) for nodes in element_nodes]
+        else:
+            new_element_node_list = list(map(new_nodes.__getitem__, node_indices))
+            offsets = [0, *_itertools.accumulate(map(len, element_nodes))]
+            new_element_nodes = [
+                new_element_node_list[start:end]
+                for start, end in zip(offsets[:-1], offsets[1:])
+            ]
+        new_elements = _copy_mesh_items(
+            self.elements,
+            {"nodes", "material", "vtk_cell_data"},
+            (
+                {
+                    "nodes": nodes,
+                    "material": element.material,
+                    "vtk_cell_data": (
+                        _copy.deepcopy(element.vtk_cell_data, memo)
+                        if element.vtk_cell_data
+                        else {}
+                    ),
+                }
+                for element, nodes in zip(self.elements, new_element_nodes)
+            ),
+            deep_copy_items,
+        )
+        memo.update(zip(map(id, self.elements), new_elements))
+
+        # Deep copy the remaining attributes of the nodes and elements. This
+        # has to be done after all nodes and elements are created, since the
+        # attributes can reference other nodes and elements.
+        for item, new_item, names in deep_copy_items:
+            for name in names:
+                setattr(new_item, name, _copy.deepcopy(getattr(item, name), memo))
+
+        # Deep copy the mesh with the already copied items.
+        memo[id(self.nodes)] = new_nodes
+        memo[id(self.elements)] = new_elements
+        memo[id(self._nodal_arrays)] = None
+        memo[id(self._node_index_map)] = None
+        return _copy.deepcopy(self, memo)
@@ -0,0 +1,196 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018-2025 BeamMe Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""This module implements a class that represents rigidly transformed
+instances of a mesh."""
+
+from typing import List as _List
+
+import numpy as _np
+import quaternion as _quaternion
+from numpy.typing import NDArray as _NDArray
+
+from beamme.core.rotation import Rotation as _Rotation
+from beamme.core.rotation import RotationArray as _RotationArray
+from beamme.core.rotation import add_rotations as _add_rotations
+from beamme.core.rotation import rotate_coordinates as _rotate_coordinates
+
+
+class MeshInstance:
+    """Instances of a base mesh with rigid body transformations.
+
+    Each instance represents the base mesh, where all nodal positions x
+    and all nodal rotations R_node are transformed with the rigid body
+    transformation of the instance, i.e.,
+        x_instance = R * x + t,
+        R_node_instance = R * R_node.
+
+    The instances do not contain any concrete nodes and elements, they
+    only reference the base mesh. Therefore, changes of the base mesh are
+    visible in all instances. The instances are expanded to concrete
+    nodes and elements when the mesh they are added to is added to an
+    input file or a VTK representation of it is created.
+
+    Only the transformations of the instances are cheap. The expansion
+    creates a full copy of the base mesh for each instance, see
+    `get_meshes`.
+    """
+
+    def __init__(
+        self,
+        mesh,
+        *,
+        rotations: _Rotation
+        | _List[_Rotation]
+        | _RotationArray
+        | _NDArray[_quaternion.quaternion]
+        | _NDArray
+        | None = None,
+        translations: _NDArray | None = None,
+    ):
+        """Initialize the mesh instances.
+
+        If only the rotations or only the translations are given for
+        multiple instances, the other one is used for all instances.
+
+        Args:
+            mesh: The base mesh.
+            rotations: The rotation(s) of the instances. This can be a single
+                rotation, a list of rotations, a rotation array or an array
+                with a quaternion for each instance (either as
+                numpy-quaternion array or as float array with 4 entries per
+                quaternion). Defaults to no rotation.
+            translations: The translation vector(s) of the instances. This
+                can be a single vector or an array with a vector for each
+                instance. Defaults to no translation.
+        """
+
+        self.mesh = mesh
+
+        if rotations is None:
+            quaternions = _np.array([[1.0, 0.0, 0.0, 0.0]])
+        elif isinstance(rotations, _Rotation):
+            quaternions = _np.array([rotations.get_quaternion()])
+        elif isinstance(rotations, _RotationArray):
+            quaternions = rotations.get_quaternion()
+        elif (
+            isinstance(rotations, _np.ndarray)
+            and rotations.dtype == _quaternion.quaternion
+        ):
+            quaternions = _quaternion.as_float_array(rotations).reshape(-1, 4)
+        elif len(rotations) > 0 and isinstance(rotations[0], _Rotation):
+            quaternions = _np.array(
+                [rotation.get_quaternion() for rotation in rotations]
+            )
+        else:
+            quaternions = _np.array(rotations, dtype=float).reshape(-1, 4)
+
+        if translations is None:
+            translations = _np.zeros([1, 3])
+        else:
+            translations = _np.array(translations, dtype=float).reshape(-1, 3)
+
+        n_instances = max(len(quaternions), len(translations))
+        for name, array in (("rotations", quaternions), ("translations", translations)):
+            if len(array) not in (1, n_instances):
+                raise ValueError(
+                    f"Got {len(array)} {name}, expected 1 or {n_instances}!"
+                )
+
+        self.quaternions = _np.repeat(
+            quaternions, n_instances // len(quaternions), axis=0
+        )
+        self.translations = _np.repeat(
+            translations, n_instances // len(translations), axis=0
+        )
+
+    def __len__(self) -> int:
+        """Return the number of instances."""
+        return len(self.quaternions)
+
+    def __deepcopy__(self, memo):
+        """The base mesh is referenced by the instances, so a copy of the
+        instances references the same base mesh."""
+        return MeshInstance(
+            self.mesh,
+            rotations=self.quaternions.copy(),
+            translations=self.translations.copy(),
+        )
+
+    def translate(self, vector) -> None:
+        """Translate all instances.
+
+        Args:
+            vector: 3D vector that will be added to the translations.
+        """
+        self.translations += vector
+
+    def rotate(self, rotation: _Rotation, origin=None) -> None:
+        """Rotate all instances.
+
+        Args:
+            rotation: The rotation that will be applied to the instances.
+            origin (3D vector): If this is given, the instances are rotated
+                about this point. Defaults to (0, 0, 0).
+        """
+        self.quaternions = _add_rotations(rotation, self.quaternions)
+        self.translations = _rotate_coordinates(
+            self.translations, rotation, origin=origin
+        )
+
+    def get_meshes(self) -> list:
+        """Expand the instances to meshes with concrete nodes and elements.
+
+        The nodal positions and rotations of all instances are calculated
+        at once and then assigned to copies of the base mesh. The topology
+        is not shared between the returned meshes, i.e., the cost of the
+        expansion is the same as calling `Mesh.copy` on the base mesh for
+        each instance.
+
+        Returns:
+            A list with a mesh for each instance.
+        """
+
+        base_mesh = self.mesh.get_expanded_mesh()
+        nodal_arrays = base_mesh.get_nodal_arrays()
+        n_instances = len(self)
+        n_nodes = len(base_mesh.nodes)
+
+        # Transform the nodal data for all instances.
+        instance_quaternions = _np.repeat(self.quaternions, n_nodes, axis=0)
+        coordinates = _rotate_coordinates(
+            _np.tile(nodal_arrays.coordinates, (n_instances, 1)),
+            instance_quaternions,
+        ) + _np.repeat(self.translations, n_nodes, axis=0)
+        quaternions = _add_rotations(
+            instance_quaternions, _np.tile(nodal_arrays.quaternions, (n_instances, 1))
+        )
+        coordinates = coordinates.reshape(n_instances, n_nodes, 3)
+        quaternions = quaternions.reshape(n_instances, n_nodes, 4)
+
+        meshes = []
+        for instance_coordinates, instance_quaternions in zip(coordinates, quaternions):
+            mesh = base_mesh.copy()
+            mesh_nodal_arrays = mesh.get_nodal_arrays()
+            mesh_nodal_arrays.coordinates[:] = instance_coordinates
+            mesh_nodal_arrays.set_quaternions(instance_quaternions)
+            meshes.append(mesh)
+        return meshes
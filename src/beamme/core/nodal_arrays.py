@@ -0,0 +1,145 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018-2025 BeamMe Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""This module implements contiguous arrays that store the nodal data of a
+mesh."""
+
+from operator import attrgetter as _attrgetter
+from operator import is_ as _is
+
+import numpy as _np
+from numpy.typing import NDArray as _NDArray
+
+from beamme.core.node import Node as _Node
+from beamme.core.node import NodeCosserat as _NodeCosserat
+
+
+class NodalArrays:
+    """Contiguous coordinate and quaternion arrays for a list of nodes.
+
+    After creation, the nodes are bound to the arrays, i.e., the
+    coordinates of each node and the quaternion of each Cosserat node are
+    views into one row of the arrays. Modifications of the arrays are
+    therefore directly visible in the nodes, which allows to apply
+    transformations on all nodes with single NumPy operations.
+
+    If a node is rebound to different data (e.g., by assigning a new
+    coordinate array or a new rotation to it), the arrays are no longer
+    valid for the given nodes. This is detected by `is_valid` and the
+    arrays have to be recreated.
+    """
+
+    def __init__(self, nodes: list[_Node]):
+        """Create the arrays and bind the nodes to them.
+
+        Args:
+            nodes: List of nodes to be stored in the arrays.
+        """
+
+        self.nodes = list(nodes)
+        n_nodes = len(self.nodes)
+
+        self.coordinates = _np.array(
+            [node.coordinates for node in self.nodes], dtype=float
+        ).reshape(n_nodes, 3)
+        self.is_cosserat = _np.array(
+            [isinstance(node, _NodeCosserat) for node in self.nodes], dtype=bool
+        )
+
+        # For nodes which don't contain a rotation, we store the dummy
+        # quaternion (2, 0, 0, 0), analogous to get_nodal_quaternions.
+        self.quaternions = _np.zeros([n_nodes, 4])
+        self.quaternions[:, 0] = 2.0
+        self._cosserat_nodes = [
+            node
+            for node, is_cosserat in zip(self.nodes, self.is_cosserat)
+            if is_cosserat
+        ]
+        if len(self._cosserat_nodes) > 0:
+            self.quaternions[self.is_cosserat] = [
+                node.rotation.q for node in self._cosserat_nodes
+            ]
+
+        # Bind the nodes to the rows of the arrays. We keep the views, so we
+        # can check if the nodes are still bound to these arrays.
+        self._coordinate_views = list(self.coordinates)
+        quaternion_views = list(self.quaternions)
+        self._quaternion_views = [
+            quaternion_views[i_node] for i_node in _np.flatnonzero(self.is_cosserat)
+        ]
+        for node, coordinates in zip(self.nodes, self._coordinate_views):
+            node.coordinates = coordinates
+        for node, quaternion in zip(self._cosserat_nodes, self._quaternion_views):
+            node.rotation.q = quaternion
+
+    def is_valid(self, nodes: list[_Node]) -> bool:
+        """Check if the arrays represent the given nodes.
+
+        This is the case if the nodes are the same (and in the same order)
+        as the ones used to create the arrays and if all nodes are still
+        bound to the arrays. The checks only compare object identities and
+        are performed in C loops, so they are cheap compared to gathering
+        the nodal data.
+
+        Args:
+            nodes: List of nodes that should be represented by the arrays.
+
+        Returns:
+            True if the arrays can be used for the given nodes.
+        """
+
+        return (
+            len(nodes) == len(self.nodes)
+            and all(map(_is, nodes, self.nodes))
+            and all(
+                map(
+                    _is,
+                    map(_attrgetter("coordinates"), self.nodes),
+                    self._coordinate_views,
+                )
+            )
+            and all(
+                map(
+                    _is,
+                    map(_attrgetter("rotation.q"), self._cosserat_nodes),
+                    self._quaternion_views,
+                )
+            )
+        )
+
+    def set_quaternions(self, quaternions: _NDArray) -> None:
+        """Set the quaternions of all Cosserat nodes.
+
+        Args:
+            quaternions: Array with a quaternion for each node. The rows
+                for nodes without a rotation are ignored.
+        """
+        self.quaternions[self.is_cosserat] = quaternions[self.is_cosserat]
+
+    def __deepcopy__(self, memo):
+        """The arrays only represent the nodal data of the nodes they were
+        created with.
+
+        A deep copy of the nodes is not bound to copied arrays,
+        therefore, no copy is created and the arrays have to be recreated
+        for the copied nodes.
+        """
+        return None
@@ -30,6 +30,17 @@ from beamme.core.rotation import Rotation as _Rotation
 class Node(_BaseMeshItem):
     """This object represents one node in the mesh."""
 
+    __slots__ = (
+        "coordinates",
+        "is_end_node",
+        "is_middle_node",
+        "element_link",
+        "node_sets_link",
+        "element_partner_index",
+        "mesh",
+        "master_node",
+    )
+
     def __init__(self, coordinates, *, is_middle_node=False, **kwargs):
         super().__init__(**kwargs)
 
@@ -43,9 +54,10 @@ class Node(_BaseMeshItem):
         # If the node is in the middle of a beam element.
         self.is_middle_node = is_middle_node
 
-        # Lists with the objects that this node is linked to.
-        self.element_link = []
-        self.node_sets_link = []
+        # Lists with the objects that this node is linked to. The lists are
+        # only created once a link is added.
+        self.element_link = None
+        self.node_sets_link = None
         self.element_partner_index = None
         self.mesh = None
 
@@ -75,9 +87,9 @@ class Node(_BaseMeshItem):
 
         # Replace the links to this node in the referenced objects.
         self.mesh.replace_node(self, master_node)
-        for element in self.element_link:
+        for element in self.element_link or []:
             element.replace_node(self, master_node)
-        for node_set in self.node_sets_link:
+        for node_set in self.node_sets_link or []:
             node_set.replace_node(self, master_node)
 
         # Set link to master node.
@@ -85,8 +97,8 @@ class Node(_BaseMeshItem):
 
     def unlink(self):
         """Reset the links to elements, node sets and global indices."""
-        self.element_link = []
-        self.node_sets_link = []
+        self.element_link = None
+        self.node_sets_link = None
         self.mesh = None
         self.i_global = None
 
@@ -108,6 +120,8 @@ class NodeCosserat(Node):
     """This object represents a Cosserat node in the mesh, i.e., it contains
     three positions and three rotations."""
 
+    __slots__ = ("rotation", "arc_length")
+
     def __init__(
         self,
         coordinates,
@@ -147,6 +161,8 @@ class NodeCosserat(Node):
 class ControlPoint(Node):
     """This object represents a control point with a weight in the mesh."""
 
+    __slots__ = ("weight",)
+
     def __init__(self, coordinates, weight, **kwargs):
         super().__init__(coordinates, **kwargs)
 
@@ -0,0 +1,167 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018-2025 BeamMe Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""This module implements the adjacency between the nodes and elements of a
+mesh in compressed sparse row (CSR) format."""
+
+from itertools import chain as _chain
+from itertools import repeat as _repeat
+from operator import attrgetter as _attrgetter
+from operator import is_ as _is
+
+import numpy as _np
+from numpy.typing import NDArray as _NDArray
+
+from beamme.core.element import Element as _Element
+from beamme.core.node import Node as _Node
+
+
+class NodeElementAdjacency:
+    """The connectivity between nodes and elements of a mesh.
+
+    The connectivity is stored in two CSR structures:
+    - `element_offsets` and `element_node_indices`: The indices of the
+      nodes of element i are
+      `element_node_indices[element_offsets[i]:element_offsets[i + 1]]`.
+      Nodes that are not in the node list are marked with -1.
+    - `node_offsets` and `node_element_indices`: The transposed structure,
+      i.e., the indices of the elements connected to node i are
+      `node_element_indices[node_offsets[i]:node_offsets[i + 1]]`.
+
+    The adjacency is only valid as long as the nodes and elements (and the
+    nodes of the elements) do not change. This is checked by `is_valid`.
+    """
+
+    def __init__(
+        self,
+        nodes: list[_Node],
+        elements: list[_Element],
+        node_index_map: dict[_Node, int],
+    ):
+        """Create the adjacency.
+
+        Args:
+            nodes: List of nodes.
+            elements: List of elements.
+            node_index_map: Map from the nodes to their index in the node list.
+        """
+
+        self.nodes = list(nodes)
+        self.elements = list(elements)
+
+        # Store the node lists of the elements (and their contents), so we
+        # can check if the element connectivity changed.
+        self._element_nodes = list(map(_attrgetter("nodes"), self.elements))
+        self._element_node_list = list(_chain(*self._element_nodes))
+
+        n_nodes_per_element = _np.fromiter(
+            map(len, self._element_nodes), dtype=int, count=len(self.elements)
+        )
+        self.element_offsets = _np.zeros(len(self.elements) + 1, dtype=int)
+        _np.cumsum(n_nodes_per_element, out=self.element_offsets[1:])
+        self.element_node_indices = _np.fromiter(
+            map(node_index_map.get, self._element_node_list, _repeat(-1)),
+            dtype=int,
+            count=len(self._element_node_list),
+        )
+
+        # Create the transposed structure.
+        element_indices = _np.repeat(
+            _np.arange(len(self.elements)), n_nodes_per_element
+        )
+        is_in_mesh = self.element_node_indices >= 0
+        node_indices = self.element_node_indices[is_in_mesh]
+        element_indices = element_indices[is_in_mesh]
+        sort_indices = _np.argsort(node_indices, kind="stable")
+        self.node_element_indices = element_indices[sort_indices]
+        self.node_offsets = _np.zeros(len(self.nodes) + 1, dtype=int)
+        _np.cumsum(
+            _np.bincount(node_indices, minlength=len(self.nodes)),
+            out=self.node_offsets[1:],
+        )
+
+    def is_valid(self, nodes: list[_Node], elements: list[_Element]) -> bool:
+        """Check if the adjacency represents the given nodes and elements.
+
+        The checks only compare object identities and are performed in C
+        loops, so they are cheap compared to creating the adjacency.
+
+        Args:
+            nodes: List of nodes that should be represented.
+            elements: List of elements that should be represented.
+
+        Returns:
+            True if the adjacency can be used for the given nodes and
+            elements.
+        """
+
+        if not (
+            len(nodes) == len(self.nodes)
+            and len(elements) == len(self.elements)
+            and all(map(_is, nodes, self.nodes))
+            and all(map(_is, elements, self.elements))
+        ):
+            return False
+
+        element_nodes = list(map(_attrgetter("nodes"), self.elements))
+        if not all(map(_is, element_nodes, self._element_nodes)):
+            return False
+        return sum(map(len, element_nodes)) == len(self._element_node_list) and all(
+            map(_is, _chain(*element_nodes), self._element_node_list)
+        )
+
+    def get_element_indices(self, node_indices) -> _NDArray:
+        """Return the indices of all elements connected to the given nodes.
+
+        Args:
+            node_indices: Indices of the nodes.
+
+        Returns:
+            Sorted array with the unique indices of the connected elements.
+        """
+
+        node_indices = _np.asarray(node_indices, dtype=int)
+        starts = self.node_offsets[node_indices]
+        counts = self.node_offsets[node_indices + 1] - starts
+        positions = _np.repeat(starts - _np.cumsum(counts) + counts, counts)
+        positions += _np.arange(len(positions))
+        return _np.unique(self.node_element_indices[positions])
+
+    def get_node_elements(self) -> list[list[_Element]]:
+        """Return a list with the connected elements for each node."""
+
+        connected_elements = list(
+            map(self.elements.__getitem__, self.node_element_indices)
+        )
+        offsets = self.node_offsets.tolist()
+        return [
+            connected_elements[start:end]
+            for start, end in zip(offsets[:-1], offsets[1:])
+        ]
+
+    def __deepcopy__(self, memo):
+        """The adjacency only represents the nodes and elements it was created
+        with.
+
+        Therefore, no copy is created and the adjacency has to be
+        recreated for copied meshes.
+        """
+        return None
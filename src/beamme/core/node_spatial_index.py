@@ -0,0 +1,185 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018-2025 BeamMe Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""This module implements a spatial index for the nodes of a mesh."""
+
+from operator import attrgetter as _attrgetter
+
+import numpy as _np
+from numpy.typing import NDArray as _NDArray
+from scipy.spatial import KDTree as _KDTree
+
+from beamme.core.nodal_arrays import NodalArrays as _NodalArrays
+
+
+class NodeSpatialIndex:
+    """A spatial index for the nodes represented by nodal arrays.
+
+    The index contains a mask of the middle nodes and a KD-tree of the
+    nodal coordinates. All queries return the indices of the matching nodes
+    in ascending order, i.e., in the order of the node list.
+
+    Planes and cylinders are evaluated directly on the nodal coordinates.
+    The KD-tree is only used for boxes and spheres, therefore it is created
+    on the first of these queries. It is created with a copy of the
+    coordinates and recreated if the nodes have been transformed since.
+    """
+
+    def __init__(self, nodal_arrays: _NodalArrays):
+        """Create the spatial index.
+
+        Args:
+            nodal_arrays: Nodal arrays of the nodes to be indexed.
+        """
+
+        self.nodal_arrays = nodal_arrays
+        self._kd_tree = None
+        self.is_middle_node = _np.fromiter(
+            map(_attrgetter("is_middle_node"), nodal_arrays.nodes),
+            dtype=bool,
+            count=len(nodal_arrays.nodes),
+        )
+
+    def is_valid(self, nodal_arrays: _NodalArrays) -> bool:
+        """Check if the index represents the given nodal arrays.
+
+        Args:
+            nodal_arrays: Nodal arrays that should be represented by the index.
+
+        Returns:
+            True if the index can be used for the given nodal arrays.
+        """
+        return nodal_arrays is self.nodal_arrays
+
+    @property
+    def kd_tree(self) -> _KDTree:
+        """Return the KD-tree of the current nodal coordinates.
+
+        Returns:
+            The KD-tree, which is created on the first call and recreated
+            if the nodes have been transformed.
+        """
+        coordinates = self.nodal_arrays.coordinates
+        if self._kd_tree is None or not _np.array_equal(
+            self._kd_tree.data, coordinates
+        ):
+            self._kd_tree = _KDTree(coordinates.copy())
+        return self._kd_tree
+
+    def _get_indices(self, mask: _NDArray, middle_nodes: bool) -> _NDArray:
+        """Return the indices of the nodes in the mask.
+
+        Args:
+            mask: Boolean array that marks the matching nodes.
+            middle_nodes: If middle nodes should be returned or not.
+        """
+        if not middle_nodes:
+            mask &= ~self.is_middle_node
+        return _np.flatnonzero(mask)
+
+    def nodes_in_box(
+        self, min_coordinates, max_coordinates, *, tol: float, middle_nodes: bool
+    ) -> _NDArray:
+        """Return the indices of the nodes in an axis aligned box.
+
+        Args:
+            min_coordinates: Minimal coordinates of the box.
+            max_coordinates: Maximal coordinates of the box.
+            tol: Tolerance for the bounds of the box.
+            middle_nodes: If middle nodes should be returned or not.
+        """
+        min_coordinates = _np.asarray(min_coordinates, dtype=float) - tol
+        max_coordinates = _np.asarray(max_coordinates, dtype=float) + tol
+
+        # Get the candidates within the circumscribed sphere of the box.
+        candidates = _np.array(
+            self.kd_tree.query_ball_point(
+                0.5 * (min_coordinates + max_coordinates),
+                0.5 * _np.linalg.norm(max_coordinates - min_coordinates),
+            ),
+            dtype=int,
+        )
+        coordinates = self.nodal_arrays.coordinates[candidates]
+        is_in_box = _np.all(
+            (coordinates >= min_coordinates) & (coordinates <= max_coordinates), axis=1
+        )
+        mask = _np.zeros(len(self.is_middle_node), dtype=bool)
+        mask[candidates[is_in_box]] = True
+        return self._get_indices(mask, middle_nodes)
+
+    def nodes_in_sphere(
+        self, center, radius: float, *, tol: float, middle_nodes: bool
+    ) -> _NDArray:
+        """Return the indices of the nodes in a sphere.
+
+        Args:
+            center: Center of the sphere.
+            radius: Radius of the sphere.
+            tol: Tolerance for the radius of the sphere.
+            middle_nodes: If middle nodes should be returned or not.
+        """
+        mask = _np.zeros(len(self.is_middle_node), dtype=bool)
+        mask[self.kd_tree.query_ball_point(center, radius + tol)] = True
+        return self._get_indices(mask, middle_nodes)
+
+    def nodes_on_plane(
+        self, normal, point, *, tol: float, middle_nodes: bool
+    ) -> _NDArray:
+        """Return the indices of the nodes on a plane.
+
+        Args:
+            normal: Normal vector of the plane.
+            point: Point on the plane.
+            tol: Maximal distance of the nodes to the plane.
+            middle_nodes: If middle nodes should be returned or not.
+        """
+        normal = _np.asarray(normal, dtype=float)
+        normal = normal / _np.linalg.norm(normal)
+        distance = (self.nodal_arrays.coordinates - point) @ normal
+        return self._get_indices(_np.abs(distance) < tol, middle_nodes)
+
+    def nodes_on_cylinder(
+        self, axis, point, radius: float, *, tol: float, middle_nodes: bool
+    ) -> _NDArray:
+        """Return the indices of the nodes on the surface of an infinite
+        cylinder.
+
+        Args:
+            axis: Direction of the cylinder axis.
+            point: Point on the cylinder axis.
+            radius: Radius of the cylinder.
+            tol: Maximal distance of the nodes to the cylinder surface.
+            middle_nodes: If middle nodes should be returned or not.
+        """
+        axis = _np.asarray(axis, dtype=float)
+        axis = axis / _np.linalg.norm(axis)
+        relative_coordinates = self.nodal_arrays.coordinates - point
+        radial = relative_coordinates - _np.outer(relative_coordinates @ axis, axis)
+        distance = _np.linalg.norm(radial, axis=1) - radius
+        return self._get_indices(_np.abs(distance) < tol, middle_nodes)
+
+    def __deepcopy__(self, memo):
+        """The index only represents the nodes it was created with.
+
+        Therefore, no copy is created and the index has to be recreated
+        for copied meshes.
+        """
+        return None
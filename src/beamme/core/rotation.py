@@ -46,6 +46,8 @@ class Rotation:
     Internally the rotations are stored as quaternions.
     """
 
+    __slots__ = ("q",)
+
     def __init__(self, *args):
         """Initialize the rotation object.
 
@@ -314,6 +316,14 @@ class Rotation:
             added_rotation[0] = p[0] * q[0] - _np.dot(p[1:], q[1:])
             added_rotation[1:] = p[0] * q[1:] + q[0] * p[1:] + _np.cross(p[1:], q[1:])
             return Rotation.from_quaternion(added_rotation)
+        elif isinstance(other, RotationArray):
+            # Add this rotation to each rotation in the array.
+            return (
+                RotationArray.from_quaternion(
+                    _np.broadcast_to(self.q, other.q.shape), normalized=True
+                )
+                * other
+            )
         elif isinstance(other, (list, _np.ndarray)) and len(other) == 3:
             # Apply rotation to vector.
             return _np.dot(self.get_rotation_matrix(), _np.asarray(other))
@@ -341,6 +351,392 @@ class Rotation:
         return f"Rotation:\n    q0: {self.q[0]}\n    q: {self.q[1:]}"
 
 
+def _skew_matrices(vectors: _NDArray) -> _NDArray:
+    """Return the skew matrices for an array of vectors (n x 3)."""
+    skew = _np.zeros([len(vectors), 3, 3])
+    skew[:, 0, 1] = -vectors[:, 2]
+    skew[:, 0, 2] = vectors[:, 1]
+    skew[:, 1, 0] = vectors[:, 2]
+    skew[:, 1, 2] = -vectors[:, 0]
+    skew[:, 2, 0] = -vectors[:, 1]
+    skew[:, 2, 1] = vectors[:, 0]
+    return skew
+
+
+def _dot(a: _NDArray, b: _NDArray) -> _NDArray:
+    """Return the row wise dot product of two arrays of vectors.
+
+    The stacked matrix product evaluates the sums in the same way as
+    `np.dot` for single vectors, so the results are identical to the
+    ones of the scalar `Rotation` functions.
+    """
+    return (a[:, _np.newaxis, :] @ b[:, :, _np.newaxis])[:, 0, 0]
+
+
+def _pow2(a: _NDArray) -> _NDArray:
+    """Return the square of an array.
+
+    `a**2` is evaluated as `a * a` for arrays, but with `pow` for scalars.
+    Both results can differ in the last digit, so we use `pow` here to get
+    the same results as the scalar `Rotation` functions.
+    """
+    return _np.float_power(a, 2)
+
+
+def _norm(a: _NDArray) -> _NDArray:
+    """Return the row wise norm of an array of vectors, see `_dot`."""
+    return _np.sqrt(_dot(a, a))
+
+
+def _outer(a: _NDArray, b: _NDArray) -> _NDArray:
+    """Return the row wise outer product of two arrays of vectors (n x 3)."""
+    return a[:, :, _np.newaxis] * b[:, _np.newaxis, :]
+
+
+class RotationArray:
+    """A class that represents an array of rotations.
+
+    Internally the rotations are stored as an array of quaternions
+    (n x 4). All operations are vectorized versions of the ones in
+    `Rotation` and give the same results as applying the scalar
+    operations to each rotation.
+    """
+
+    __slots__ = ("q",)
+
+    def __init__(self, axis, phi):
+        """Initialize the rotations from rotation axes and rotation angles.
+
+        Args
+        ----
+        axis: array (n x 3) or (3)
+            Rotation axes, a single axis is used for all angles.
+        phi: array (n) or float
+            Rotation angles, a single angle is used for all axes.
+        """
+
+        axis, phi = _np.broadcast_arrays(
+            _np.asarray(axis, dtype=float).reshape(-1, 3),
+            _np.asarray(phi, dtype=float).reshape(-1, 1),
+        )
+        axis = _np.ascontiguousarray(axis)
+        phi = phi[:, 0]
+        norm = _norm(axis)
+        if _np.any(norm < _bme.eps_quaternion):
+            raise ValueError("The rotation axis can not be a zero vector!")
+        self.q = _np.zeros([len(phi), 4])
+        self.q[:, 0] = _np.cos(0.5 * phi)
+        self.q[:, 1:] = _np.sin(0.5 * phi)[:, _np.newaxis] * axis / norm[:, _np.newaxis]
+
+    @classmethod
+    def identity(cls, n_rotations: int) -> "RotationArray":
+        """Create an array of identity rotations."""
+        q = _np.zeros([n_rotations, 4])
+        q[:, 0] = 1
+        return cls.from_quaternion(q, normalized=True)
+
+    @classmethod
+    def from_quaternion(cls, q, *, normalized=False) -> "RotationArray":
+        """Create the object from a quaternion float array (n x 4)
+
+        Args
+        ----
+        q: Quaternions, q0, qx,qy,qz
+        normalized: Flag if the input quaternions are normalized, see
+            `Rotation.from_quaternion`.
+        """
+        if isinstance(q, _np.ndarray) and q.dtype == _quaternion.quaternion:
+            q = _quaternion.as_float_array(q)
+
+        # The quaternions are stored in a C-contiguous array, as the results
+        # of the stacked products in `_dot` depend on the memory layout.
+        rotations = object.__new__(cls)
+        q = _np.asarray(q, dtype=float)
+        if (not q.ndim == 2) or (not q.shape[1] == 4):
+            raise ValueError("Got quaternion array with unexpected dimensions")
+        if normalized:
+            rotations.q = _np.array(q, order="C")
+        else:
+            q = _np.ascontiguousarray(q)
+            rotations.q = q / _norm(q)[:, _np.newaxis]
+        return rotations
+
+    @classmethod
+    def from_rotations(cls, rotations: list[Rotation]) -> "RotationArray":
+        """Create the object from a list of rotation objects."""
+        return cls.from_quaternion(
+            _np.array([rotation.q for rotation in rotations]).reshape(-1, 4),
+            normalized=True,
+        )
+
+    @classmethod
+    def from_rotation_matrix(cls, R) -> "RotationArray":
+        """Create the object from an array of rotation matrices (n x 3 x 3),
+        see `Rotation.from_rotation_matrix`."""
+
+        R = _np.asarray(R, dtype=float).reshape(-1, 3, 3)
+        q = _np.zeros([len(R), 4])
+        trace = R[:, 0, 0] + R[:, 1, 1] + R[:, 2, 2]
+        values = _np.stack([R[:, 0, 0], R[:, 1, 1], R[:, 2, 2], trace], axis=1)
+        arg_max = _np.argmax(values, axis=1)
+
+        mask = arg_max == 3
+        R_mask = R[mask]
+        q_0 = _np.sqrt(trace[mask] + 1) * 0.5
+        q[mask, 0] = q_0
+        q[mask, 1] = (R_mask[:, 2, 1] - R_mask[:, 1, 2]) / (4 * q_0)
+        q[mask, 2] = (R_mask[:, 0, 2] - R_mask[:, 2, 0]) / (4 * q_0)
+        q[mask, 3] = (R_mask[:, 1, 0] - R_mask[:, 0, 1]) / (4 * q_0)
+
+        for i_index in range(3):
+            mask = arg_max == i_index
+            R_mask = R[mask]
+            j_index = (i_index + 1) % 3
+            k_index = (i_index + 2) % 3
+            q_i = _np.sqrt(R_mask[:, i_index, i_index] * 0.5 + (1 - trace[mask]) * 0.25)
+            q[mask, 0] = (R_mask[:, k_index, j_index] - R_mask[:, j_index, k_index]) / (
+                4 * q_i
+            )
+            q[mask, i_index + 1] = q_i
+            q[mask, j_index + 1] = (
+                R_mask[:, j_index, i_index] + R_mask[:, i_index, j_index]
+            ) / (4 * q_i)
+            q[mask, k_index + 1] = (
+                R_mask[:, k_index, i_index] + R_mask[:, i_index, k_index]
+            ) / (4 * q_i)
+
+        return cls.from_quaternion(q)
+
+    @classmethod
+    def from_basis(cls, t1, t2) -> "RotationArray":
+        """Create the object from two arrays of basis vectors t1, t2 (n x 3),
+        see `Rotation.from_basis`."""
+
+        t1 = _np.ascontiguousarray(t1, dtype=float).reshape(-1, 3)
+        t2 = _np.ascontiguousarray(t2, dtype=float).reshape(-1, 3)
+        t1_normal = t1 / _norm(t1)[:, _np.newaxis]
+        t2_ortho = t2 - t1_normal * _dot(t1_normal, t2)[:, _np.newaxis]
+        t2_normal = t2_ortho / _norm(t2_ortho)[:, _np.newaxis]
+        t3_normal = _np.cross(t1_normal, t2_normal)
+
+        R = _np.stack([t1_normal, t2_normal, t3_normal], axis=2)
+        return cls.from_rotation_matrix(R)
+
+    @classmethod
+    def from_rotation_vector(cls, rotation_vector) -> "RotationArray":
+        """Create the object from an array of rotation vectors (n x 3)."""
+
+        rotation_vector = _np.ascontiguousarray(rotation_vector, dtype=float).reshape(
+            -1, 3
+        )
+        q = _np.zeros([len(rotation_vector), 4])
+        phi = _norm(rotation_vector)
+        q[:, 0] = _np.cos(0.5 * phi)
+
+        # For small angles use the Taylor series expansion of sin(phi/2)/phi
+        # around phi=0.
+        is_small = phi < _bme.eps_quaternion
+        q[is_small, 1:] = 0.5 * rotation_vector[is_small]
+        phi_large = phi[~is_small]
+        q[~is_small, 1:] = (_np.sin(0.5 * phi_large) / phi_large)[
+            :, _np.newaxis
+        ] * rotation_vector[~is_small]
+        return cls.from_quaternion(q)
+
+    def __len__(self) -> int:
+        """Return the number of rotations in this array."""
+        return len(self.q)
+
+    def __getitem__(self, key):
+        """Return a single rotation for an integer key, otherwise return a
+        rotation array with the selected rotations (copy)."""
+        if isinstance(key, (int, _np.integer)):
+            return Rotation.from_quaternion(self.q[key], normalized=True)
+        return RotationArray.from_quaternion(self.q[key], normalized=True)
+
+    def check(self):
+        """Perform all checks for the rotations."""
+        self.check_uniqueness()
+        self.check_quaternion_constraint()
+
+    def check_uniqueness(self):
+        """We always want q0 to be positive -> the range for the rotational
+        angle is 0 <= phi <= pi."""
+        self.q[self.q[:, 0] < 0] *= -1
+
+    def check_quaternion_constraint(self):
+        """We want to check that q.q = 1."""
+
+        is_corrupted = _np.abs(1 - _norm(self.q)) > (_bme.eps_quaternion)
+        if _np.any(is_corrupted):
+            raise ValueError(
+                "The rotation object is corrupted. q.q does not equal 1! "
+                f"q={self.q[is_corrupted][0]}"
+            )
+
+    def get_rotation_matrix(self) -> _NDArray:
+        """Return the rotation matrices for the rotations (n x 3 x 3).
+
+        (Krenk (3.50))
+        """
+        q_0 = self.q[:, 0]
+        q_vec = self.q[:, 1:]
+        R = (
+            (_pow2(q_0) - _dot(q_vec, q_vec))[:, _np.newaxis, _np.newaxis] * _np.eye(3)
+            + (2 * q_0)[:, _np.newaxis, _np.newaxis] * _skew_matrices(q_vec)
+            + 2 * _outer(q_vec, q_vec)
+        )
+        return R
+
+    def get_quaternion(self) -> _NDArray:
+        """Return the quaternions for the rotations, as numpy array (copy)."""
+        return _np.array(self.q)
+
+    def get_numpy_quaternion(self) -> _NDArray:
+        """Return an array of numpy quaternion objects representing the
+        rotations (copy)."""
+        return _quaternion.from_float_array(_np.array(self.q))
+
+    def get_rotation_vector(self) -> _NDArray:
+        """Return the rotation vectors for the rotations (n x 3)."""
+
+        self.check()
+
+        norm = _norm(self.q[:, 1:])
+        phi = 2 * _np.arctan2(norm, self.q[:, 0])
+
+        # For small angles use the Taylor series expansion of phi/sin(phi/2).
+        is_small = phi < _bme.eps_quaternion
+        scale_factor = _np.full(len(phi), 2.0)
+        scale_factor[~is_small] = phi[~is_small] / _np.sin(phi[~is_small] / 2)
+
+        # For rotations of exactly +-pi, the first component of the rotation
+        # axis that is not 0 has to be positive, see
+        # `Rotation.get_rotation_vector`.
+        is_pi = ~is_small & (_np.abs(_np.abs(phi) - _np.pi) < _bme.eps_quaternion)
+        if _np.any(is_pi):
+            axis = self.q[is_pi, 1:]
+            is_non_zero = _np.abs(axis) > _bme.eps_quaternion
+            first_non_zero = _np.argmax(is_non_zero, axis=1)
+            first_component = axis[_np.arange(len(axis)), first_non_zero]
+            flip = _np.any(is_non_zero, axis=1) & (first_component < 0)
+            scale_factor[_np.flatnonzero(is_pi)[flip]] *= -1
+
+        return self.q[:, 1:] * scale_factor[:, _np.newaxis]
+
+    def _get_rotation_vector_data(self):
+        """Return the data of the rotation vectors that is needed for the
+        transformation matrices.
+
+        Returns:
+            omega, omega_norm, omega_dir, is_large: The rotation vectors,
+            their norms, the normalized rotation vectors and a mask of the
+            rotations that are not evaluated with the Taylor series
+            expansion. The normalized rotation vectors are only given for
+            the rotations in the mask.
+        """
+        omega = self.get_rotation_vector()
+        omega_norm = _norm(omega)
+        is_large = _pow2(omega_norm) > _bme.eps_quaternion
+        omega = omega[is_large]
+        omega_norm = omega_norm[is_large]
+        omega_dir = omega / omega_norm[:, _np.newaxis]
+        return omega, omega_norm, omega_dir, is_large
+
+    def get_transformation_matrix(self) -> _NDArray:
+        """Return the transformation matrices for the rotations
+        (n x 3 x 3), see `Rotation.get_transformation_matrix`."""
+
+        omega, omega_norm, omega_dir, is_large = self._get_rotation_vector_data()
+
+        # For small angles we use the constant part of the Taylor series
+        # expansion.
+        transformation_matrix = _np.zeros([len(self), 3, 3])
+        transformation_matrix[:] = _np.identity(3)
+
+        # Taken from Jelenic and Crisfield (1999) Equation (2.5)
+        outer_dir = _outer(omega_dir, omega_dir)
+        transformation_matrix[is_large] = (
+            outer_dir
+            - 0.5 * _skew_matrices(omega)
+            + (0.5 * omega_norm / _np.tan(0.5 * omega_norm))[
+                :, _np.newaxis, _np.newaxis
+            ]
+            * (_np.identity(3) - outer_dir)
+        )
+        return transformation_matrix
+
+    def get_transformation_matrix_inv(self) -> _NDArray:
+        """Return the inverse of the transformation matrices for the
+        rotations (n x 3 x 3), see
+        `Rotation.get_transformation_matrix_inv`."""
+
+        omega, omega_norm, omega_dir, is_large = self._get_rotation_vector_data()
+
+        # For small angles we use the constant part of the Taylor series
+        # expansion.
+        transformation_matrix_inverse = _np.zeros([len(self), 3, 3])
+        transformation_matrix_inverse[:] = _np.identity(3)
+
+        # Taken from Jelenic and Crisfield (1999) Equation (2.5)
+        sin_factor = (_np.sin(omega_norm) / omega_norm)[:, _np.newaxis, _np.newaxis]
+        cos_factor = ((1.0 - _np.cos(omega_norm)) / _pow2(omega_norm))[
+            :, _np.newaxis, _np.newaxis
+        ]
+        transformation_matrix_inverse[is_large] = (
+            (1.0 - sin_factor) * _outer(omega_dir, omega_dir)
+            + sin_factor * _np.identity(3)
+            + cos_factor * _skew_matrices(omega)
+        )
+        return transformation_matrix_inverse
+
+    def inv(self) -> "RotationArray":
+        """Return the inverse of the rotations."""
+
+        tmp_quaternion = self.q.copy()
+        tmp_quaternion[:, 0] *= -1.0
+        return RotationArray.from_quaternion(tmp_quaternion)
+
+    def __mul__(self, other):
+        """Add these rotations to other rotations, or apply them on vectors.
+
+        The other object can be a single rotation, an array of rotations
+        with the same length, a single vector or an array of vectors with
+        the same length.
+        """
+
+        if isinstance(other, (Rotation, RotationArray)):
+            # Get quaternions of the two objects.
+            p = self.q
+            q = _np.ascontiguousarray(_np.broadcast_to(other.q, p.shape))
+            # Add the rotations.
+            added_rotation = _np.zeros_like(p)
+            added_rotation[:, 0] = p[:, 0] * q[:, 0] - _dot(p[:, 1:], q[:, 1:])
+            added_rotation[:, 1:] = (
+                p[:, [0]] * q[:, 1:]
+                + q[:, [0]] * p[:, 1:]
+                + _np.cross(p[:, 1:], q[:, 1:])
+            )
+            return RotationArray.from_quaternion(added_rotation)
+        elif isinstance(other, (list, _np.ndarray)) and _np.shape(other)[-1] == 3:
+            # Apply rotations to vectors.
+            vectors = _np.ascontiguousarray(
+                _np.broadcast_to(_np.asarray(other, dtype=float), (len(self), 3))
+            )
+            return (self.get_rotation_matrix() @ vectors[:, :, _np.newaxis])[:, :, 0]
+        raise NotImplementedError("Error, not implemented, does not make sense anyway!")
+
+    def copy(self) -> "RotationArray":
+        """Return a copy of this object."""
+        return RotationArray.from_quaternion(self.q, normalized=True)
+
+    def __str__(self):
+        """String representation of object."""
+
+        self.check()
+        return f"RotationArray:\n    q: {self.q}"
+
+
 def add_rotations(
     rotation_21: Rotation | _NDArray[_quaternion.quaternion],
     rotation_10: Rotation | _NDArray[_quaternion.quaternion],
@@ -387,6 +783,22 @@ def add_rotations(
     return rotnew.transpose()
 
 
+def get_rotation_vectors(quaternions: _NDArray) -> _NDArray:
+    """Return the rotation vectors for an array of quaternions.
+
+    This is the vectorized version of `Rotation.get_rotation_vector`.
+
+    Args:
+        quaternions: Array with the quaternions (n x 4).
+
+    Returns:
+        Array with the rotation vectors (n x 3).
+    """
+    return RotationArray.from_quaternion(
+        _np.asarray(quaternions, dtype=float).reshape(-1, 4), normalized=True
+    ).get_rotation_vector()
+
+
 def rotate_coordinates(
     coordinates: _NDArray,
     rotation: Rotation | _NDArray[_quaternion.quaternion],
@@ -453,23 +865,36 @@ def rotate_coordinates(
     return coordinates_new
 
 
-def smallest_rotation(q: Rotation, t):
+def smallest_rotation(q: Rotation | RotationArray, t):
     """Get the triad that results from the smallest rotation (rotation without
     twist) from the triad q such that the rotated first basis vector aligns
     with t. For more details see Christoph Meier's dissertation chapter 2.1.2.
 
     Args
     ----
-    q: Rotation
-        Starting triad.
-    t: Vector in R3
-        Direction of the first basis of the rotated triad.
+    q: Rotation, RotationArray
+        Starting triad(s).
+    t: Vector in R3, array (n x 3)
+        Direction of the first basis of the rotated triad(s).
     Return
     ----
-    q_sr: Rotation
-        The triad that results from a smallest rotation.
+    q_sr: Rotation, RotationArray
+        The triad(s) that result from a smallest rotation.
     """
 
+    if isinstance(q, RotationArray):
+        R_old = q.get_rotation_matrix()
+        g1_old = R_old[:, :, 0]
+        t = _np.ascontiguousarray(t, dtype=float).reshape(-1, 3)
+        g1 = t / _norm(t)[:, _np.newaxis]
+
+        # Quaternion components of relative rotations, see the scalar case.
+        q_rel = _np.zeros([len(g1), 4])
+        q_rel[:, 0] = _norm(0.5 * (g1_old + g1))
+        q_rel[:, 1:] = _np.cross(g1_old, g1) / (2.0 * q_rel[:, [0]])
+
+        return RotationArray.from_quaternion(q_rel) * q
+
     R_old = q.get_rotation_matrix()
     g1_old = R_old[:, 0]
     g1 = _np.asarray(t) / _np.linalg.norm(t)
@@ -484,3 +909,56 @@ def smallest_rotation(q: Rotation, t):
     q_rel[1:] = _np.cross(g1_old, g1) / (2.0 * q_rel[0])
 
     return Rotation.from_quaternion(q_rel) * q
+
+
+def parallel_transport(start_rotation: Rotation | _NDArray, tangents) -> _NDArray:
+    """Get the triads along a curve that result from successive smallest
+    rotations (parallel transport) of a start triad onto the tangents.
+
+    The first triad is the smallest rotation of the start triad onto the
+    first tangent, each following triad is the smallest rotation of the
+    previous triad onto the next tangent, see `smallest_rotation`. The
+    relative rotations between the tangents are computed at once and
+    combined with a parallel prefix product, i.e., the number of
+    vectorized quaternion products only grows with log2(n). After each
+    level of the prefix product the quaternions are normalized to avoid
+    error accumulation.
+
+    Args
+    ----
+    start_rotation: Rotation, quaternion (4)
+        Starting triad.
+    tangents: array (n x 3)
+        Directions of the first basis vectors of the rotated triads.
+    Return
+    ----
+    quaternions: array (n x 4)
+        The quaternions of the triads along the curve.
+    """
+
+    if not isinstance(start_rotation, Rotation):
+        start_rotation = Rotation.from_quaternion(start_rotation)
+    tangents = _np.ascontiguousarray(tangents, dtype=float).reshape(-1, 3)
+    g1 = tangents / _norm(tangents)[:, _np.newaxis]
+    g1_old = _np.empty_like(g1)
+    g1_old[0] = start_rotation.get_rotation_matrix()[:, 0]
+    g1_old[1:] = g1[:-1]
+
+    # Quaternion components of the relative rotations, see `smallest_rotation`.
+    quaternions = _np.zeros([len(g1), 4])
+    quaternions[:, 0] = _norm(0.5 * (g1_old + g1))
+    quaternions[:, 1:] = _np.cross(g1_old, g1) / (2.0 * quaternions[:, [0]])
+
+    # Inclusive prefix product of the relative rotations, each quaternion is
+    # multiplied with the (already combined) one that is `offset` entries
+    # before it.
+    offset = 1
+    while offset < len(quaternions):
+        quaternions[offset:] = add_rotations(
+            quaternions[offset:], quaternions[:-offset]
+        )
+        quaternions /= _np.linalg.norm(quaternions, axis=1)[:, _np.newaxis]
+        offset *= 2
+
+    quaternions = add_rotations(quaternions, start_rotation.q)
+    return quaternions / _np.linalg.norm(quaternions, axis=1)[:, _np.newaxis]
@@ -43,7 +43,8 @@ def add_point_data_node_sets(point_data, nodes, *, extra_points=0):
     # Get list with node set indices of the given nodes
     geometry_set_list = []
     for node in nodes:
-        geometry_set_list.extend(node.node_sets_link)
+        if node.node_sets_link is not None:
+            geometry_set_list.extend(node.node_sets_link)
 
     # Remove double entries of list.
     geometry_set_list = list(set(geometry_set_list))
@@ -54,7 +55,7 @@ def add_point_data_node_sets(point_data, nodes, *, extra_points=0):
         # Check which nodes are connected to a geometry set.
         data_vector = _np.zeros(n_nodes + extra_points)
         for i, node in enumerate(nodes):
-            if geometry_set in node.node_sets_link:
+            if node.node_sets_link is not None and geometry_set in node.node_sets_link:
                 data_vector[i] = 1
             else:
                 data_vector[i] = _bme.vtk_nan_int
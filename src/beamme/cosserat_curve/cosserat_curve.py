@@ -35,6 +35,7 @@ from scipy import optimize as _optimize
 
 from beamme.core.conf import bme as _bme
 from beamme.core.rotation import Rotation as _Rotation
+from beamme.core.rotation import parallel_transport as _parallel_transport
 from beamme.core.rotation import rotate_coordinates as _rotate_coordinates
 from beamme.core.rotation import smallest_rotation as _smallest_rotation
 
@@ -118,13 +119,13 @@ def get_quaternions_along_curve(
     n_points = len(point_arc_length)
     quaternions = _np.zeros(n_points, dtype=_quaternion.quaternion)
     quaternions[0] = last_rotation.q
-    for i in range(1, n_points):
-        rotation = _smallest_rotation(
-            last_rotation,
-            centerline_interpolation_derivative(point_arc_length[i]),
+    if n_points > 1:
+        quaternions[1:] = _quaternion.from_float_array(
+            _parallel_transport(
+                last_rotation,
+                centerline_interpolation_derivative(point_arc_length[1:]),
+            )
         )
-        quaternions[i] = rotation.q
-        last_rotation = rotation
     return quaternions
 
 
@@ -40,6 +40,8 @@ class Beam3rHerm2Line3(_Beam):
     interpolation of the centerline and second order Lagrangian interpolation
     of the rotations."""
 
+    __slots__ = ()
+
     nodes_create = [-1, 0, 1]
     beam_type = _bme.beam.reissner
     valid_material = [_MaterialReissner, _MaterialReissnerElastoplastic]
@@ -76,6 +78,8 @@ class Beam3rLine2Line2(_Beam):
     """Represents a Reissner beam with linear shapefunctions in the rotations
     as well as the displacements."""
 
+    __slots__ = ()
+
     nodes_create = [-1, 1]
     beam_type = _bme.beam.reissner
     valid_material = [_MaterialReissner]
@@ -110,6 +114,8 @@ class Beam3rLine2Line2(_Beam):
 class Beam3kClass(_Beam):
     """Represents a Kirchhoff beam element."""
 
+    __slots__ = ("weak", "rotvec", "is_fad")
+
     nodes_create = [-1, 0, 1]
     beam_type = _bme.beam.kirchhoff
     valid_material = [_MaterialKirchhoff]
@@ -180,6 +186,8 @@ def Beam3k(**kwargs_class):
 class Beam3eb(_Beam):
     """Represents a Euler Bernoulli beam element."""
 
+    __slots__ = ()
+
     nodes_create = [-1, 1]
     beam_type = _bme.beam.euler_bernoulli
     valid_material = [_MaterialEulerBernoulli]
@@ -75,8 +75,14 @@ def get_geometry_set_indices_from_section(
     return geometry_set_dict
 
 
-def _dump_coupling(coupling):
-    """Return the input file representation of the coupling condition."""
+def _dump_coupling(coupling, mesh):
+    """Return the input file representation of the coupling condition.
+
+    Args:
+        coupling: The coupling condition.
+        mesh: The mesh that contains the coupling, it is used to get the
+            elements connected to the coupled nodes.
+    """
 
     # TODO: Move this to a better place / gather all dump functions for general
     # BeamMe items in a file or so.
@@ -88,9 +94,7 @@ def _dump_coupling(coupling):
         # TODO: Coupling also makes sense for different beam types, this can
         # be implemented at some point.
         nodes = coupling.geometry_set.get_points()
-        connected_elements = [
-            element for node in nodes for element in node.element_link
-        ]
+        connected_elements = mesh.get_connected_elements(nodes)
         element_types = {type(element) for element in connected_elements}
         if len(element_types) > 1:
             raise TypeError(
@@ -228,6 +232,9 @@ class InputFile(_FourCInput):
             mesh: The mesh to be added to the input file.
         """
 
+        # Expand the mesh instances to concrete nodes and elements.
+        mesh = mesh.get_expanded_mesh()
+
         # Perform some checks on the mesh.
         if _bme.check_overlapping_elements:
             mesh.check_overlapping_elements()
@@ -350,7 +357,7 @@ class InputFile(_FourCInput):
                     )
 
                 elif isinstance(item, _Coupling):
-                    list.append(_dump_coupling(item))
+                    list.append(_dump_coupling(item, mesh))
                 else:
                     raise TypeError(f"Could not dump {item}")
 
@@ -391,23 +398,6 @@ class InputFile(_FourCInput):
         for function in mesh.functions:
             self.add({f"FUNCT{function.i_global + 1}": function.data})
 
-        # If there are couplings in the mesh, set the link between the nodes
-        # and elements, so the couplings can decide which DOFs they couple,
-        # depending on the type of the connected beam element.
-        def get_number_of_coupling_conditions(key):
-            """Return the number of coupling conditions in the mesh."""
-            if (key, _bme.geo.point) in mesh.boundary_conditions.keys():
-                return len(mesh.boundary_conditions[key, _bme.geo.point])
-            else:
-                return 0
-
-        if (
-            get_number_of_coupling_conditions(_bme.bc.point_coupling)
-            + get_number_of_coupling_conditions(_bme.bc.point_coupling_penalty)
-            > 0
-        ):
-            mesh.set_node_links()
-
         # Add the boundary conditions.
         for (bc_key, geom_key), bc_list in mesh.boundary_conditions.items():
             if len(bc_list) > 0:
@@ -22,7 +22,7 @@
 r"""This module defines geometric search functionality.
 
 This module contains functionality to find points close to each other in
-a point cloud. Currently, three different implementations for the actual
+a point cloud. Currently, five different implementations for the actual
 search algorithm are available (depending on your installation/setup):
 
 - `brute_force_cython`: A brute force algorithm implemented in Cython,
@@ -43,8 +43,25 @@ search algorithm are available (depending on your installation/setup):
   but due to a more optimised implementation is a few times faster
   than the scipy implementation.
 
+- `spatial_hash_numpy`: Sorts the points into the cells of a regular grid
+  and only compares points in neighboring cells, using vectorized NumPy
+  operations. If the tolerance is small compared to the point spacing,
+  e.g., for merging coincident nodes, this is a few times faster than the
+  scipy implementation.
+
+- `binning_cython`: Uses the same grid as `spatial_hash_numpy`, but the
+  neighboring cells are checked in Cython, in parallel with OpenMP. This
+  algorithm is only chosen automatically if a calibration on the current
+  machine (see `benchmark`) found it to be the fastest one.
+
 The `find_close_points` function automatically chooses the fastest
-(available) implementation for the given point array.
+(available) implementation for the given point array. For point clouds
+that do not fit into memory, `find_close_points_chunked` searches
+overlapping slabs of the point cloud one after another.
+
+Pairs of beam elements with close centerlines can be found with
+`beam_proximity.find_close_beams`, based on a KD-tree (scipy) or a
+bounding volume hierarchy (ArborX) of the centerline segments.
 
 Consult the `README.md` regarding install and testing options for
 different implementations.
@@ -22,12 +22,20 @@
 """This file defines the interface to the ArborX geometric search
 functionality."""
 
+import numpy as _np
+
+from beamme.geometric_search.connected_components import (
+    pairs_to_point_partners as _pairs_to_point_partners,
+)
 from beamme.geometric_search.utils import arborx_is_available as _arborx_is_available
 
 if _arborx_is_available():
     from beamme.geometric_search.arborx_lib import (
         find_close_points as _find_close_points,
     )
+    from beamme.geometric_search.arborx_lib import (
+        find_intersecting_boxes as _find_intersecting_boxes,
+    )
     from beamme.geometric_search.arborx_lib import (
         kokkos_finalize as _kokkos_finalize,
     )
@@ -55,8 +63,24 @@ if _arborx_is_available():
 
 
 def find_close_points_arborx(point_coordinates, tol):
-    """Call the ArborX implementation of find close_points."""
+    """Call the ArborX implementation of find close_points.
+
+    ArborX returns the pairs of close points, they are combined to
+    clusters with `pairs_to_point_partners`, i.e., chains of close points
+    are handled the same way as for the other algorithms.
+    """
+    if _arborx_is_available():
+        indices, offsets = _find_close_points(point_coordinates, tol)
+        first = _np.repeat(_np.arange(len(offsets) - 1), _np.diff(offsets))
+        pairs = _np.stack((first, indices), axis=1)
+        return _pairs_to_point_partners(pairs, len(point_coordinates))
+    else:
+        raise ModuleNotFoundError("ArborX functionality is not available")
+
+
+def find_intersecting_boxes_arborx(boxes_min, boxes_max):
+    """Call the ArborX implementation of find intersecting boxes."""
     if _arborx_is_available():
-        return _find_close_points(point_coordinates, tol)
+        return _find_intersecting_boxes(boxes_min, boxes_max)
     else:
         raise ModuleNotFoundError("ArborX functionality is not available")
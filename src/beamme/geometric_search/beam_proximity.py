@@ -0,0 +1,285 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018-2025 BeamMe Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""This file implements a search for beam elements whose centerlines are
+close to each other, e.g., to check for initial penetrations before a beam
+contact simulation."""
+
+from enum import Enum as _Enum
+from enum import auto as _auto
+
+import numpy as _np
+from numpy.typing import NDArray as _NDArray
+from scipy.spatial import KDTree as _KDTree
+
+from beamme.geometric_search.utils import arborx_is_available as _arborx_is_available
+
+if _arborx_is_available():
+    from beamme.geometric_search.arborx import (
+        find_intersecting_boxes_arborx as _find_intersecting_boxes_arborx,
+    )
+
+
+class FindCloseSegmentAlgorithm(_Enum):
+    """Enum for different algorithms to find close line segments."""
+
+    kd_tree_scipy = _auto()
+    boundary_volume_hierarchy_arborx = _auto()
+
+
+def get_segment_distances(starts_1, ends_1, starts_2, ends_2) -> _NDArray:
+    """Return the minimal distances between pairs of line segments.
+
+    The closest points are found by projecting the segments onto each other
+    and clamping the segment parameters to [0, 1], see Ericson, Real-Time
+    Collision Detection, 2005, Section 5.1.9. This also works for parallel
+    and degenerated segments.
+
+    Args:
+        starts_1, ends_1: Start and end points of the first segment of each
+            pair (n_pairs x 3).
+        starts_2, ends_2: Start and end points of the second segment of each
+            pair (n_pairs x 3).
+
+    Returns:
+        Array with the minimal distance of each pair of segments.
+    """
+
+    def divide(numerator, denominator):
+        """Divide the arrays, the result is 0 for vanishing denominators."""
+        return _np.divide(
+            numerator,
+            denominator,
+            out=_np.zeros_like(numerator),
+            where=denominator > 0.0,
+        )
+
+    starts_1 = _np.asarray(starts_1, dtype=float)
+    starts_2 = _np.asarray(starts_2, dtype=float)
+    directions_1 = _np.asarray(ends_1, dtype=float) - starts_1
+    directions_2 = _np.asarray(ends_2, dtype=float) - starts_2
+    differences = starts_1 - starts_2
+
+    a = _np.einsum("ij,ij->i", directions_1, directions_1)
+    b = _np.einsum("ij,ij->i", directions_1, directions_2)
+    c = _np.einsum("ij,ij->i", directions_1, differences)
+    e = _np.einsum("ij,ij->i", directions_2, directions_2)
+    f = _np.einsum("ij,ij->i", directions_2, differences)
+
+    # Closest point on the infinite lines, for parallel lines an arbitrary
+    # point is chosen for the first segment.
+    s = _np.clip(divide(b * f - c * e, a * e - b * b), 0.0, 1.0)
+    t = divide(b * s + f, e)
+
+    # If the parameter of the second segment is outside of the segment, it is
+    # clamped and the parameter of the first segment is recomputed.
+    s = _np.where(t < 0.0, _np.clip(divide(-c, a), 0.0, 1.0), s)
+    s = _np.where(t > 1.0, _np.clip(divide(b - c, a), 0.0, 1.0), s)
+    t = _np.clip(t, 0.0, 1.0)
+
+    # If the second segment is degenerated to a point, the closest point on
+    # the first segment is the projection of this point.
+    is_point_2 = e == 0.0
+    s = _np.where(is_point_2, _np.clip(divide(-c, a), 0.0, 1.0), s)
+    t = _np.where(is_point_2, 0.0, t)
+
+    return _np.linalg.norm(
+        differences + s[:, None] * directions_1 - t[:, None] * directions_2, axis=1
+    )
+
+
+def _get_candidate_pairs_scipy(segment_starts, segment_ends, distance) -> _NDArray:
+    """Return the candidate pairs of close segments with a KD-tree of the
+    segment midpoints.
+
+    Segments can only be close if the bounding spheres around their
+    midpoints are closer than the distance. The query radius of the KD-tree
+    has to contain the largest bounding sphere, so long segments are
+    subdivided into pieces that are not longer than the mean segment length
+    (or the distance, if it is larger) first. This results in at most twice
+    the number of segments.
+
+    Returns:
+        Array with the candidate pairs of segment indices (n_pairs x 2).
+    """
+
+    directions = segment_ends - segment_starts
+    lengths = _np.linalg.norm(directions, axis=1)
+    max_piece_length = max(_np.mean(lengths), distance)
+    if max_piece_length == 0.0:
+        n_pieces = _np.ones(len(lengths), dtype=int)
+    else:
+        n_pieces = _np.maximum(_np.ceil(lengths / max_piece_length), 1).astype(int)
+
+    # Get the midpoints and radii of the pieces.
+    piece_segments = _np.repeat(_np.arange(len(lengths)), n_pieces)
+    piece_offsets = _np.cumsum(n_pieces) - n_pieces
+    piece_parameters = (
+        _np.arange(len(piece_segments)) - piece_offsets[piece_segments] + 0.5
+    ) / n_pieces[piece_segments]
+    midpoints = (
+        segment_starts[piece_segments]
+        + piece_parameters[:, None] * directions[piece_segments]
+    )
+    radii = 0.5 * lengths[piece_segments] / n_pieces[piece_segments]
+
+    pairs = _KDTree(midpoints).query_pairs(
+        r=distance + 2.0 * _np.max(radii), output_type="ndarray"
+    )
+    pairs = pairs[
+        _np.linalg.norm(midpoints[pairs[:, 0]] - midpoints[pairs[:, 1]], axis=1)
+        <= radii[pairs[:, 0]] + radii[pairs[:, 1]] + distance
+    ]
+
+    # Get the unique pairs of the segments.
+    pairs = _np.sort(piece_segments[pairs], axis=1)
+    return _np.unique(pairs[pairs[:, 0] != pairs[:, 1]], axis=0)
+
+
+def find_close_segment_pairs(
+    segment_starts, segment_ends, distance: float, *, algorithm=None
+) -> tuple[_NDArray, _NDArray]:
+    """Find all pairs of line segments that are closer than a given distance.
+
+    The candidate pairs are found with a bounding volume hierarchy (ArborX)
+    or a KD-tree of the segment midpoints (scipy), and the exact distances
+    are only evaluated for the candidates.
+
+    Args:
+        segment_starts: Start points of the segments (n_segments x 3).
+        segment_ends: End points of the segments (n_segments x 3).
+        distance: Maximal distance between the segments of a pair.
+        algorithm: FindCloseSegmentAlgorithm that is used to find the
+            candidates. Defaults to the scipy implementation.
+
+    Returns:
+        pairs: Array with the indices of the close segments (n_pairs x 2),
+            the first index of each pair is smaller than the second one.
+        distances: The minimal distance between the segments of each pair.
+    """
+
+    segment_starts = _np.asarray(segment_starts, dtype=float)
+    segment_ends = _np.asarray(segment_ends, dtype=float)
+
+    if algorithm is None:
+        algorithm = FindCloseSegmentAlgorithm.kd_tree_scipy
+
+    if len(segment_starts) == 0:
+        pairs = _np.zeros((0, 2), dtype=int)
+    elif algorithm is FindCloseSegmentAlgorithm.kd_tree_scipy:
+        pairs = _get_candidate_pairs_scipy(segment_starts, segment_ends, distance)
+    elif algorithm is FindCloseSegmentAlgorithm.boundary_volume_hierarchy_arborx:
+        # Segments can only be close if their bounding boxes, enlarged by half
+        # the distance, intersect.
+        indices, offsets = _find_intersecting_boxes_arborx(
+            _np.minimum(segment_starts, segment_ends) - 0.5 * distance,
+            _np.maximum(segment_starts, segment_ends) + 0.5 * distance,
+        )
+        pairs = _np.stack(
+            [_np.repeat(_np.arange(len(segment_starts)), _np.diff(offsets)), indices],
+            axis=1,
+        )
+    else:
+        raise TypeError(f"Got unexpected algorithm {algorithm}")
+
+    pairs = _np.sort(_np.asarray(pairs, dtype=int).reshape(-1, 2), axis=1)
+    distances = get_segment_distances(
+        segment_starts[pairs[:, 0]],
+        segment_ends[pairs[:, 0]],
+        segment_starts[pairs[:, 1]],
+        segment_ends[pairs[:, 1]],
+    )
+    is_close = distances <= distance
+    return pairs[is_close], distances[is_close]
+
+
+def find_close_beams(
+    beams,
+    distance: float,
+    *,
+    n_segments_between_nodes=1,
+    exclude_connected_beams=True,
+    algorithm=None,
+) -> tuple[_NDArray, _NDArray]:
+    """Find all pairs of beam elements whose centerlines are closer than a
+    given distance.
+
+    The centerline of each element is represented by a polyline, see
+    `Beam.get_centerline_coordinates`, and the close segments of the
+    polylines are found with `find_close_segment_pairs`.
+
+    Args:
+        beams: List of beam elements.
+        distance: Maximal distance between the centerlines of a pair.
+        n_segments_between_nodes: Number of polyline segments between
+            successive nodes. For values greater than 1, the Hermite
+            interpolation of the centerline is used.
+        exclude_connected_beams: If pairs of elements that share a node are
+            excluded from the results. Their centerlines always touch.
+        algorithm: FindCloseSegmentAlgorithm, see `find_close_segment_pairs`.
+
+    Returns:
+        pairs: Array with the indices of the close elements in the given list
+            (n_pairs x 2), sorted in ascending order.
+        distances: The minimal distance between the centerlines of each pair.
+    """
+
+    # Get the polyline segments of all elements.
+    centerlines = [
+        beam.get_centerline_coordinates(
+            n_segments_between_nodes=n_segments_between_nodes
+        )
+        for beam in beams
+    ]
+    n_segments = _np.array([len(centerline) - 1 for centerline in centerlines])
+    segment_beams = _np.repeat(_np.arange(len(beams)), n_segments)
+    if len(segment_beams) == 0:
+        return _np.zeros((0, 2), dtype=int), _np.zeros(0)
+    segment_starts = _np.concatenate([centerline[:-1] for centerline in centerlines])
+    segment_ends = _np.concatenate([centerline[1:] for centerline in centerlines])
+
+    segment_pairs, segment_distances = find_close_segment_pairs(
+        segment_starts, segment_ends, distance, algorithm=algorithm
+    )
+
+    # Get the minimal distance for each pair of elements.
+    pairs = segment_beams[segment_pairs]
+    is_different = pairs[:, 0] != pairs[:, 1]
+    pairs = pairs[is_different]
+    segment_distances = segment_distances[is_different]
+    pairs, inverse = _np.unique(pairs, axis=0, return_inverse=True)
+    distances = _np.full(len(pairs), _np.inf)
+    _np.minimum.at(distances, inverse.reshape(-1), segment_distances)
+
+    if exclude_connected_beams:
+        node_ids = [set(map(id, beam.nodes)) for beam in beams]
+        is_connected = _np.fromiter(
+            (
+                not node_ids[i_beam].isdisjoint(node_ids[j_beam])
+                for i_beam, j_beam in pairs.tolist()
+            ),
+            dtype=bool,
+            count=len(pairs),
+        )
+        pairs = pairs[~is_connected]
+        distances = distances[~is_connected]
+
+    return pairs, distances
@@ -0,0 +1,217 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018-2025 BeamMe Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""This file implements the calibration of the automatic selection of the
+find_close_points algorithm on the current machine.
+
+The calibration is opt-in. It can be run with the `beamme-calibrate-geometric-search`
+command or by calling `calibrate_find_close_points`. Afterwards,
+`find_close_points` uses the measured crossover points to select the
+fastest algorithm.
+"""
+
+import argparse as _argparse
+import time as _time
+from pathlib import Path as _Path
+from typing import Optional as _Optional
+
+import numpy as _np
+
+from beamme.geometric_search.calibration import save_calibration as _save_calibration
+from beamme.geometric_search.find_close_points import (
+    FindClosePointAlgorithm as _FindClosePointAlgorithm,
+)
+from beamme.geometric_search.find_close_points import (
+    find_close_points as _find_close_points,
+)
+from beamme.geometric_search.find_close_points import (
+    get_available_algorithms as _get_available_algorithms,
+)
+
+# Maximal number of points for algorithms that do not scale well.
+_MAX_N_POINTS = {_FindClosePointAlgorithm.brute_force_cython: 5000}
+
+
+def get_benchmark_points(
+    n_points: int, tolerance_type: str, *, seed: int = 1
+) -> tuple[_np.ndarray, float]:
+    """Return a point cloud and tolerance for the calibration.
+
+    Args:
+        n_points: Number of points.
+        tolerance_type: "small_tolerance" returns random points where a
+            quarter of the points have a coincident partner, similar to
+            merging the nodes of a mesh. "large_tolerance" returns random
+            points with a tolerance of half the mean point spacing.
+        seed: Seed for the random points.
+
+    Returns:
+        The point coordinates (n_points x 3) and the tolerance.
+    """
+
+    rng = _np.random.default_rng(seed)
+    if tolerance_type == "small_tolerance":
+        tol = 1e-8
+        n_unique = n_points - n_points // 4
+        points = rng.random((n_unique, 3))
+        partners = points[: n_points - n_unique]
+        points = _np.concatenate(
+            [points, partners + 0.1 * tol * rng.random(partners.shape)]
+        )
+        return points[rng.permutation(n_points)], tol
+    elif tolerance_type == "large_tolerance":
+        return rng.random((n_points, 3)), 0.5 * n_points ** (-1.0 / 3.0)
+    else:
+        raise ValueError(f"Got unexpected tolerance type {tolerance_type}")
+
+
+def _get_crossovers(
+    n_points_list: list[int], fastest_algorithms: list[_FindClosePointAlgorithm]
+) -> list[list]:
+    """Return the crossover points from the fastest algorithm for each
+    number of points.
+
+    The crossover between two measured numbers of points is placed at
+    their geometric mean.
+    """
+
+    crossovers = []
+    n_points_previous = None
+    for n_points, algorithm in zip(n_points_list, fastest_algorithms):
+        if len(crossovers) == 0:
+            crossovers.append([0, algorithm.name])
+        elif crossovers[-1][1] != algorithm.name:
+            crossovers.append(
+                [int(_np.sqrt(n_points_previous * n_points)), algorithm.name]
+            )
+        n_points_previous = n_points
+    return crossovers
+
+
+def calibrate_find_close_points(
+    *,
+    n_points_list: tuple[int, ...] = (
+        50,
+        100,
+        200,
+        500,
+        1000,
+        2000,
+        5000,
+        10000,
+        50000,
+        200000,
+    ),
+    n_repetitions: int = 3,
+    calibration_file: _Optional[_Path] = None,
+    verbose: bool = False,
+) -> dict[str, list]:
+    """Benchmark the available find_close_points algorithms and store the
+    crossover points in the calibration file.
+
+    Each algorithm is timed for the given numbers of points and for a small
+    and a large tolerance compared to the point spacing, see
+    `get_benchmark_points`. The minimal time of the repetitions is used.
+
+    Args:
+        n_points_list: Numbers of points that are benchmarked.
+        n_repetitions: Number of repetitions for each measurement.
+        calibration_file: Path to the calibration file. Per default, the
+            path returned by `calibration.get_calibration_file` is used.
+        verbose: If the timings should be printed.
+
+    Returns:
+        The crossover points for each type of tolerance.
+    """
+
+    n_points_list = sorted(n_points_list)
+    algorithms = _get_available_algorithms()
+    crossovers = {}
+    for tolerance_type in ["small_tolerance", "large_tolerance"]:
+        fastest_algorithms = []
+        for n_points in n_points_list:
+            points, tol = get_benchmark_points(n_points, tolerance_type)
+            timings = {}
+            for algorithm in algorithms:
+                if n_points > _MAX_N_POINTS.get(algorithm, n_points):
+                    continue
+                times = []
+                for _ in range(n_repetitions):
+                    start_time = _time.perf_counter()
+                    _find_close_points(points, algorithm=algorithm, tol=tol)
+                    times.append(_time.perf_counter() - start_time)
+                timings[algorithm] = min(times)
+            fastest_algorithms.append(min(timings, key=timings.get))
+
+            if verbose:
+                print(
+                    f"{tolerance_type} with {n_points} points: "
+                    + ", ".join(
+                        f"{algorithm.name} {time:.2e}s"
+                        for algorithm, time in timings.items()
+                    )
+                )
+        crossovers[tolerance_type] = _get_crossovers(n_points_list, fastest_algorithms)
+
+    calibration_file = _save_calibration(crossovers, calibration_file)
+    if verbose:
+        print(f"Calibration saved to {calibration_file}")
+    return crossovers
+
+
+def main(args: _Optional[list[str]] = None) -> None:
+    """Run the calibration from the command line."""
+
+    parser = _argparse.ArgumentParser(
+        description="Calibrate the automatic selection of the geometric search "
+        "algorithms in BeamMe on this machine."
+    )
+    parser.add_argument(
+        "--calibration-file",
+        type=_Path,
+        default=None,
+        help="Path to the calibration file, per default the environment variable "
+        "BEAMME_GEOMETRIC_SEARCH_CALIBRATION or the user cache directory is used.",
+    )
+    parser.add_argument(
+        "--n-points",
+        type=int,
+        nargs="+",
+        default=None,
+        help="Numbers of points that are benchmarked.",
+    )
+    parser.add_argument(
+        "--n-repetitions",
+        type=int,
+        default=3,
+        help="Number of repetitions for each measurement.",
+    )
+    parsed_args = parser.parse_args(args)
+
+    kwargs = {}
+    if parsed_args.n_points is not None:
+        kwargs["n_points_list"] = parsed_args.n_points
+    calibrate_find_close_points(
+        n_repetitions=parsed_args.n_repetitions,
+        calibration_file=parsed_args.calibration_file,
+        verbose=True,
+        **kwargs,
+    )
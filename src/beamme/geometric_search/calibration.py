@@ -0,0 +1,198 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018-2025 BeamMe Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""This file implements the cache for the calibrated automatic selection of
+the find_close_points algorithm.
+
+The cache file contains the crossover points between the algorithms, i.e.,
+for each type of tolerance a list of `[n_points, algorithm_name]` entries,
+where the algorithm is the fastest one for point clouds with at least
+`n_points` points (and less than the number of points of the next entry).
+"""
+
+import json as _json
+import os as _os
+import platform as _platform
+import warnings as _warnings
+from pathlib import Path as _Path
+from typing import Optional as _Optional
+
+from beamme.utils.environment import get_env_variable as _get_env_variable
+
+# Version of the format of the calibration file.
+_CALIBRATION_VERSION = 1
+
+# The loaded calibration data for each file, with the modification time of the
+# file when it was loaded.
+_loaded_calibrations: dict[_Path, tuple[float, dict]] = {}
+
+# Calibration files that did not exist when they were loaded. The existence is
+# only checked once per process, since the calibration is loaded for every
+# automatic algorithm selection and usually no file exists.
+_missing_calibration_files: set[_Path] = set()
+
+
+def get_calibration_file() -> _Path:
+    """Return the path to the calibration file.
+
+    The path can be set with the environment variable
+    `BEAMME_GEOMETRIC_SEARCH_CALIBRATION`, e.g., to share a calibration
+    between the nodes of a cluster with the same hardware. Per default, the
+    file is stored in the user cache directory.
+    """
+
+    calibration_file = _get_env_variable(
+        "BEAMME_GEOMETRIC_SEARCH_CALIBRATION", default=None
+    )
+    if calibration_file is not None:
+        return _Path(calibration_file)
+    cache_directory = _get_env_variable(
+        "XDG_CACHE_HOME", default=_Path.home() / ".cache"
+    )
+    return _Path(cache_directory) / "beamme" / "geometric_search_calibration.json"
+
+
+def save_calibration(
+    crossovers: dict[str, list], calibration_file: _Optional[_Path] = None
+) -> _Path:
+    """Save the crossover points of the algorithms to the calibration file.
+
+    Args:
+        crossovers: For each type of tolerance, a list of
+            `[n_points, algorithm_name]` entries.
+        calibration_file: Path to the calibration file. Per default, the
+            path returned by `get_calibration_file` is used.
+
+    Returns:
+        The path to the calibration file.
+    """
+
+    if calibration_file is None:
+        calibration_file = get_calibration_file()
+    calibration_file = _Path(calibration_file)
+    calibration_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(calibration_file, "w") as file:
+        _json.dump(
+            {
+                "version": _CALIBRATION_VERSION,
+                "host": _platform.node(),
+                "machine": _platform.machine(),
+                "n_cpus": _os.cpu_count(),
+                "crossovers": crossovers,
+            },
+            file,
+            indent=2,
+        )
+    _loaded_calibrations.pop(calibration_file, None)
+    _missing_calibration_files.discard(calibration_file)
+    return calibration_file
+
+
+def load_calibration(
+    calibration_file: _Optional[_Path] = None,
+) -> _Optional[dict[str, list]]:
+    """Load the crossover points of the algorithms from the calibration file.
+
+    The data is only read again if the file was modified since the last
+    call. If the file does not exist, this is cached for the current
+    process, i.e., a calibration file that is created by another process
+    is only used after a restart.
+
+    Args:
+        calibration_file: Path to the calibration file. Per default, the
+            path returned by `get_calibration_file` is used.
+
+    Returns:
+        The crossover points for each type of tolerance, or None if no
+        (valid) calibration file exists.
+    """
+
+    if calibration_file is None:
+        calibration_file = get_calibration_file()
+    calibration_file = _Path(calibration_file)
+    if calibration_file in _missing_calibration_files:
+        return None
+    try:
+        modification_time = calibration_file.stat().st_mtime
+    except FileNotFoundError:
+        _missing_calibration_files.add(calibration_file)
+        return None
+
+    if calibration_file in _loaded_calibrations:
+        loaded_time, crossovers = _loaded_calibrations[calibration_file]
+        if loaded_time == modification_time:
+            return crossovers
+
+    # The calibration is loaded for every automatic algorithm selection, so
+    # an invalid file must not raise an error. A warning is only given once
+    # for each version of the file, since the result is cached.
+    try:
+        with open(calibration_file) as file:
+            data = _json.load(file)
+        if data.get("version") != _CALIBRATION_VERSION:
+            raise ValueError(f"Unsupported version {data.get('version')}")
+        crossovers = {
+            str(tolerance_type): [
+                [int(min_n_points), str(name)] for min_n_points, name in entries
+            ]
+            for tolerance_type, entries in data["crossovers"].items()
+        }
+    except (
+        OSError,
+        _json.JSONDecodeError,
+        KeyError,
+        TypeError,
+        ValueError,
+        AttributeError,
+    ) as error:
+        _warnings.warn(
+            f"The geometric search calibration file {calibration_file} could not "
+            f"be read ({error!r}), the default algorithm selection is used. "
+            "Run the calibration again to create a new file."
+        )
+        crossovers = None
+    _loaded_calibrations[calibration_file] = (modification_time, crossovers)
+    return crossovers
+
+
+def get_calibrated_algorithm_name(
+    crossovers: dict[str, list], n_points: int, tolerance_type: str
+) -> _Optional[str]:
+    """Return the name of the fastest algorithm from the crossover points.
+
+    Args:
+        crossovers: For each type of tolerance, a list of
+            `[n_points, algorithm_name]` entries.
+        n_points: Number of points in the point cloud.
+        tolerance_type: Type of the tolerance, i.e., "small_tolerance" or
+            "large_tolerance".
+
+    Returns:
+        The name of the fastest algorithm, or None if the calibration does
+        not contain data for the given tolerance type.
+    """
+
+    algorithm_name = None
+    for min_n_points, name in crossovers.get(tolerance_type, []):
+        if n_points < min_n_points:
+            break
+        algorithm_name = name
+    return algorithm_name
@@ -0,0 +1,209 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018-2025 BeamMe Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""This file implements an out-of-core search for close points, i.e., the
+point coordinates do not have to fit into memory at once."""
+
+import os as _os
+import tempfile as _tempfile
+
+import numpy as _np
+
+from beamme.geometric_search.connected_components import (
+    pairs_to_point_partners as _pairs_to_point_partners,
+)
+from beamme.geometric_search.connected_components import (
+    point_partners_to_pairs as _point_partners_to_pairs,
+)
+from beamme.geometric_search.find_close_points import (
+    find_close_points as _find_close_points,
+)
+
+# Number of histogram bins to find the slab boundaries.
+_N_HISTOGRAM_BINS = 4096
+
+
+def _iterate_blocks(point_coordinates, block_size: int):
+    """Iterate over blocks of an array like object.
+
+    The blocks are copies, i.e., they do not reference a memory map of the
+    coordinates.
+
+    Yields:
+        The index of the first point and the coordinates of the block.
+    """
+    for start in range(0, len(point_coordinates), block_size):
+        yield (
+            start,
+            _np.array(point_coordinates[start : start + block_size], dtype=float),
+        )
+
+
+def _write_blocks_to_file(blocks, file_path) -> _np.memmap:
+    """Write an iterable of coordinate blocks to a binary file and return a
+    memory map of the file."""
+
+    n_points = 0
+    n_dim = None
+    with open(file_path, "wb") as file:
+        for block in blocks:
+            block = _np.ascontiguousarray(block, dtype=float)
+            if n_dim is None:
+                n_dim = block.shape[1]
+            elif block.shape[1] != n_dim:
+                raise ValueError(
+                    "All coordinate blocks must have the same number of dimensions!"
+                )
+            block.tofile(file)
+            n_points += len(block)
+    if n_points == 0:
+        return _np.zeros((0, 0 if n_dim is None else n_dim))
+    return _np.memmap(file_path, dtype=float, mode="r", shape=(n_points, n_dim))
+
+
+def find_close_points_chunked(
+    point_coordinates,
+    *,
+    chunk_size: int = 10_000_000,
+    tol: float = 1e-8,
+    temporary_directory=None,
+    **kwargs,
+):
+    """Find close points in a point cloud that does not fit into memory.
+
+    The point cloud is split into slabs along the dimension with the largest
+    extent, such that each slab contains about `chunk_size` points. Each slab
+    is searched separately with `find_close_points` together with the points
+    of the next slabs that are within a halo of the slab boundary. The
+    cluster labels of all slabs are merged afterwards. The result is the
+    same as for a single call to `find_close_points`.
+
+    Only the points of one slab (and the indices of the points in each slab)
+    are in memory at once, the coordinates are read block wise from
+    `point_coordinates`. The indices of the points in each slab are stored
+    in temporary files.
+
+    Args:
+        point_coordinates: The point coordinates (n_points x n_dim). This
+            can be an array like object that supports slicing, e.g., a
+            `numpy.memmap` of a coordinate file, or an iterable of coordinate
+            blocks. The blocks of an iterable are written to a temporary
+            file first.
+        chunk_size: Approximate number of points in each slab. The coordinates
+            are also read in blocks of this size.
+        tol: Tolerance for the search, see `find_close_points`.
+        temporary_directory: Directory for the temporary files. Per default,
+            the default temporary directory of the system is used.
+        kwargs: Arguments passed on to `find_close_points`.
+
+    Returns:
+        has_partner: Array with the partner index of each point, see
+            `find_close_points`.
+        n_partner: Number of partners.
+    """
+
+    with _tempfile.TemporaryDirectory(dir=temporary_directory) as directory:
+        if not hasattr(point_coordinates, "shape"):
+            point_coordinates = _write_blocks_to_file(
+                point_coordinates, _os.path.join(directory, "coordinates.bin")
+            )
+        try:
+            n_points = len(point_coordinates)
+            if n_points == 0:
+                return _np.zeros(0, dtype=int), 0
+
+            # Get the dimension with the largest extent.
+            min_coordinates = _np.full(point_coordinates.shape[1], _np.inf)
+            max_coordinates = _np.full(point_coordinates.shape[1], -_np.inf)
+            for _, block in _iterate_blocks(point_coordinates, chunk_size):
+                _np.minimum(min_coordinates, block.min(axis=0), out=min_coordinates)
+                _np.maximum(max_coordinates, block.max(axis=0), out=max_coordinates)
+            slab_dim = _np.argmax(max_coordinates - min_coordinates)
+
+            # Get the slab boundaries from a histogram of the slab coordinates,
+            # such that the slabs have about the same number of points.
+            n_slabs = -(-n_points // chunk_size)
+            if n_slabs > 1 and max_coordinates[slab_dim] > min_coordinates[slab_dim]:
+                bin_edges = _np.linspace(
+                    min_coordinates[slab_dim],
+                    max_coordinates[slab_dim],
+                    _N_HISTOGRAM_BINS + 1,
+                )
+                histogram = _np.zeros(_N_HISTOGRAM_BINS, dtype=int)
+                for _, block in _iterate_blocks(point_coordinates, chunk_size):
+                    histogram += _np.histogram(block[:, slab_dim], bins=bin_edges)[0]
+                boundaries = _np.unique(
+                    bin_edges[
+                        1
+                        + _np.searchsorted(
+                            _np.cumsum(histogram),
+                            _np.arange(1, n_slabs) * n_points / n_slabs,
+                        )
+                    ]
+                )
+            else:
+                boundaries = _np.zeros(0)
+            n_slabs = len(boundaries) + 1
+
+            # Store the indices of the points of each slab in a temporary file. A
+            # point is also added to all previous slabs, if it is within the halo
+            # of their upper boundary. The halo is larger than the tolerance to
+            # account for rounding errors.
+            halo = 2.0 * tol
+            slab_files = [
+                _os.path.join(directory, f"slab_{i_slab}.bin")
+                for i_slab in range(n_slabs)
+            ]
+            for file_path in slab_files:
+                open(file_path, "wb").close()
+            for start, block in _iterate_blocks(point_coordinates, chunk_size):
+                slab_coordinates = block[:, slab_dim]
+                slab_ids = _np.searchsorted(boundaries, slab_coordinates, side="right")
+                halo_slab_ids = _np.searchsorted(
+                    boundaries, slab_coordinates - halo, side="left"
+                )
+                for i_slab in range(halo_slab_ids.min(), slab_ids.max() + 1):
+                    is_in_slab = (halo_slab_ids <= i_slab) & (i_slab <= slab_ids)
+                    with open(slab_files[i_slab], "ab") as file:
+                        (start + _np.flatnonzero(is_in_slab)).tofile(file)
+
+            # Search each slab and convert the clusters to pairs of the global
+            # point indices.
+            pairs = []
+            for file_path in slab_files:
+                point_indices = _np.fromfile(file_path, dtype=int)
+                if len(point_indices) < 2:
+                    continue
+                has_partner, _ = _find_close_points(
+                    _np.asarray(point_coordinates[point_indices], dtype=float),
+                    tol=tol,
+                    **kwargs,
+                )
+                pairs.append(point_indices[_point_partners_to_pairs(has_partner)])
+        finally:
+            # Files that are mapped to memory can not be deleted on Windows,
+            # so the memory map has to be released before the temporary
+            # directory is removed.
+            del point_coordinates
+
+    if len(pairs) == 0:
+        return _np.full(n_points, -1, dtype=int), 0
+    return _pairs_to_point_partners(_np.concatenate(pairs), n_points)
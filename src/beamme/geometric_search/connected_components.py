@@ -0,0 +1,118 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018-2025 BeamMe Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Find the connected components (clusters) of close points from a list of
+point pairs."""
+
+import numpy as _np
+from numpy.typing import NDArray as _NDArray
+
+
+def pairs_to_point_partners(pairs, n_points: int) -> tuple[_NDArray, int]:
+    """Get the clusters of points that are connected by the given pairs.
+
+    The clusters are the connected components of the graph defined by the
+    pairs, i.e., chains of pairs are combined to a single cluster, even if
+    the first and last point of the chain are not a pair. The components
+    are found with a vectorized union-find: In each iteration, the larger
+    root of each pair is hooked onto the smaller root, and the paths are
+    compressed afterwards by pointer jumping. Therefore, the root of each
+    cluster is its smallest point index and the result does not depend on
+    the order of the pairs.
+
+    Args:
+        pairs: Array with the index pairs of close points (n_pairs x 2).
+        n_points: Number of points.
+
+    Returns:
+        point_partners: Array with the cluster index of each point. A cluster
+            index of -1 means the point does not have a partner. The clusters
+            are numbered in the order of their first point.
+        n_partners: Number of clusters.
+    """
+
+    pairs = _np.asarray(pairs, dtype=int).reshape(-1, 2)
+    point_partners = _np.full(n_points, -1, dtype=int)
+    if len(pairs) == 0:
+        return point_partners, 0
+
+    parent = _np.arange(n_points)
+    first, second = pairs[:, 0], pairs[:, 1]
+    while True:
+        # Pairs where both points are already in the same cluster stay in the
+        # same cluster, so they are not considered anymore.
+        root_first = parent[first]
+        root_second = parent[second]
+        is_different = root_first != root_second
+        if not _np.any(is_different):
+            break
+        first = first[is_different]
+        second = second[is_different]
+        root_first = root_first[is_different]
+        root_second = root_second[is_different]
+
+        # Hook the larger root onto the smaller one. If a root is hooked onto
+        # multiple roots, the smallest one is used, the other pairs are
+        # processed in the next iteration.
+        _np.minimum.at(
+            parent,
+            _np.maximum(root_first, root_second),
+            _np.minimum(root_first, root_second),
+        )
+
+        # Pointer jumping until all points directly point to their root.
+        while True:
+            grand_parent = parent[parent]
+            if _np.array_equal(grand_parent, parent):
+                break
+            parent = grand_parent
+
+    # Number the clusters (with more than one point) by their root.
+    has_partner = _np.bincount(parent, minlength=n_points)[parent] > 1
+    roots, point_partners[has_partner] = _np.unique(
+        parent[has_partner], return_inverse=True
+    )
+    return point_partners, len(roots)
+
+
+def point_partners_to_pairs(point_partners) -> _NDArray:
+    """Get pairs of point indices that represent the given clusters.
+
+    Each point of a cluster is paired with the first point of the cluster,
+    i.e., `pairs_to_point_partners` of the returned pairs gives the same
+    clusters.
+
+    Args:
+        point_partners: Array with the cluster index of each point, see
+            `pairs_to_point_partners`.
+
+    Returns:
+        Array with the index pairs (n_pairs x 2). The first point of each
+        cluster is also paired with itself.
+    """
+
+    point_partners = _np.asarray(point_partners, dtype=int)
+    partner_indices = _np.flatnonzero(point_partners != -1)
+    _, first_indices = _np.unique(point_partners[partner_indices], return_index=True)
+    first_indices = partner_indices[first_indices]
+    return _np.stack(
+        [first_indices[point_partners[partner_indices]], partner_indices], axis=1
+    )
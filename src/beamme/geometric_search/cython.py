@@ -22,13 +22,23 @@
 """This file defines the interface to the Cython geometric search
 functionality."""
 
+import os as _os
 import warnings as _warnings
 
+import numpy as _np
+
+from beamme.geometric_search.connected_components import (
+    pairs_to_point_partners as _pairs_to_point_partners,
+)
+from beamme.geometric_search.spatial_hash import SpatialHashGrid as _SpatialHashGrid
 from beamme.geometric_search.utils import cython_is_available as _cython_is_available
 
 if _cython_is_available():
     from beamme.geometric_search.cython_lib import (
-        find_close_points as _find_close_points,
+        find_close_point_pairs as _find_close_point_pairs,
+    )
+    from beamme.geometric_search.cython_lib import (
+        find_close_point_pairs_grid as _find_close_point_pairs_grid,
     )
 
 
@@ -43,7 +53,61 @@ def find_close_points_brute_force_cython(
                 "The function find_close_points is called with the brute force algorithm "
                 + f"with {n_points} points, for performance reasons other algorithms should be used!"
             )
-        return _find_close_points(point_coordinates, tol)
+        return _pairs_to_point_partners(
+            _find_close_point_pairs(point_coordinates, tol), n_points
+        )
+    else:
+        raise ModuleNotFoundError(
+            "Cython geometric search functionality is not available"
+        )
+
+
+def get_n_available_cpus() -> int:
+    """Return the number of CPUs that this process can run on.
+
+    This respects CPU affinity restrictions, e.g., on clusters or in
+    containers, if they can be queried on this platform.
+    """
+    if hasattr(_os, "sched_getaffinity"):
+        return len(_os.sched_getaffinity(0))
+    return _os.cpu_count() or 1
+
+
+def find_close_points_binning_cython(point_coordinates, tol, *, n_threads=None):
+    """Call the multithreaded Cython implementation of find close_points.
+
+    The points are sorted into a spatial hash grid and the neighboring
+    cells are checked in parallel with OpenMP.
+
+    Args:
+        point_coordinates: Coordinates of the points (n_points x n_dim).
+        tol: Search tolerance.
+        n_threads: Number of OpenMP threads. Per default, all available
+            CPUs are used.
+    """
+    if _cython_is_available():
+        point_coordinates = _np.asarray(point_coordinates, dtype=float)
+        n_points = len(point_coordinates)
+        if n_points == 0:
+            return _pairs_to_point_partners(_np.zeros((0, 2), dtype=int), 0)
+        if n_threads is None:
+            n_threads = get_n_available_cpus()
+
+        grid = _SpatialHashGrid(point_coordinates, tol)
+        pairs = _find_close_point_pairs_grid(
+            point_coordinates,
+            tol,
+            grid.sort_indices,
+            grid.cells,
+            grid.near_faces,
+            grid.keys,
+            grid.cell_keys,
+            _np.append(grid.cell_starts, n_points),
+            grid.get_neighbor_offsets(),
+            grid.hash_factors,
+            n_threads,
+        )
+        return _pairs_to_point_partners(pairs, n_points)
     else:
         raise ModuleNotFoundError(
             "Cython geometric search functionality is not available"
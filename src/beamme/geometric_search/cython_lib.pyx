@@ -27,6 +27,7 @@ It uses cython to gain performance.
 
 
 import numpy as np
+from cython.parallel cimport prange
 from libc.math cimport sqrt
 
 cimport cython
@@ -34,9 +35,9 @@ cimport numpy as np
 
 @cython.boundscheck(False) # Deactivate checking bounds of arrays.
 @cython.wraparound(False)  # Deactivate negative indexing.
-def find_close_points(np.ndarray[double, ndim=2] coords, double eps):
+def find_close_point_pairs(np.ndarray[double, ndim=2] coords, double eps):
     """
-    Finds coordinates that are within a tolerance of each other.
+    Finds all pairs of coordinates that are within a tolerance of each other.
 
     Args
     ----
@@ -47,50 +48,260 @@ def find_close_points(np.ndarray[double, ndim=2] coords, double eps):
 
     Return
     ----
-    has_partner: numpy array
-        An array with integers, marking the set a node is part of. -1 means the
-        node does not have a partner.
-    partner: int
-        Number of clusters found.
+    pairs: numpy array
+        Array with the index pairs (i, j) of close points, with i < j.
     """
 
     # Define types of variables for this function.
-    cdef np.int64_t n_nodes, partner, this_is_partner, i, j, k, n_dim
+    cdef np.int64_t n_nodes, n_pairs, i, j, k, n_dim
     cdef double distance
 
     # Number of nodes and dimension of coordinates.
     n_nodes = np.shape(coords)[0]
     n_dim = np.shape(coords)[1]
 
-    # This vector is -1 if a node does not belong to a pair, otherwise it is
-    # the number of the pair.
-    cdef np.ndarray[np.int64_t, ndim=1] has_partner = (
-        np.zeros(n_nodes, dtype=np.int64) - 1)
+    # Array for the pairs, it is enlarged if required.
+    cdef np.ndarray[np.int64_t, ndim=2] pairs = np.zeros(
+        (max(n_nodes, 1), 2), dtype=np.int64)
+    n_pairs = 0
 
     # Loop over nodes.
-    partner = 0
     for i in range(n_nodes):
-        this_is_partner = 0
-        if has_partner[i] == -1:
-            for j in range(i + 1, n_nodes):
-                # Calculate the distance between the two nodes.
-                distance = 0.
-                for k in range(n_dim):
-                    distance += (coords[i, k] - coords[j, k])**2
-                distance = sqrt(distance)
-                # Check if the distance is smaller than the threshold, and add
-                # to has_partner list.
-                if distance < eps:
-                    this_is_partner = 1
-                    if not has_partner[j] == -1:
-                        raise RuntimeError('The case where a node connects two'
-                            ' other nodes that are more than eps apart is not'
-                            ' yet implemented. Check if the value for eps'
-                            ' makes physical sense!')
-                    has_partner[j] = partner
-            # If this one has a partner set this node too.
-            if this_is_partner == 1:
-                has_partner[i] = partner
-                partner += 1
-
-    return has_partner, partner
+        for j in range(i + 1, n_nodes):
+            # Calculate the distance between the two nodes.
+            distance = 0.
+            for k in range(n_dim):
+                distance += (coords[i, k] - coords[j, k])**2
+            distance = sqrt(distance)
+            # Check if the distance is smaller than or equal to the
+            # threshold, and add the pair.
+            if distance <= eps:
+                if n_pairs == pairs.shape[0]:
+                    pairs = np.concatenate((pairs, np.zeros_like(pairs)))
+                pairs[n_pairs, 0] = i
+                pairs[n_pairs, 1] = j
+                n_pairs += 1
+
+    return pairs[:n_pairs]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef np.int64_t _find_cell(
+        np.int64_t key, const np.int64_t[::1] cell_keys) noexcept nogil:
+    """
+    Return the index of the cell with the given key in the sorted cell keys, or
+    -1 if there is no such cell.
+    """
+
+    cdef np.int64_t lower = 0
+    cdef np.int64_t upper = cell_keys.shape[0]
+    cdef np.int64_t middle
+    while lower < upper:
+        middle = (lower + upper) // 2
+        if cell_keys[middle] < key:
+            lower = middle + 1
+        else:
+            upper = middle
+    if lower < cell_keys.shape[0] and cell_keys[lower] == key:
+        return lower
+    return -1
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef np.int64_t _check_points(
+        np.int64_t i,
+        np.int64_t start,
+        np.int64_t end,
+        const double[:, ::1] coords,
+        double eps,
+        const np.int64_t[::1] sort_indices,
+        np.int64_t[:, ::1] pairs,
+        np.int64_t i_pair,
+        bint write_pairs) noexcept nogil:
+    """
+    Check the distance between point i and the sorted points in the range
+    [start, end).
+
+    Return
+    ----
+    n_pairs: int
+        Number of close points. If write_pairs is True, the pairs are written
+        to the pairs array starting at i_pair.
+    """
+
+    cdef np.int64_t j, k, position
+    cdef np.int64_t n_pairs = 0
+    cdef double distance
+
+    for position in range(start, end):
+        j = sort_indices[position]
+        distance = 0.
+        for k in range(coords.shape[1]):
+            distance += (coords[i, k] - coords[j, k])**2
+        distance = sqrt(distance)
+        if distance <= eps:
+            if write_pairs:
+                pairs[i_pair + n_pairs, 0] = min(i, j)
+                pairs[i_pair + n_pairs, 1] = max(i, j)
+            n_pairs += 1
+    return n_pairs
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef np.int64_t _grid_point_pairs(
+        np.int64_t position,
+        const double[:, ::1] coords,
+        double eps,
+        const np.int64_t[::1] sort_indices,
+        const np.int64_t[:, ::1] cells,
+        const np.int8_t[:, ::1] near_faces,
+        const np.int64_t[::1] keys,
+        const np.int64_t[::1] cell_keys,
+        const np.int64_t[::1] cell_offsets,
+        const np.int64_t[:, ::1] neighbor_offsets,
+        const np.int64_t[::1] hash_factors,
+        np.int64_t[:, ::1] pairs,
+        np.int64_t i_pair,
+        bint write_pairs) noexcept nogil:
+    """
+    Find the partners of the point at the given position in the sorted
+    points.
+
+    Within the same cell, only the following points are checked. The
+    neighbor offsets are half of the neighboring cells, the pairs with the
+    other half of the neighbors are found from the partner points. Neighboring
+    cells are only checked if the point is close to the corresponding cell
+    faces.
+
+    Return
+    ----
+    n_pairs: int
+        Number of pairs found for this point. If write_pairs is True, the
+        pairs are written to the pairs array starting at i_pair.
+    """
+
+    cdef np.int64_t i, k, l, cell, offset
+    cdef np.uint64_t key
+    cdef np.int64_t n_pairs
+    cdef bint is_near
+
+    i = sort_indices[position]
+    cell = _find_cell(keys[position], cell_keys)
+    n_pairs = _check_points(i, position + 1, cell_offsets[cell + 1], coords,
+        eps, sort_indices, pairs, i_pair, write_pairs)
+
+    for k in range(neighbor_offsets.shape[0]):
+        # Get the hash key of the neighbor cell, the unsigned integer results
+        # in the same overflow behavior as the NumPy implementation.
+        is_near = True
+        key = 0
+        for l in range(cells.shape[1]):
+            offset = neighbor_offsets[k, l]
+            if (offset == -1 and not near_faces[position, l] & 1) or (
+                    offset == 1 and not near_faces[position, l] & 2):
+                is_near = False
+                break
+            key += <np.uint64_t>(cells[position, l] + offset) * (
+                <np.uint64_t>hash_factors[l])
+        if not is_near or <np.int64_t>key == keys[position]:
+            continue
+
+        cell = _find_cell(<np.int64_t>key, cell_keys)
+        if cell != -1:
+            n_pairs += _check_points(i, cell_offsets[cell],
+                cell_offsets[cell + 1], coords, eps, sort_indices, pairs,
+                i_pair + n_pairs, write_pairs)
+
+    return n_pairs
+
+
+@cython.boundscheck(False) # Deactivate checking bounds of arrays.
+@cython.wraparound(False)  # Deactivate negative indexing.
+def find_close_point_pairs_grid(
+        np.ndarray[double, ndim=2] coords,
+        double eps,
+        np.ndarray[np.int64_t, ndim=1] sort_indices,
+        np.ndarray[np.int64_t, ndim=2] cells,
+        np.ndarray[np.int8_t, ndim=2] near_faces,
+        np.ndarray[np.int64_t, ndim=1] keys,
+        np.ndarray[np.int64_t, ndim=1] cell_keys,
+        np.ndarray[np.int64_t, ndim=1] cell_offsets,
+        np.ndarray[np.int64_t, ndim=2] neighbor_offsets,
+        np.ndarray[np.int64_t, ndim=1] hash_factors,
+        int n_threads):
+    """
+    Finds all pairs of coordinates that are within a tolerance of each other.
+
+    The points have to be sorted by the cells of a spatial hash grid, see
+    SpatialHashGrid in the spatial_hash module. The points are processed in
+    parallel with OpenMP.
+
+    Args
+    ----
+    coords: numpy array
+        Array with the coordinates of the nodes.
+    eps: float
+        Tolerance to look for neighbors.
+    sort_indices, cells, near_faces, keys:
+        Point data of the grid, in the order of the sorted points.
+    cell_keys: numpy array
+        Sorted hash keys of the cells.
+    cell_offsets: numpy array
+        The sorted points in cell i are in the range
+        [cell_offsets[i], cell_offsets[i + 1]).
+    neighbor_offsets: numpy array
+        Half of the offsets to the neighboring cells.
+    hash_factors: numpy array
+        Factors to combine the cell indices to a hash key.
+    n_threads: int
+        Number of OpenMP threads.
+
+    Return
+    ----
+    pairs: numpy array
+        Array with the index pairs (i, j) of close points, with i < j.
+    """
+
+    cdef np.int64_t n_nodes, position
+
+    n_nodes = np.shape(coords)[0]
+    cdef const double[:, ::1] coords_view = np.ascontiguousarray(coords)
+    cdef const np.int64_t[::1] sort_indices_view = sort_indices
+    cdef const np.int64_t[:, ::1] cells_view = np.ascontiguousarray(cells)
+    cdef const np.int8_t[:, ::1] near_faces_view = np.ascontiguousarray(
+        near_faces)
+    cdef const np.int64_t[::1] keys_view = keys
+    cdef const np.int64_t[::1] cell_keys_view = cell_keys
+    cdef const np.int64_t[::1] cell_offsets_view = cell_offsets
+    cdef const np.int64_t[:, ::1] neighbor_offsets_view = (
+        np.ascontiguousarray(neighbor_offsets))
+    cdef const np.int64_t[::1] hash_factors_view = hash_factors
+
+    # Count the pairs for each point first, so the pairs can be written in
+    # parallel to the final array.
+    pair_counts_array = np.zeros(n_nodes, dtype=np.int64)
+    cdef np.int64_t[::1] pair_counts = pair_counts_array
+    cdef np.int64_t[:, ::1] pairs = np.zeros((0, 2), dtype=np.int64)
+    for position in prange(n_nodes, nogil=True, num_threads=n_threads):
+        pair_counts[position] = _grid_point_pairs(
+            position, coords_view, eps, sort_indices_view, cells_view,
+            near_faces_view, keys_view, cell_keys_view, cell_offsets_view,
+            neighbor_offsets_view, hash_factors_view, pairs, 0, False)
+
+    pair_offsets_array = np.zeros(n_nodes + 1, dtype=np.int64)
+    np.cumsum(pair_counts_array, out=pair_offsets_array[1:])
+    cdef np.int64_t[::1] pair_offsets = pair_offsets_array
+    pairs_array = np.zeros((pair_offsets_array[n_nodes], 2), dtype=np.int64)
+    pairs = pairs_array
+    for position in prange(n_nodes, nogil=True, num_threads=n_threads):
+        if pair_counts[position] > 0:
+            _grid_point_pairs(
+                position, coords_view, eps, sort_indices_view, cells_view,
+                near_faces_view, keys_view, cell_keys_view, cell_offsets_view,
+                neighbor_offsets_view, hash_factors_view, pairs,
+                pair_offsets[position], True)
+
+    return pairs_array
@@ -24,14 +24,41 @@ tolerance of each other will be considered as unique."""
 
 from enum import Enum as _Enum
 from enum import auto as _auto
+from itertools import chain as _chain
 
+import numpy as _np
+
+from beamme.geometric_search.calibration import (
+    get_calibrated_algorithm_name as _get_calibrated_algorithm_name,
+)
+from beamme.geometric_search.calibration import load_calibration as _load_calibration
+from beamme.geometric_search.connected_components import (
+    pairs_to_point_partners as _pairs_to_point_partners,
+)
+from beamme.geometric_search.connected_components import (
+    point_partners_to_pairs as _point_partners_to_pairs,
+)
+from beamme.geometric_search.periodic import get_periodic_images as _get_periodic_images
+from beamme.geometric_search.periodic import get_periods as _get_periods
+from beamme.geometric_search.periodic import (
+    wrap_periodic_coordinates as _wrap_periodic_coordinates,
+)
 from beamme.geometric_search.scipy import (
     find_close_points_scipy as _find_close_points_scipy,
 )
+from beamme.geometric_search.spatial_hash import (
+    estimate_point_spacing as _estimate_point_spacing,
+)
+from beamme.geometric_search.spatial_hash import (
+    find_close_points_spatial_hash_numpy as _find_close_points_spatial_hash_numpy,
+)
 from beamme.geometric_search.utils import arborx_is_available as _arborx_is_available
 from beamme.geometric_search.utils import cython_is_available as _cython_is_available
 
 if _cython_is_available():
+    from beamme.geometric_search.cython import (
+        find_close_points_binning_cython as _find_close_points_binning_cython,
+    )
     from beamme.geometric_search.cython import (
         find_close_points_brute_force_cython as _find_close_points_brute_force_cython,
     )
@@ -48,6 +75,66 @@ class FindClosePointAlgorithm(_Enum):
     kd_tree_scipy = _auto()
     brute_force_cython = _auto()
     boundary_volume_hierarchy_arborx = _auto()
+    spatial_hash_numpy = _auto()
+    binning_cython = _auto()
+
+
+def get_available_algorithms() -> list[FindClosePointAlgorithm]:
+    """Return the find_close_point algorithms that are available in the
+    current installation."""
+
+    algorithms = [
+        FindClosePointAlgorithm.kd_tree_scipy,
+        FindClosePointAlgorithm.spatial_hash_numpy,
+    ]
+    if _cython_is_available():
+        algorithms.extend(
+            [
+                FindClosePointAlgorithm.brute_force_cython,
+                FindClosePointAlgorithm.binning_cython,
+            ]
+        )
+    if _arborx_is_available():
+        algorithms.append(FindClosePointAlgorithm.boundary_volume_hierarchy_arborx)
+    return algorithms
+
+
+def get_tolerance_type(point_coordinates, tol) -> str:
+    """Return the type of the tolerance for the automatic algorithm selection.
+
+    Returns:
+        "small_tolerance" if the tolerance is small compared to the estimated
+        point spacing, e.g., for merging coincident nodes, otherwise
+        "large_tolerance".
+    """
+    if tol < 0.1 * _estimate_point_spacing(point_coordinates, tol):
+        return "small_tolerance"
+    return "large_tolerance"
+
+
+def _get_calibrated_algorithm(point_coordinates, tol):
+    """Return the fastest algorithm according to the calibration file, see
+    `beamme.geometric_search.benchmark`.
+
+    Returns:
+        The algorithm, or None if there is no calibration or the calibrated
+        algorithm is not available.
+    """
+
+    crossovers = _load_calibration()
+    if not crossovers or not any(crossovers.values()):
+        # The tolerance type requires an estimate of the point spacing, so it
+        # is only computed if the calibration contains data.
+        return None
+    algorithm_name = _get_calibrated_algorithm_name(
+        crossovers, len(point_coordinates), get_tolerance_type(point_coordinates, tol)
+    )
+    if algorithm_name not in FindClosePointAlgorithm.__members__:
+        return None
+    algorithm = FindClosePointAlgorithm[algorithm_name]
+    if algorithm not in get_available_algorithms():
+        return None
+    return algorithm
 
 
 def point_partners_to_unique_indices(point_partners):
@@ -62,55 +149,64 @@ def point_partners_to_unique_indices(point_partners):
         Indices of the unique array that can be used to reconstruct of the original points coordinates.
     """
 
-    unique_indices = []
-    inverse_indices = [-1 for i in range(len(point_partners))]
-    partner_id_to_unique_map = {}
-    i_partner = 0
-    for i_point, partner_index in enumerate(point_partners):
-        if partner_index == -1:
-            # This point does not have any partners, i.e., it is already a unique point.
-            unique_indices.append(i_point)
-            my_inverse_index = len(unique_indices) - 1
-        elif partner_index == i_partner:
-            # This point has partners and this is the first time that this partner index
-            # appears in the input list.
-            unique_indices.append(i_point)
-            my_inverse_index = len(unique_indices) - 1
-            partner_id_to_unique_map[partner_index] = my_inverse_index
-            i_partner += 1
-        elif partner_index < i_partner:
-            # This point has partners and the partner index has been previously found.
-            my_inverse_index = partner_id_to_unique_map[partner_index]
-        else:
-            raise ValueError(
-                "This should not happen, as the partners should be provided in order"
-            )
-        inverse_indices[i_point] = my_inverse_index
+    point_partners = _np.asarray(point_partners, dtype=int).reshape(-1)
+    has_partner = point_partners != -1
 
-    return unique_indices, inverse_indices
+    # The first point of each cluster represents the cluster in the unique
+    # points.
+    partner_ids, first_indices = _np.unique(
+        point_partners[has_partner], return_index=True
+    )
+    first_indices = _np.flatnonzero(has_partner)[first_indices]
+    if not (
+        _np.array_equal(partner_ids, _np.arange(len(partner_ids)))
+        and _np.all(_np.diff(first_indices) > 0)
+    ):
+        raise ValueError(
+            "This should not happen, as the partners should be provided in order"
+        )
+    is_unique = ~has_partner
+    is_unique[first_indices] = True
+
+    unique_indices = _np.flatnonzero(is_unique)
+    inverse_indices = _np.cumsum(is_unique) - 1
+    inverse_indices[has_partner] = inverse_indices[
+        first_indices[point_partners[has_partner]]
+    ]
+    return unique_indices.tolist(), inverse_indices.tolist()
 
 
 def point_partners_to_partner_indices(point_partners, n_partners):
     """Convert the partner indices for each point to a list of lists with the
     indices for all partners."""
-    partner_indices = [[] for i in range(n_partners)]
-    for i, partner_index in enumerate(point_partners):
-        if partner_index != -1:
-            partner_indices[partner_index].append(i)
-    return partner_indices
+    point_partners = _np.asarray(point_partners, dtype=int).reshape(-1)
+    point_indices = _np.flatnonzero(point_partners != -1)
+    partners = point_partners[point_indices]
+    point_indices = point_indices[_np.argsort(partners, kind="stable")].tolist()
+    offsets = _np.zeros(n_partners + 1, dtype=int)
+    _np.cumsum(_np.bincount(partners, minlength=n_partners), out=offsets[1:])
+    offsets = offsets.tolist()
+    return [point_indices[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
 
 
 def partner_indices_to_point_partners(partner_indices, n_points):
     """Convert the list of lists with the indices for all partners to the
     partner indices for each point."""
-    point_partners = [-1 for _i in range(n_points)]
-    for i_partner, partners in enumerate(partner_indices):
-        for index in partners:
-            point_partners[index] = i_partner
-    return point_partners, len(partner_indices)
+    n_points_per_partner = list(map(len, partner_indices))
+    point_partners = _np.full(n_points, -1, dtype=int)
+    point_partners[
+        _np.fromiter(
+            _chain.from_iterable(partner_indices),
+            dtype=int,
+            count=sum(n_points_per_partner),
+        )
+    ] = _np.repeat(_np.arange(len(partner_indices)), n_points_per_partner)
+    return point_partners.tolist(), len(partner_indices)
 
 
-def find_close_points(point_coordinates, *, algorithm=None, tol=1e-8, **kwargs):
+def find_close_points(
+    point_coordinates, *, algorithm=None, tol=1e-8, periods=None, **kwargs
+):
     """Find unique points in a point cloud, i.e., points that are within a
     certain tolerance of each other will be considered as unique.
 
@@ -120,13 +216,28 @@ def find_close_points(point_coordinates, *, algorithm=None, tol=1e-8, **kwargs):
         Point coordinates that are checked for partners. The number of spatial dimensions
         does not have to be equal to 3.
     algorithm: FindClosePointAlgorithm
-        Type of geometric search algorithm that should be used.
+        Type of geometric search algorithm that should be used. Per default,
+        the fastest algorithm is chosen, either from the calibration of the
+        algorithms on this machine (see `beamme.geometric_search.benchmark`)
+        or with fixed rules.
     n_bins: list(int)
         Number of bins in the first three dimensions.
+    n_threads: int
+        Number of OpenMP threads for the binning_cython algorithm, per default
+        all available CPUs are used.
     tol: float
-        If the absolute distance between two points is smaller than tol, they
-        are considered to be equal, i.e., tol is the hyper sphere radius that
+        If the absolute distance between two points is smaller than or equal
+        to tol, they are considered to be equal (for all algorithms), i.e., tol
+        is the hyper sphere radius that
         the point coordinates have to be within, to be identified as overlapping.
+    periods: list(float)
+        Period of each dimension, i.e., the edge lengths of a periodic box. A
+        period of None or 0 means that the dimension is not periodic. If
+        periods are given, points are also partners if they are close across
+        the periodic boundaries, e.g., for periodic couplings of
+        representative volume elements. The KD-tree is created for the
+        periodic box directly, the other algorithms search the points
+        together with the images of the points close to the box boundaries.
 
     Return
     ----
@@ -139,6 +250,10 @@ def find_close_points(point_coordinates, *, algorithm=None, tol=1e-8, **kwargs):
 
     n_points = len(point_coordinates)
 
+    if algorithm is None:
+        # If the algorithms were calibrated on this machine, use the fastest one
+        algorithm = _get_calibrated_algorithm(point_coordinates, tol)
+
     if algorithm is None:
         # Decide which algorithm to use
         if n_points < 200 and _cython_is_available():
@@ -147,11 +262,38 @@ def find_close_points(point_coordinates, *, algorithm=None, tol=1e-8, **kwargs):
         elif _arborx_is_available():
             # For general problems with n_points > 200 the ArborX implementation is the fastest one
             algorithm = FindClosePointAlgorithm.boundary_volume_hierarchy_arborx
+        elif (
+            n_points >= 2000
+            and get_tolerance_type(point_coordinates, tol) == "small_tolerance"
+        ):
+            # If the tolerance is small compared to the point spacing, e.g., for
+            # merging coincident nodes, the spatial hashing is faster than the
+            # scipy implementation by a factor of about 2 to 3
+            algorithm = FindClosePointAlgorithm.spatial_hash_numpy
         else:
             # The scipy implementation is slower than ArborX by a factor of about 2, but is scales
             # the same
             algorithm = FindClosePointAlgorithm.kd_tree_scipy
 
+    if periods is not None:
+        periods = _get_periods(periods, _np.shape(point_coordinates)[1], tol)
+        point_coordinates = _wrap_periodic_coordinates(point_coordinates, periods)
+        if algorithm is FindClosePointAlgorithm.kd_tree_scipy:
+            kwargs["periods"] = periods
+        else:
+            # Search the points together with their periodic images and map
+            # the clusters back to the original points. The halo is larger
+            # than the tolerance to account for rounding errors.
+            image_coordinates, point_indices = _get_periodic_images(
+                point_coordinates, periods, 2.0 * tol
+            )
+            has_partner, _ = find_close_points(
+                image_coordinates, algorithm=algorithm, tol=tol, **kwargs
+            )
+            return _pairs_to_point_partners(
+                point_indices[_point_partners_to_pairs(has_partner)], n_points
+            )
+
     # Get list of closest pairs
     if algorithm is FindClosePointAlgorithm.kd_tree_scipy:
         has_partner, n_partner = _find_close_points_scipy(
@@ -165,7 +307,89 @@ def find_close_points(point_coordinates, *, algorithm=None, tol=1e-8, **kwargs):
         has_partner, n_partner = _find_close_points_arborx(
             point_coordinates, tol, **kwargs
         )
+    elif algorithm is FindClosePointAlgorithm.binning_cython:
+        has_partner, n_partner = _find_close_points_binning_cython(
+            point_coordinates, tol, **kwargs
+        )
+    elif algorithm is FindClosePointAlgorithm.spatial_hash_numpy:
+        has_partner, n_partner = _find_close_points_spatial_hash_numpy(
+            point_coordinates, tol, **kwargs
+        )
     else:
         raise TypeError(f"Got unexpected algorithm {algorithm}")
 
     return has_partner, n_partner
+
+
+def find_close_points_segmented(
+    point_coordinates, segment_offsets, *, algorithm=None, tol=1e-8, **kwargs
+):
+    """Find close points in multiple independent point clouds (segments)
+    with a single search.
+
+    The points of all segments are stored in a single array and only points
+    within the same segment can be partners. Internally, the index of the
+    segment is added as an additional coordinate, with a distance between
+    the segments that is larger than the tolerance, and a single call to
+    `find_close_points` is performed. This avoids the overhead of many
+    calls for small point clouds.
+
+    Args
+    ----
+    point_coordinates: _np.array(n_points x n_dim)
+        Point coordinates of all segments.
+    segment_offsets: _np.array(int)
+        The points of segment i are
+        `point_coordinates[segment_offsets[i]:segment_offsets[i + 1]]`, i.e.,
+        the first entry has to be 0 and the last one n_points.
+    algorithm, tol, kwargs:
+        See `find_close_points`.
+
+    Return
+    ----
+    has_partner: array(int)
+        An array with integers, marking the partner index of each point
+        within its segment. The partner indices of each segment start at 0,
+        i.e., they are the same as for separate calls of `find_close_points`
+        for each segment. A partner index of -1 means the node does not have
+        a partner.
+    n_partners: array(int)
+        Number of partner indices in each segment.
+    """
+
+    point_coordinates = _np.asarray(point_coordinates, dtype=float)
+    n_points = len(point_coordinates)
+    segment_offsets = _np.asarray(segment_offsets, dtype=int)
+    n_segments = len(segment_offsets) - 1
+    if (
+        n_segments < 0
+        or segment_offsets[0] != 0
+        or segment_offsets[-1] != n_points
+        or _np.any(_np.diff(segment_offsets) < 0)
+    ):
+        raise ValueError(
+            "The segment offsets have to start with 0, end with the number of "
+            "points and be non-decreasing!"
+        )
+    segment_ids = _np.repeat(_np.arange(n_segments), _np.diff(segment_offsets))
+
+    # Search all segments at once, the additional coordinate separates the
+    # segments.
+    segmented_coordinates = _np.empty((n_points, point_coordinates.shape[1] + 1))
+    segmented_coordinates[:, :-1] = point_coordinates
+    segmented_coordinates[:, -1] = segment_ids * max(3.0 * tol, 1.0)
+    has_partner, n_partner = find_close_points(
+        segmented_coordinates, algorithm=algorithm, tol=tol, **kwargs
+    )
+
+    # The partners are numbered in the order of their first point, so the
+    # partners of each segment are consecutive.
+    has_partner = _np.array(has_partner, dtype=int)
+    is_partner = has_partner != -1
+    partner_segments = _np.zeros(n_partner, dtype=int)
+    partner_segments[has_partner[is_partner]] = segment_ids[is_partner]
+    n_partners = _np.bincount(partner_segments, minlength=n_segments)
+    has_partner[is_partner] -= (_np.cumsum(n_partners) - n_partners)[
+        segment_ids[is_partner]
+    ]
+    return has_partner, n_partners
@@ -0,0 +1,125 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018-2025 BeamMe Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""This file implements an incremental search for close points, i.e., points
+can be added to the search structure step by step."""
+
+import itertools as _itertools
+
+import numpy as _np
+from numpy.typing import NDArray as _NDArray
+
+from beamme.geometric_search.spatial_hash import get_cell_keys as _get_cell_keys
+
+
+class IncrementalClosePointSearch:
+    """Search structure that finds close points while points are added.
+
+    The points are stored in a spatial hash with a cell size equal to the
+    search tolerance, i.e., all partners of a point are in the same or
+    in a neighboring cell. Adding points only requires to query and
+    insert the new points.
+    """
+
+    def __init__(self, *, tol: float = 1e-8):
+        """Initialize the empty search structure.
+
+        Args:
+            tol: If the absolute distance between two points is smaller than
+                or equal to tol, they are considered to be equal.
+        """
+
+        self.tol = tol
+        self.n_points = 0
+        self._coordinates = _np.zeros((0, 3))
+        self._cells: dict[int, list[int]] = {}
+        self._neighbor_offsets = _np.array(
+            list(_itertools.product([-1, 0, 1], repeat=3)), dtype=_np.int64
+        )
+
+    def add_points(self, point_coordinates: _NDArray) -> _NDArray:
+        """Add points to the search structure and return the pairs of close
+        points that contain at least one of the added points.
+
+        Args:
+            point_coordinates: Coordinates of the added points
+                (n_points x n_dim) with n_dim <= 3. The added points get
+                the indices following the already added points.
+
+        Returns:
+            Array with the pairs of close points (n_pairs x 2). The second
+            index of each pair is one of the added points and the first
+            index is smaller than the second one.
+        """
+
+        point_coordinates = _np.asarray(point_coordinates, dtype=float)
+        n_new_points, n_dim = point_coordinates.shape
+        if n_dim > 3:
+            raise ValueError(f"Expected at most 3 spatial dimensions, got {n_dim}")
+        new_coordinates = _np.zeros((n_new_points, 3))
+        new_coordinates[:, :n_dim] = point_coordinates
+
+        # The coordinate array grows geometrically, so adding points has
+        # amortized constant cost per point.
+        n_points_total = self.n_points + n_new_points
+        if n_points_total > len(self._coordinates):
+            coordinates = _np.zeros(
+                (max(n_points_total, 2 * len(self._coordinates)), 3)
+            )
+            coordinates[: self.n_points] = self._coordinates[: self.n_points]
+            self._coordinates = coordinates
+        self._coordinates[self.n_points : n_points_total] = new_coordinates
+
+        # Get the hash keys of the cells of the new points and their
+        # neighbors.
+        cells = _np.floor(new_coordinates / self.tol).astype(_np.int64)
+        keys = _get_cell_keys(cells).tolist()
+        neighbor_keys = _get_cell_keys(
+            cells[:, None, :] + self._neighbor_offsets
+        ).tolist()
+
+        # Query the neighboring cells for each new point and insert the point
+        # afterwards, so each pair is only found once.
+        candidates_first = []
+        candidates_second = []
+        cells_get = self._cells.get
+        for i_point, key, point_neighbor_keys in zip(
+            range(self.n_points, self.n_points + n_new_points), keys, neighbor_keys
+        ):
+            # Different cells can have the same hash key, so we only use
+            # every key once.
+            for neighbor_points in map(cells_get, set(point_neighbor_keys)):
+                if neighbor_points is not None:
+                    candidates_first.extend(neighbor_points)
+                    candidates_second.extend([i_point] * len(neighbor_points))
+            if key in self._cells:
+                self._cells[key].append(i_point)
+            else:
+                self._cells[key] = [i_point]
+        self.n_points += n_new_points
+
+        # Check the actual distances of the candidates.
+        pairs = _np.array([candidates_first, candidates_second], dtype=int).T
+        pairs = pairs.reshape(-1, 2)
+        distances = _np.linalg.norm(
+            self._coordinates[pairs[:, 0]] - self._coordinates[pairs[:, 1]], axis=1
+        )
+        return pairs[distances <= self.tol]
@@ -0,0 +1,127 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018-2025 BeamMe Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""This file implements helper functions for the search of close points in a
+periodic box."""
+
+import itertools as _itertools
+
+import numpy as _np
+from numpy.typing import NDArray as _NDArray
+
+
+def get_periods(periods, n_dim: int, tol: float) -> _NDArray:
+    """Get the array with the period of each dimension.
+
+    Args:
+        periods: Period of each dimension, i.e., the edge lengths of the
+            periodic box. A period of None or 0 means that the dimension is
+            not periodic.
+        n_dim: Number of spatial dimensions.
+        tol: Tolerance of the search.
+
+    Returns:
+        Array with the period of each dimension, 0 for the dimensions that
+        are not periodic.
+    """
+
+    periods = _np.array(
+        [0.0 if period is None else period for period in periods], dtype=float
+    )
+    if len(periods) != n_dim:
+        raise ValueError(
+            f"Expected a period for each of the {n_dim} dimensions, got "
+            f"{len(periods)} periods"
+        )
+    is_periodic = periods != 0.0
+    if _np.any(periods < 0.0) or _np.any(periods[is_periodic] <= 2.0 * tol):
+        raise ValueError(
+            "The periods have to be larger than two times the tolerance, got "
+            f"{periods}"
+        )
+    return periods
+
+
+def wrap_periodic_coordinates(point_coordinates, periods: _NDArray) -> _NDArray:
+    """Map the coordinates of the periodic dimensions into the periodic box.
+
+    Args:
+        point_coordinates: Point coordinates (n_points x n_dim).
+        periods: Period of each dimension, see `get_periods`.
+
+    Returns:
+        Point coordinates where the periodic dimensions are in the interval
+        [0, period).
+    """
+
+    point_coordinates = _np.array(point_coordinates, dtype=float)
+    for i_dim in _np.flatnonzero(periods):
+        coordinates = _np.mod(point_coordinates[:, i_dim], periods[i_dim])
+        # Negative coordinates that are close to 0 are mapped to the period
+        # due to rounding.
+        coordinates[coordinates >= periods[i_dim]] = 0.0
+        point_coordinates[:, i_dim] = coordinates
+    return point_coordinates
+
+
+def get_periodic_images(
+    point_coordinates: _NDArray, periods: _NDArray, halo: float
+) -> tuple[_NDArray, _NDArray]:
+    """Add the periodic images of the points close to the lower boundaries
+    of the periodic box.
+
+    The images are shifted by one period in the positive direction of the
+    periodic dimensions. If the point coordinates are in the periodic box,
+    the distance between each pair of points with respect to the periodic
+    box is the distance between two of the returned points (if it is
+    smaller than the halo), i.e., a search for close points on the
+    returned points finds all pairs in the periodic box.
+
+    Args:
+        point_coordinates: Point coordinates (n_points x n_dim), the periodic
+            dimensions have to be wrapped, see `wrap_periodic_coordinates`.
+        periods: Period of each dimension, see `get_periods`.
+        halo: Only points within this distance of the lower boundaries get
+            images.
+
+    Returns:
+        image_coordinates: The points followed by their images.
+        point_indices: The index of the original point for each of the
+            returned points.
+    """
+
+    periodic_dims = _np.flatnonzero(periods)
+    is_in_halo = point_coordinates[:, periodic_dims] < halo
+
+    image_coordinates = [point_coordinates]
+    point_indices = [_np.arange(len(point_coordinates))]
+    for is_shifted in _itertools.product([False, True], repeat=len(periodic_dims)):
+        shifted_dims = periodic_dims[list(is_shifted)]
+        if len(shifted_dims) == 0:
+            continue
+        image_indices = _np.flatnonzero(
+            _np.all(is_in_halo[:, list(is_shifted)], axis=1)
+        )
+        shift = _np.zeros(point_coordinates.shape[1])
+        shift[shifted_dims] = periods[shifted_dims]
+        image_coordinates.append(point_coordinates[image_indices] + shift)
+        point_indices.append(image_indices)
+    return _np.concatenate(image_coordinates), _np.concatenate(point_indices)
@@ -24,40 +24,28 @@ functionality."""
 
 from scipy.spatial import KDTree as _KDTree
 
+from beamme.geometric_search.connected_components import (
+    pairs_to_point_partners as _pairs_to_point_partners,
+)
+
 
 def pairs_to_partner_list(pairs, n_points):
-    """Convert the pairs to a partner list."""
-
-    # Sort the pairs by the first column
-    pairs = pairs[pairs[:, 0].argsort()]
-
-    n_partners = 0
-    partner_index_list = [-1 for i in range(n_points)]
-    for pair in pairs:
-        pair_partners = [partner_index_list[pair[i]] for i in range(2)]
-        if pair_partners[0] == -1 and pair_partners[1] == -1:
-            # We have a new partner index
-            for i in range(2):
-                partner_index_list[pair[i]] = n_partners
-            n_partners += 1
-        elif pair_partners[0] == -1:
-            partner_index_list[pair[0]] = pair_partners[1]
-        elif pair_partners[1] == -1:
-            partner_index_list[pair[1]] = pair_partners[0]
-        else:
-            # Both points already have a partner index. Since we order
-            # the pairs this one has to be equal to each other or we
-            # have multiple clusters.
-            if not pair_partners[0] == pair_partners[1]:
-                raise ValueError(
-                    "Two points are connected to different partner indices."
-                )
-    return partner_index_list, n_partners
-
-
-def find_close_points_scipy(point_coordinates, tol):
-    """Call the Scipy implementation of find close_points."""
-
-    kd_tree = _KDTree(point_coordinates)
+    """Convert the pairs to a partner list.
+
+    Chains of pairs are combined to a single cluster, see
+    `pairs_to_point_partners`.
+    """
+    return _pairs_to_point_partners(pairs, n_points)
+
+
+def find_close_points_scipy(point_coordinates, tol, *, periods=None):
+    """Call the Scipy implementation of find close_points.
+
+    If periods are given, the KD-tree is created for the periodic box, see
+    `beamme.geometric_search.periodic.get_periods`. The periodic
+    coordinates have to be in the box.
+    """
+
+    kd_tree = _KDTree(point_coordinates, boxsize=periods)
     pairs = kd_tree.query_pairs(r=tol, output_type="ndarray")
     return pairs_to_partner_list(pairs, len(point_coordinates))
@@ -0,0 +1,328 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018-2025 BeamMe Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""This file implements a search for close points based on spatial hashing
+that only uses vectorized NumPy operations."""
+
+import itertools as _itertools
+
+import numpy as _np
+from numpy.typing import NDArray as _NDArray
+
+from beamme.geometric_search.connected_components import (
+    pairs_to_point_partners as _pairs_to_point_partners,
+)
+
+# Factors to combine the cell indices to a single hash key.
+_HASH_FACTORS = _np.array([73856093, 19349663, 83492791], dtype=_np.int64)
+
+# Maximal number of candidate pairs that are checked at once, this limits the
+# memory usage for point clouds with many points in a single cell.
+_MAX_CANDIDATES = 2**22
+
+# The cell size of the grid is not reduced below this fraction of the initial
+# cell size.
+_MIN_CELL_SIZE_FACTOR = 1e-3
+
+
+def get_cell_keys(cells) -> _NDArray:
+    """Combine integer cell indices to a single hash key.
+
+    Different cells can get the same hash key. This only results in
+    additional candidates, so the actual distances of the candidates have
+    to be checked.
+
+    Args:
+        cells: Array with the integer cell indices (... x n_dim) with
+            n_dim <= 3.
+
+    Returns:
+        Array with the hash key of each cell.
+    """
+    cells = _np.asarray(cells, dtype=_np.int64)
+    with _np.errstate(over="ignore"):
+        return cells @ _HASH_FACTORS[: cells.shape[-1]]
+
+
+def _get_block_pairs(
+    start_first: _NDArray,
+    count_first: _NDArray,
+    start_second: _NDArray,
+    count_second: _NDArray,
+) -> tuple[_NDArray, _NDArray]:
+    """Return all index pairs between two consecutive ranges of indices.
+
+    Args:
+        start_first: Start index of the first range for each block.
+        count_first: Length of the first range for each block.
+        start_second: Start index of the second range for each block.
+        count_second: Length of the second range for each block.
+
+    Returns:
+        Arrays with the first and second index of each pair.
+    """
+    block_sizes = count_first * count_second
+    block_ids = _np.repeat(_np.arange(len(block_sizes)), block_sizes)
+    local_indices = (
+        _np.arange(len(block_ids)) - (_np.cumsum(block_sizes) - block_sizes)[block_ids]
+    )
+    count_second = count_second[block_ids]
+    return (
+        start_first[block_ids] + local_indices // count_second,
+        start_second[block_ids] + local_indices % count_second,
+    )
+
+
+def _get_extent(point_coordinates: _NDArray) -> _NDArray:
+    """Return the extent of the bounding box of the points in each
+    dimension."""
+    return _np.array(
+        [coordinates.max() - coordinates.min() for coordinates in point_coordinates.T]
+    )
+
+
+def estimate_point_spacing(point_coordinates, tol: float) -> float:
+    """Estimate the mean spacing of the points.
+
+    The estimate assumes that the points are uniformly distributed in their
+    bounding box. Only the three dimensions with the largest extent are
+    considered and dimensions where the extent of the bounding box is not
+    larger than twice the tolerance are ignored.
+
+    Args:
+        point_coordinates: Coordinates of the points (n_points x n_dim).
+        tol: Search tolerance.
+
+    Returns:
+        The estimated point spacing, 0 if all points are within the
+        tolerance of each other.
+    """
+    point_coordinates = _np.asarray(point_coordinates, dtype=float)
+    if len(point_coordinates) == 0:
+        return 0.0
+    extent = _np.sort(_get_extent(point_coordinates))[-3:]
+    extent = extent[extent > 2.0 * tol]
+    if len(extent) == 0:
+        return 0.0
+    return (_np.prod(extent) / len(point_coordinates)) ** (1.0 / len(extent))
+
+
+class SpatialHashGrid:
+    """Points sorted by the cells of a regular grid.
+
+    The grid is created for the three dimensions of the points with the
+    largest extent, e.g., the dimensions that are constant for all points
+    do not result in a grid with many points per cell. The cells are
+    identified by their hash keys. The cell size is at least twice the
+    tolerance, therefore, the partners of a point are in the same or a
+    neighboring cell. If the tolerance is small compared to the point
+    spacing, a cell size in the order of the point spacing is used, so
+    almost all partners are in the same cell.
+
+    All point data is stored in the order of the sorted points, i.e.,
+    `sort_indices[position]` is the index of the point at the given
+    position.
+    """
+
+    # Factors to combine the cell indices to a single hash key.
+    hash_factors = _HASH_FACTORS
+
+    def __init__(self, point_coordinates, tol: float):
+        """Sort the points by their cells.
+
+        Args:
+            point_coordinates: Coordinates of the points (n_points x n_dim)
+                with n_points > 0.
+            tol: Search tolerance.
+        """
+
+        grid_dimensions = _np.sort(_np.argsort(_get_extent(point_coordinates))[-3:])
+        grid_coordinates = point_coordinates[:, grid_dimensions]
+        grid_coordinates = grid_coordinates - [
+            coordinates.min() for coordinates in grid_coordinates.T
+        ]
+        n_points = len(grid_coordinates)
+
+        # The initial cell size results in about one point per cell for
+        # uniformly distributed points. If the points are not uniformly
+        # distributed, there can be many points in a cell. In this case, the
+        # cell size is reduced, as long as this reduces the number of
+        # candidate pairs, e.g., duplicated points always stay in the same
+        # cell. The cell size is also not reduced below a fraction of the
+        # initial one.
+        self.cell_size = max(2.0 * tol, estimate_point_spacing(grid_coordinates, tol))
+        if self.cell_size == 0.0:
+            # All points are at the same position and the tolerance is 0.
+            self.cell_size = 1.0
+        min_cell_size = max(2.0 * tol, _MIN_CELL_SIZE_FACTOR * self.cell_size)
+        n_candidates_previous = None
+        while True:
+            cell_coordinates = grid_coordinates / self.cell_size
+            cells = _np.floor(cell_coordinates).astype(_np.int64)
+            keys = get_cell_keys(cells)
+            self.sort_indices = _np.argsort(keys)
+            self.keys = keys[self.sort_indices]
+            is_cell_start = _np.ones(n_points, dtype=bool)
+            _np.not_equal(self.keys[1:], self.keys[:-1], out=is_cell_start[1:])
+            self.cell_starts = _np.flatnonzero(is_cell_start)
+            self.cell_counts = _np.diff(self.cell_starts, append=n_points)
+            n_candidates = _np.sum(self.cell_counts * (self.cell_counts - 1))
+            if (
+                self.cell_size <= min_cell_size
+                or n_candidates <= 8 * n_points
+                or (
+                    n_candidates_previous is not None
+                    and n_candidates >= n_candidates_previous
+                )
+            ):
+                break
+            n_candidates_previous = n_candidates
+            self.cell_size = max(min_cell_size, 0.25 * self.cell_size)
+        self.cell_keys = self.keys[self.cell_starts]
+        self.cells = _np.take(cells, self.sort_indices, axis=0)
+
+        # Mark the points that are within the tolerance of the lower (bit 1)
+        # or upper (bit 2) face of their cell in each direction. The margin
+        # accounts for rounding errors in the cell coordinates.
+        cell_coordinates -= cells
+        face_distance = tol / self.cell_size + 1e-6
+        near_faces = (cell_coordinates < face_distance).view(_np.int8)
+        near_faces |= (cell_coordinates > 1.0 - face_distance).view(_np.int8) << 1
+        self.near_faces = _np.take(near_faces, self.sort_indices, axis=0)
+
+    def get_neighbor_offsets(self) -> _NDArray:
+        """Return half of the offsets to the neighboring cells.
+
+        The other half of the neighbors are the opposite offsets, so each
+        pair of neighboring cells is only considered once.
+        """
+        offsets = list(_itertools.product([-1, 0, 1], repeat=self.cells.shape[1]))
+        return _np.array(offsets[len(offsets) // 2 + 1 :], dtype=_np.int64)
+
+
+def find_close_point_pairs_spatial_hash(point_coordinates, tol: float) -> _NDArray:
+    """Find all pairs of points that are within the tolerance of each other.
+
+    The points are sorted into a `SpatialHashGrid`. Points in neighboring
+    cells are only compared for points that are within the tolerance of
+    the corresponding cell faces.
+
+    Args:
+        point_coordinates: Coordinates of the points (n_points x n_dim).
+        tol: If the absolute distance between two points is smaller than or
+            equal to tol, they are considered to be equal.
+
+    Returns:
+        Array with the index pairs of close points (n_pairs x 2).
+    """
+
+    point_coordinates = _np.asarray(point_coordinates, dtype=float)
+    n_points = len(point_coordinates)
+    if n_points == 0:
+        return _np.zeros((0, 2), dtype=int)
+    grid = SpatialHashGrid(point_coordinates, tol)
+
+    # Candidates within the same cell.
+    has_multiple_points = grid.cell_counts > 1
+    blocks = [
+        (
+            grid.cell_starts[has_multiple_points],
+            grid.cell_counts[has_multiple_points],
+            grid.cell_starts[has_multiple_points],
+            grid.cell_counts[has_multiple_points],
+        )
+    ]
+
+    # Candidates in neighboring cells.
+    is_near_face = grid.near_faces[:, 0] != 0
+    for i_dim in range(1, grid.near_faces.shape[1]):
+        is_near_face |= grid.near_faces[:, i_dim] != 0
+    positions = _np.flatnonzero(is_near_face)
+    near_faces = grid.near_faces[positions]
+    for offset in grid.get_neighbor_offsets():
+        has_neighbor = _np.ones(len(positions), dtype=bool)
+        for i_dim, offset_dim in enumerate(offset):
+            if offset_dim == -1:
+                has_neighbor &= (near_faces[:, i_dim] & 1).astype(bool)
+            elif offset_dim == 1:
+                has_neighbor &= (near_faces[:, i_dim] & 2).astype(bool)
+        neighbor_positions = positions[has_neighbor]
+        neighbor_keys = get_cell_keys(grid.cells[neighbor_positions] + offset)
+        neighbor_cells = _np.searchsorted(grid.cell_keys, neighbor_keys)
+        neighbor_cells[neighbor_cells == len(grid.cell_keys)] = 0
+        is_found = (grid.cell_keys[neighbor_cells] == neighbor_keys) & (
+            neighbor_keys != grid.keys[neighbor_positions]
+        )
+        neighbor_cells = neighbor_cells[is_found]
+        blocks.append(
+            (
+                neighbor_positions[is_found],
+                _np.ones(len(neighbor_cells), dtype=int),
+                grid.cell_starts[neighbor_cells],
+                grid.cell_counts[neighbor_cells],
+            )
+        )
+    start_first, count_first, start_second, count_second = map(
+        _np.concatenate, zip(*blocks)
+    )
+    is_same_cell = _np.arange(len(start_first)) < len(blocks[0][0])
+
+    # Check the candidates in chunks.
+    n_candidates = _np.cumsum(count_first * count_second)
+    n_candidates_total = n_candidates[-1] if len(n_candidates) > 0 else 0
+    chunk_ends = _np.searchsorted(
+        n_candidates,
+        _np.arange(_MAX_CANDIDATES, n_candidates_total, _MAX_CANDIDATES),
+        side="right",
+    )
+    chunk_ends = _np.unique(_np.append(chunk_ends, len(n_candidates)))
+    pairs = []
+    chunk_start = 0
+    for chunk_end in chunk_ends:
+        chunk = slice(chunk_start, chunk_end)
+        chunk_start = chunk_end
+        first, second = _get_block_pairs(
+            start_first[chunk],
+            count_first[chunk],
+            start_second[chunk],
+            count_second[chunk],
+        )
+
+        # Within a cell, each pair is only checked once.
+        is_candidate = first < second
+        is_candidate |= ~is_same_cell[chunk].repeat(
+            count_first[chunk] * count_second[chunk]
+        )
+        first = grid.sort_indices[first[is_candidate]]
+        second = grid.sort_indices[second[is_candidate]]
+        distances = _np.linalg.norm(
+            point_coordinates[first] - point_coordinates[second], axis=1
+        )
+        is_close = distances <= tol
+        pairs.append(_np.stack([first[is_close], second[is_close]], axis=1))
+    return _np.concatenate(pairs)
+
+
+def find_close_points_spatial_hash_numpy(point_coordinates, tol):
+    """Call the NumPy spatial hashing implementation of find close_points."""
+
+    pairs = find_close_point_pairs_spatial_hash(point_coordinates, tol)
+    return _pairs_to_point_partners(pairs, len(point_coordinates))
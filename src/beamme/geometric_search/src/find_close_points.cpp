@@ -175,66 +175,11 @@ namespace GeometricSearch
     }
 
 
-    std::tuple<pybind11::array_t<int>, int> find_close_points(
+    std::tuple<pybind11::array_t<int>, pybind11::array_t<int>> find_close_points(
         const pybind11::array_t<double>& coordinates, const double tol)
     {
-        const auto& [indices, offsets] = find_close_points_factory(coordinates, tol);
-        const auto& indices_unchecked = indices.unchecked<1>();
-        const auto& offsets_unchecked = offsets.unchecked<1>();
-
-        // Create empty data array.
-        const auto n_points = coordinates.shape(0);
-        auto clusters = pybind11::array_t<int>(n_points);
-        pybind11::buffer_info clusters_buffer = clusters.request();
-        int* clusters_ptr = (int*)clusters_buffer.ptr;
-        for (unsigned int i_point = 0; i_point < n_points; i_point++)
-        {
-            clusters_ptr[i_point] = -1;
-        }
-
-        // Loop over ArborX data
-        int n_clusters = 0;
-        for (unsigned int i_point = 0; i_point < n_points; i_point++)
-        {
-            const auto start = offsets_unchecked(i_point);
-            const auto end = offsets_unchecked(i_point + 1);
-
-            const bool has_cluster = 0 < (end - start);
-            const auto my_cluster_id = clusters_ptr[i_point];
-
-            if (has_cluster && my_cluster_id == -1)
-            {
-                // Loop over matching points and set them to the ID of this cluster.
-                for (int j = start; j < end; j++)
-                {
-                    int j_point = indices_unchecked(j);
-                    if (clusters_ptr[j_point] == -1)
-                    {
-                        clusters_ptr[j_point] = n_clusters;
-                    }
-                    else
-                    {
-                        throw std::out_of_range("No point can be part of two clusters");
-                    }
-                }
-                clusters_ptr[i_point] = n_clusters;
-                n_clusters += 1;
-            }
-            else if (has_cluster)
-            {
-                // The point is part of a cluster and the cluster ID is already set. Check
-                // that all partners match the ID.
-                for (int j = start; j < end; j++)
-                {
-                    int j_point = indices_unchecked(j);
-                    if (clusters_ptr[j_point] != my_cluster_id)
-                    {
-                        throw std::out_of_range("No point can be part of two clusters");
-                    }
-                }
-            }
-        }
-
-        return std::make_tuple(clusters, n_clusters);
+        // The clusters are created from the pairs in Python, so chains of close points are
+        // handled the same way as for the other algorithms.
+        return find_close_points_factory(coordinates, tol);
     }
 }  // namespace GeometricSearch
@@ -30,7 +30,7 @@
 
 namespace GeometricSearch
 {
-    std::tuple<pybind11::array_t<int>, int> find_close_points(
+    std::tuple<pybind11::array_t<int>, pybind11::array_t<int>> find_close_points(
         const pybind11::array_t<double>& coordinates, double tol);
 }  // namespace GeometricSearch
 
@@ -0,0 +1,154 @@
+// The MIT License (MIT)
+//
+// Copyright (c) 2018-2025 BeamMe Authors
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+// OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+// THE SOFTWARE.
+
+#include <ArborX_LinearBVH.hpp>
+#include <ArborX_HyperBox.hpp>
+
+#include "find_intersecting_boxes.h"
+
+namespace GeometricSearch
+{
+    /*
+     * Define the type used for the axis aligned boxes in this file.
+     */
+    struct AxisAlignedBoxes
+    {
+        const pybind11::detail::unchecked_reference<double, 2>* boxes_min_;
+        const pybind11::detail::unchecked_reference<double, 2>* boxes_max_;
+    };
+
+    /*
+     * Return the ArborX box for the box with the given index.
+     */
+    ArborX::ExperimentalHyperGeometry::Box<3, double> get_box(
+        const AxisAlignedBoxes& boxes, std::size_t i)
+    {
+        ArborX::ExperimentalHyperGeometry::Box<3, double> box;
+        for (int d = 0; d < 3; ++d)
+        {
+            box.minCorner()[d] = boxes.boxes_min_->operator()(i, d);
+            box.maxCorner()[d] = boxes.boxes_max_->operator()(i, d);
+        }
+        return box;
+    }
+}  // namespace GeometricSearch
+
+/*
+ * Define how ArborX accesses the box data provided by the find_intersecting_boxes function.
+ */
+namespace ArborX
+{
+    template <>
+    struct AccessTraits<GeometricSearch::AxisAlignedBoxes, PrimitivesTag>
+    {
+        using memory_space = Kokkos::HostSpace;
+
+        static std::size_t size(const GeometricSearch::AxisAlignedBoxes& boxes)
+        {
+            return boxes.boxes_min_->shape(0);
+        }
+
+        static auto get(const GeometricSearch::AxisAlignedBoxes& boxes, std::size_t i)
+        {
+            return GeometricSearch::get_box(boxes, i);
+        }
+    };
+
+    template <>
+    struct AccessTraits<GeometricSearch::AxisAlignedBoxes, PredicatesTag>
+    {
+        using memory_space = Kokkos::HostSpace;
+
+        static std::size_t size(const GeometricSearch::AxisAlignedBoxes& boxes)
+        {
+            return boxes.boxes_min_->shape(0);
+        }
+
+        static auto get(const GeometricSearch::AxisAlignedBoxes& boxes, std::size_t i)
+        {
+            // Each box is checked for intersections with all other boxes.
+            return attach(intersects(GeometricSearch::get_box(boxes, i)), (int)i);
+        }
+    };
+}  // namespace ArborX
+
+
+namespace GeometricSearch
+{
+    struct EnsureUniqueBoxPairs
+    {
+        template <class Predicate, class OutputFunctor>
+        KOKKOS_FUNCTION void operator()(
+            Predicate const& predicate, int i, OutputFunctor const& out) const
+        {
+            int const j = getData(predicate);
+            if (i > j)
+            {
+                out(i);
+            }
+        }
+    };
+
+    std::tuple<pybind11::array_t<int>, pybind11::array_t<int>> find_intersecting_boxes(
+        const pybind11::array_t<double>& boxes_min, const pybind11::array_t<double>& boxes_max)
+    {
+        using memory_space = Kokkos::HostSpace;
+
+        if (boxes_min.shape(1) != 3 || boxes_max.shape(1) != 3 ||
+            boxes_min.shape(0) != boxes_max.shape(0))
+        {
+            throw std::out_of_range("Expected two arrays with the same number of 3D boxes");
+        }
+
+        const auto& boxes_min_unchecked = boxes_min.unchecked<2>();
+        const auto& boxes_max_unchecked = boxes_max.unchecked<2>();
+        const AxisAlignedBoxes boxes{&boxes_min_unchecked, &boxes_max_unchecked};
+
+        // Build tree structure containing all boxes
+        using hyper_box = ArborX::ExperimentalHyperGeometry::Box<3, double>;
+        ArborX::BasicBoundingVolumeHierarchy<memory_space,
+            ArborX::Details::PairIndexVolume<hyper_box>>
+            bounding_volume_hierarchy(Kokkos::DefaultExecutionSpace{}, boxes);
+
+        // Perform the collision check
+        Kokkos::View<int*, Kokkos::HostSpace> indices_arborx("indices_arborx", 0);
+        Kokkos::View<int*, Kokkos::HostSpace> offset_arborx("offset_arborx", 0);
+        bounding_volume_hierarchy.query(Kokkos::DefaultExecutionSpace{}, boxes,
+            EnsureUniqueBoxPairs{}, indices_arborx, offset_arborx);
+
+        // Copy everything into numpy arrays
+        auto copy_kokkos_array = [&](const Kokkos::View<int*, Kokkos::HostSpace>& vec)
+        {
+            auto np_array = pybind11::array_t<int>(vec.size());
+            pybind11::buffer_info np_array_buffer = np_array.request();
+            int* np_array_ptr = (int*)np_array_buffer.ptr;
+            for (unsigned int i = 0; i < vec.size(); i++)
+            {
+                np_array_ptr[i] = vec[i];
+            }
+            return np_array;
+        };
+
+        // Return the search results
+        return std::make_tuple(copy_kokkos_array(indices_arborx), copy_kokkos_array(offset_arborx));
+    }
+}  // namespace GeometricSearch
@@ -0,0 +1,37 @@
+// The MIT License (MIT)
+//
+// Copyright (c) 2018-2025 BeamMe Authors
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+// OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+// THE SOFTWARE.
+
+#ifndef FIND_INTERSECTING_BOXES_
+#define FIND_INTERSECTING_BOXES_
+
+#include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
+#include <tuple>
+
+
+namespace GeometricSearch
+{
+    std::tuple<pybind11::array_t<int>, pybind11::array_t<int>> find_intersecting_boxes(
+        const pybind11::array_t<double>& boxes_min, const pybind11::array_t<double>& boxes_max);
+}  // namespace GeometricSearch
+
+#endif
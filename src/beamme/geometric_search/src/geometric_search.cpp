@@ -24,6 +24,7 @@
 #include <Kokkos_Core.hpp>
 
 #include "find_close_points.h"
+#include "find_intersecting_boxes.h"
 
 
 namespace GeometricSearch
@@ -52,7 +53,7 @@ PYBIND11_MODULE(arborx_lib, py_module)
     py_module.def("kokkos_initialize", &GeometricSearch::kokkos_initialize, "Initialize Kokkos");
     py_module.def("kokkos_finalize", &GeometricSearch::kokkos_finalize, "Finalize Kokkos");
     py_module.def("find_close_points", &GeometricSearch::find_close_points,
-        "Find sets of points that are within the spatial radius tol of each other.\n"
+        "Find pairs of points that are within the spatial radius tol of each other.\n"
         "\n"
         "Args\n"
         "----\n"
@@ -63,9 +64,26 @@ PYBIND11_MODULE(arborx_lib, py_module)
         "\n"
         "Return\n"
         "----\n"
-        "has_partner: numpy array\n"
-        "    An array with integers, marking the set a node is part of. -1 means the\n"
-        "    node does not have a partner.\n"
-        "partner: int\n"
-        "    Number of clusters found.\n");
+        "indices: numpy array\n"
+        "    The indices of the close points with a larger index, in compressed\n"
+        "    sparse row format.\n"
+        "offsets: numpy array\n"
+        "    The close points of point i are indices[offsets[i]:offsets[i + 1]].\n");
+    py_module.def("find_intersecting_boxes", &GeometricSearch::find_intersecting_boxes,
+        "Find pairs of axis aligned boxes that intersect each other.\n"
+        "\n"
+        "Args\n"
+        "----\n"
+        "boxes_min: np.array\n"
+        "    Two-dimensional array with the minimal coordinates of the 3D boxes.\n"
+        "boxes_max: np.array\n"
+        "    Two-dimensional array with the maximal coordinates of the 3D boxes.\n"
+        "\n"
+        "Return\n"
+        "----\n"
+        "indices: numpy array\n"
+        "    The indices of the intersecting boxes with a larger index, in compressed\n"
+        "    sparse row format.\n"
+        "offsets: numpy array\n"
+        "    The intersecting boxes of box i are indices[offsets[i]:offsets[i + 1]].\n");
 }
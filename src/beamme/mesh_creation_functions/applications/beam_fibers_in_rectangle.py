@@ -33,7 +33,6 @@ from beamme.core.geometry_set import GeometrySet as _GeometrySet
 from beamme.mesh_creation_functions.beam_line import (
     create_beam_mesh_line as _create_beam_mesh_line,
 )
-from beamme.utils.nodes import check_node_by_coordinate as _check_node_by_coordinate
 
 
 def _intersect_line_with_rectangle(
@@ -220,16 +219,16 @@ def create_fibers_in_rectangle(
 
     return_set = _GeometryName()
     return_set["north"] = _GeometrySet(
-        mesh.get_nodes_by_function(_check_node_by_coordinate, 1, width),
+        mesh.nodes_on_plane([0, 1, 0], [0, width, 0]).get_points()
     )
     return_set["east"] = _GeometrySet(
-        mesh.get_nodes_by_function(_check_node_by_coordinate, 0, length),
+        mesh.nodes_on_plane([1, 0, 0], [length, 0, 0]).get_points()
     )
     return_set["south"] = _GeometrySet(
-        mesh.get_nodes_by_function(_check_node_by_coordinate, 1, 0)
+        mesh.nodes_on_plane([0, 1, 0], [0, 0, 0]).get_points()
     )
     return_set["west"] = _GeometrySet(
-        mesh.get_nodes_by_function(_check_node_by_coordinate, 0, 0)
+        mesh.nodes_on_plane([1, 0, 0], [0, 0, 0]).get_points()
     )
     return_set["all"] = _GeometrySet(mesh.elements)
     return return_set
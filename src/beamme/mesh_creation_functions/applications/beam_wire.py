@@ -28,7 +28,6 @@ from beamme.core.geometry_set import GeometrySet as _GeometrySet
 from beamme.mesh_creation_functions.beam_line import (
     create_beam_mesh_line as _create_beam_mesh_line,
 )
-from beamme.utils.nodes import check_node_by_coordinate as _check_node_by_coordinate
 
 
 def create_wire_fibers(
@@ -107,9 +106,11 @@ def create_wire_fibers(
 
     # Create the sets to return.
     return_set = _GeometryName()
-    start_nodes = mesh.get_nodes_by_function(_check_node_by_coordinate, 0, 0.0)
-    end_nodes = mesh.get_nodes_by_function(_check_node_by_coordinate, 0, length)
-    return_set["start"] = _GeometrySet(start_nodes)
-    return_set["end"] = _GeometrySet(end_nodes)
+    return_set["start"] = _GeometrySet(
+        mesh.nodes_on_plane([1, 0, 0], [0, 0, 0]).get_points()
+    )
+    return_set["end"] = _GeometrySet(
+        mesh.nodes_on_plane([1, 0, 0], [length, 0, 0]).get_points()
+    )
     return_set["all"] = _GeometrySet(mesh.elements)
     return return_set
@@ -25,6 +25,7 @@ import numpy as _np
 
 from beamme.core.conf import bme as _bme
 from beamme.core.rotation import Rotation as _Rotation
+from beamme.core.rotation import RotationArray as _RotationArray
 from beamme.mesh_creation_functions.beam_generic import (
     create_beam_mesh_generic as _create_beam_mesh_generic,
 )
@@ -177,6 +178,14 @@ def create_beam_mesh_arc_segment_via_axis(
 
         return beam_function
 
+    def get_beam_geometry_array(parameters):
+        """Return the positions, quaternions and arc lengths along the beam
+        axis for an array of parameters."""
+        arc_rotations = _RotationArray(axis, parameters)
+        rotations = arc_rotations * start_rotation
+        positions = center + arc_rotations * distance
+        return (positions, rotations.q, parameters * radius)
+
     # Create the beam in the mesh
     return _create_beam_mesh_generic(
         mesh,
@@ -184,6 +193,7 @@ def create_beam_mesh_arc_segment_via_axis(
         material=material,
         function_generator=get_beam_geometry,
         interval=[0.0, angle],
+        array_function=get_beam_geometry_array,
         interval_length=angle * radius,
         **kwargs,
     )
@@ -33,11 +33,14 @@ import numpy as _np
 
 from beamme.core.conf import bme as _bme
 from beamme.core.element_beam import Beam as _Beam
+from beamme.core.element_beam import check_beam_node as _check_beam_node
 from beamme.core.geometry_set import GeometryName as _GeometryName
 from beamme.core.geometry_set import GeometrySet as _GeometrySet
 from beamme.core.material import MaterialBeamBase as _MaterialBeamBase
 from beamme.core.mesh import Mesh as _Mesh
 from beamme.core.node import NodeCosserat as _NodeCosserat
+from beamme.core.rotation import Rotation as _Rotation
+from beamme.core.rotation import RotationArray as _RotationArray
 from beamme.utils.nodes import get_single_node as _get_single_node
 
 
@@ -48,6 +51,7 @@ def create_beam_mesh_generic(
     material: _MaterialBeamBase,
     function_generator: _Callable,
     interval: _Tuple[float, float],
+    array_function: _Optional[_Callable] = None,
     n_el: _Optional[int] = None,
     l_el: _Optional[float] = None,
     interval_length: _Optional[float] = None,
@@ -86,6 +90,15 @@ def create_beam_mesh_generic(
         interval:
             Start and end values for interval that will be used to create the
             beam.
+        array_function:
+            Optional vectorized version of the function_generator. It has to
+            take an array with parameter values within the interval and
+            return the positions (n x 3), the quaternions (n x 4) and the arc
+            lengths (n, or None) at these parameters, with a linear mapping
+            between xi and the parameters of each element. If this is given,
+            all nodes are evaluated in a single call and the nodes and
+            elements are created in bulk. The function_generator is still
+            required for the checks of given start and end nodes.
         n_el:
             Number of equally spaced beam elements along the line. Defaults to 1.
             Mutually exclusive with l_el
@@ -307,43 +320,112 @@ def create_beam_mesh_generic(
         relative_twist = None
 
     # Create the beams.
-    for i_el in range(n_el):
-        # If the beam is closed with itself, set the end node to be the
-        # first node of the beam. This is done when the second element is
-        # created, as the first node already exists here.
-        if i_el == 1 and close_beam:
-            end_node = nodes[0]
+    if array_function is None:
+        for i_el in range(n_el):
+            # If the beam is closed with itself, set the end node to be the
+            # first node of the beam. This is done when the second element is
+            # created, as the first node already exists here.
+            if i_el == 1 and close_beam:
+                end_node = nodes[0]
+
+            # Get the function to create this beam element.
+            function = function_generator(
+                interval_node_positions_of_elements[i_el],
+                interval_node_positions_of_elements[i_el + 1],
+            )
 
-        # Get the function to create this beam element.
-        function = function_generator(
-            interval_node_positions_of_elements[i_el],
-            interval_node_positions_of_elements[i_el + 1],
-        )
+            # Set the start node for the created beam.
+            if start_node is not None or i_el > 0:
+                first_node = nodes[-1]
+            else:
+                first_node = None
 
-        # Set the start node for the created beam.
-        if start_node is not None or i_el > 0:
-            first_node = nodes[-1]
-        else:
-            first_node = None
+            # If an end node is given, set this one for the last element.
+            if end_node is not None and i_el == n_el - 1:
+                last_node = end_node
+            else:
+                last_node = None
+
+            element = beam_class(material=material)
+            elements.append(element)
+            nodes.extend(
+                element.create_beam(
+                    function,
+                    start_node=first_node,
+                    end_node=last_node,
+                    relative_twist=relative_twist,
+                    set_nodal_arc_length=set_nodal_arc_length,
+                    nodal_arc_length_offset=nodal_arc_length_offset,
+                )
+            )
 
-        # If an end node is given, set this one for the last element.
-        if end_node is not None and i_el == n_el - 1:
-            last_node = end_node
+    else:
+        # Evaluate the positions and rotations of all nodes at once. The last
+        # node of each element is the first node of the next element. The
+        # beam class can also be a function that creates the elements, so
+        # the node parameters are taken from the created elements.
+        elements = [beam_class(material=material) for _ in range(n_el)]
+        xi = _np.asarray(elements[0].nodes_create, dtype=float)
+        n_nodes_per_element = len(xi)
+        parameters = _np.append(
+            (
+                0.5 * (1.0 - xi[:-1]) * interval_node_positions_of_elements[:-1, None]
+                + 0.5 * (1.0 + xi[:-1]) * interval_node_positions_of_elements[1:, None]
+            ).ravel(),
+            interval_node_positions_of_elements[-1],
+        )
+        positions, quaternions, arc_lengths = array_function(parameters)
+        rotations = _RotationArray.from_quaternion(quaternions)
+        if relative_twist is not None:
+            rotations = rotations * relative_twist
+        if set_nodal_arc_length:
+            arc_lengths = (_np.asarray(arc_lengths) + nodal_arc_length_offset).tolist()
         else:
-            last_node = None
-
-        element = beam_class(material=material)
-        elements.append(element)
+            arc_lengths = [None] * len(parameters)
+
+        # If the beam is closed with itself, the end node is the first node
+        # of the beam (the same as for the element wise creation, this
+        # requires at least two elements).
+        is_closed = close_beam and n_el > 1
+        i_first = 0 if start_node is None else 1
+        i_last = len(parameters) - (0 if end_node is None and not is_closed else 1)
+        is_middle_node = _np.arange(len(parameters)) % (n_nodes_per_element - 1) != 0
         nodes.extend(
-            element.create_beam(
-                function,
-                start_node=first_node,
-                end_node=last_node,
-                relative_twist=relative_twist,
-                set_nodal_arc_length=set_nodal_arc_length,
-                nodal_arc_length_offset=nodal_arc_length_offset,
+            _NodeCosserat(
+                position,
+                _Rotation.from_quaternion(quaternion, normalized=True),
+                is_middle_node=middle_node,
+                arc_length=arc_length,
+            )
+            for position, quaternion, middle_node, arc_length in zip(
+                positions[i_first:i_last],
+                rotations.q[i_first:i_last],
+                is_middle_node[i_first:i_last].tolist(),
+                arc_lengths[i_first:i_last],
             )
         )
+        if is_closed:
+            end_node = nodes[0]
+
+        # Check that the given nodes match with the function.
+        for node, i_node, name in [
+            (start_node, 0, "start_node"),
+            (end_node, -1, "end_node"),
+        ]:
+            if node is not None:
+                _check_beam_node(
+                    node,
+                    positions[i_node],
+                    _Rotation.from_quaternion(rotations.q[i_node], normalized=True),
+                    arc_lengths[i_node],
+                    name,
+                )
+
+        # Set the nodes of the elements.
+        element_nodes = nodes if end_node is None else nodes + [end_node]
+        for i_el, element in enumerate(elements):
+            i_node = i_el * (n_nodes_per_element - 1)
+            element.nodes = element_nodes[i_node : i_node + n_nodes_per_element]
 
     # Set vtk cell data on created elements.
     if vtk_cell_data is not None:
@@ -21,10 +21,14 @@
 # THE SOFTWARE.
 """Functions to create beam meshes along straight lines."""
 
+import itertools as _itertools
+
 import numpy as _np
 
 from beamme.core.conf import bme as _bme
+from beamme.core.node import NodeCosserat as _NodeCosserat
 from beamme.core.rotation import Rotation as _Rotation
+from beamme.core.rotation import RotationArray as _RotationArray
 from beamme.mesh_creation_functions.beam_generic import (
     create_beam_mesh_generic as _create_beam_mesh_generic,
 )
@@ -103,6 +107,13 @@ def create_beam_mesh_line(mesh, beam_class, material, start_point, end_point, **
 
         return beam_function
 
+    def get_beam_geometry_array(parameters):
+        """Return the positions, quaternions and arc lengths along the beams
+        axis for an array of parameters."""
+        positions = start_point + _np.outer(parameters, direction)
+        quaternions = _np.tile(rotation.q, (len(parameters), 1))
+        return (positions, quaternions, parameters * line_length)
+
     # Create the beam in the mesh
     return _create_beam_mesh_generic(
         mesh,
@@ -110,6 +121,164 @@ def create_beam_mesh_line(mesh, beam_class, material, start_point, end_point, **
         material=material,
         function_generator=get_beam_geometry,
         interval=[0.0, 1.0],
+        array_function=get_beam_geometry_array,
         interval_length=line_length,
         **kwargs,
     )
+
+
+def create_beam_mesh_lines(
+    mesh,
+    beam_class,
+    material,
+    start_points,
+    end_points,
+    n_el=1,
+    *,
+    set_nodal_arc_length=False,
+    couple_end_nodes=False,
+    coupling_type=_bme.bc.point_coupling,
+    coupling_dof_type=_bme.coupling_dof.fix,
+):
+    """Generate many straight lines of beam elements at once.
+
+    The result is the same as for calls of `create_beam_mesh_line` for each
+    pair of start and end points, but the node positions and triads of all
+    lines are computed at once and no geometry sets are created.
+
+    Args
+    ----
+    mesh: Mesh
+        Mesh that the lines will be added to.
+    beam_class: Beam
+        Class of beam that will be used for the lines.
+    material: Material
+        Material for the lines.
+    start_points, end_points: _np.array (n_lines x 3)
+        3D-coordinates for the start and end points of the lines.
+    n_el: int
+        Number of equally spaced beam elements along each line.
+    set_nodal_arc_length: bool
+        Flag if the arc length along each line is set in the created nodes.
+    couple_end_nodes: bool
+        If this is true, the end nodes of the created lines that are at the
+        same position are coupled, see `Mesh.couple_nodes`.
+    coupling_type, coupling_dof_type:
+        Type of the couplings of the end nodes, see `Mesh.couple_nodes`.
+
+    Return
+    ----
+    return_indices: dict
+        The indices of the created items in the mesh. 'start' and 'end'
+        contain the indices of the start and end node of each line in
+        `mesh.nodes` and 'line' contains the indices of the elements of each
+        line in `mesh.elements` (n_lines x n_el).
+    """
+
+    start_points = _np.asarray(start_points, dtype=float).reshape(-1, 3)
+    end_points = _np.asarray(end_points, dtype=float).reshape(-1, 3)
+    if start_points.shape != end_points.shape:
+        raise ValueError(
+            "The number of start and end points has to be the same, got "
+            f"{len(start_points)} and {len(end_points)}"
+        )
+    n_lines = len(start_points)
+
+    # Get geometrical values for the lines, the triads are chosen in the same
+    # way as in `create_beam_mesh_line`.
+    directions = end_points - start_points
+    line_lengths = _np.linalg.norm(directions, axis=1)
+    t1 = directions / line_lengths[:, _np.newaxis]
+    use_z_axis = _np.abs(t1[:, 2]) < _np.abs(t1[:, 1]) - _bme.eps_quaternion
+    t2 = _np.zeros((n_lines, 3))
+    t2[use_z_axis, 2] = 1.0
+    t2[~use_z_axis, 1] = 1.0
+    quaternions = _RotationArray.from_basis(t1, t2).q
+
+    # Create the elements, the beam class can also be a function that creates
+    # the elements, so the node parameters are taken from the created
+    # elements.
+    mesh.add_material(material)
+    elements = [beam_class(material=material) for _ in range(n_lines * n_el)]
+    if n_lines == 0:
+        return {
+            "start": _np.zeros(0, dtype=int),
+            "end": _np.zeros(0, dtype=int),
+            "line": _np.zeros((0, n_el), dtype=int),
+        }
+    xi = _np.asarray(elements[0].nodes_create, dtype=float)
+    n_nodes_per_element = len(xi)
+
+    # Parameter coordinates of the nodes along each line. The last node of
+    # each element is the first node of the next element.
+    element_parameters = _np.linspace(0.0, 1.0, n_el + 1)
+    parameters = _np.append(
+        (
+            0.5 * (1.0 - xi[:-1]) * element_parameters[:-1, _np.newaxis]
+            + 0.5 * (1.0 + xi[:-1]) * element_parameters[1:, _np.newaxis]
+        ).ravel(),
+        1.0,
+    )
+    n_nodes_per_line = len(parameters)
+    positions = (
+        start_points[:, _np.newaxis, :]
+        + parameters[_np.newaxis, :, _np.newaxis] * directions[:, _np.newaxis, :]
+    ).reshape(-1, 3)
+    if set_nodal_arc_length:
+        arc_lengths = _np.outer(line_lengths, parameters).ravel().tolist()
+    else:
+        arc_lengths = [None] * len(positions)
+    is_middle_node = _np.tile(
+        _np.arange(n_nodes_per_line) % (n_nodes_per_element - 1) != 0, n_lines
+    )
+
+    # Create the nodes, all nodes of a line have the same rotation (the nodes
+    # store a copy of the given rotation).
+    rotations = _itertools.chain.from_iterable(
+        _itertools.repeat(
+            _Rotation.from_quaternion(quaternion, normalized=True), n_nodes_per_line
+        )
+        for quaternion in quaternions
+    )
+    nodes = [
+        _NodeCosserat(
+            position, rotation, is_middle_node=middle_node, arc_length=arc_length
+        )
+        for position, rotation, middle_node, arc_length in zip(
+            positions, rotations, is_middle_node.tolist(), arc_lengths
+        )
+    ]
+    start_nodes = _np.arange(n_lines) * n_nodes_per_line
+    end_nodes = start_nodes + n_nodes_per_line - 1
+    for i_node in _np.concatenate([start_nodes, end_nodes]).tolist():
+        nodes[i_node].is_end_node = True
+
+    # Set the nodes of the elements.
+    element_node_offsets = (
+        start_nodes[:, _np.newaxis]
+        + _np.arange(n_el)[_np.newaxis, :] * (n_nodes_per_element - 1)
+    ).ravel()
+    for element, offset in zip(elements, element_node_offsets.tolist()):
+        element.nodes = nodes[offset : offset + n_nodes_per_element]
+
+    # Add items to the mesh.
+    node_offset = len(mesh.nodes)
+    element_offset = len(mesh.elements)
+    mesh.nodes.extend(nodes)
+    mesh.elements.extend(elements)
+
+    if couple_end_nodes:
+        mesh.couple_nodes(
+            nodes=[
+                nodes[i_node]
+                for i_node in _np.sort(_np.concatenate([start_nodes, end_nodes]))
+            ],
+            coupling_type=coupling_type,
+            coupling_dof_type=coupling_dof_type,
+        )
+
+    return {
+        "start": node_offset + start_nodes,
+        "end": node_offset + end_nodes,
+        "line": element_offset + _np.arange(n_lines * n_el).reshape(n_lines, n_el),
+    }
@@ -59,9 +59,7 @@ def find_close_nodes(nodes, **kwargs):
         to each other.
     """
 
-    coords = _np.zeros([len(nodes), 3])
-    for i, node in enumerate(nodes):
-        coords[i, :] = node.coordinates
+    coords = get_nodal_coordinates(nodes)
     partner_indices = _point_partners_to_partner_indices(
         *_find_close_points(coords, **kwargs)
     )
@@ -95,9 +93,7 @@ def get_min_max_coordinates(nodes):
     min_max_coordinates:
         [min_x, min_y, min_z, max_x, max_y, max_z]
     """
-    coordinates = _np.zeros([len(nodes), 3])
-    for i, node in enumerate(nodes):
-        coordinates[i, :] = node.coordinates
+    coordinates = get_nodal_coordinates(nodes)
     min_max = _np.zeros(6)
     min_max[:3] = _np.min(coordinates, axis=0)
     min_max[3:] = _np.max(coordinates, axis=0)
@@ -165,10 +161,9 @@ def get_nodal_coordinates(nodes):
     pos: _np.array
         Numpy array with all the positions of the nodes.
     """
-    coordinates = _np.zeros([len(nodes), 3])
-    for i, node in enumerate(nodes):
-        coordinates[i, :] = node.coordinates
-    return coordinates
+    return _np.array([node.coordinates for node in nodes], dtype=float).reshape(
+        len(nodes), 3
+    )
 
 
 def get_nodal_quaternions(nodes: list[_Node]) -> _NDArray:
@@ -181,15 +176,16 @@ def get_nodal_quaternions(nodes: list[_Node]) -> _NDArray:
         nodes and the dtype is a numpy quaternion). For nodes which don't
         contain a rotation, we set the dummy quaternion (2, 0, 0, 0).
     """
-    quaternions = _np.zeros([len(nodes), 4])
-    for i, node in enumerate(nodes):
-        if isinstance(node, _NodeCosserat):
-            quaternions[i, :] = node.rotation.get_quaternion()
-        else:
-            # For the case of nodes that belong to solid elements,
-            # we define the following default value:
-            quaternions[i, :] = [2.0, 0.0, 0.0, 0.0]
-    return quaternions
+    # For the case of nodes that belong to solid elements, we define the
+    # following default value:
+    default_quaternion = _np.array([2.0, 0.0, 0.0, 0.0])
+    return _np.array(
+        [
+            node.rotation.q if isinstance(node, _NodeCosserat) else default_quaternion
+            for node in nodes
+        ],
+        dtype=float,
+    ).reshape(len(nodes), 4)
 
 
 def get_nodes_by_function(nodes, function, *args, middle_nodes=False, **kwargs):
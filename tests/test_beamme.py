@@ -28,6 +28,7 @@ import warnings
 import autograd.numpy as npAD
 import numpy as np
 import pytest
+import quaternion
 import splinepy
 import vtk
 
@@ -39,8 +40,9 @@ from beamme.core.function import Function
 from beamme.core.geometry_set import GeometryName, GeometrySet, GeometrySetNodes
 from beamme.core.material import MaterialBeamBase
 from beamme.core.mesh import Mesh
+from beamme.core.mesh_instance import MeshInstance
 from beamme.core.node import Node, NodeCosserat
-from beamme.core.rotation import Rotation
+from beamme.core.rotation import Rotation, RotationArray
 from beamme.core.vtk_writer import VTKWriter
 from beamme.four_c.element_beam import (
     Beam3eb,
@@ -173,6 +175,40 @@ def test_mesh_rotations_individual(assert_results_close):
     assert_results_close(mesh_1, mesh_2)
 
 
+def test_mesh_nodal_arrays():
+    """Test that the nodes of a mesh are bound to the nodal arrays and that the
+    arrays are recreated if the nodes of the mesh change."""
+
+    mesh = Mesh()
+    create_test_mesh(mesh)
+    mesh.add(Node([1.0, 2.0, 3.0]))
+
+    nodal_arrays = mesh.get_nodal_arrays()
+    assert nodal_arrays is mesh.get_nodal_arrays()
+    assert nodal_arrays.coordinates.shape == (len(mesh.nodes), 3)
+    assert nodal_arrays.quaternions.shape == (len(mesh.nodes), 4)
+    assert np.array_equal(nodal_arrays.quaternions[-1], [2.0, 0.0, 0.0, 0.0])
+
+    # Modifications of the arrays are directly visible in the nodes.
+    nodal_arrays.coordinates[0] = [1.0, 2.0, 3.0]
+    nodal_arrays.quaternions[0] = [0.0, 1.0, 0.0, 0.0]
+    assert np.array_equal(mesh.nodes[0].coordinates, [1.0, 2.0, 3.0])
+    assert np.array_equal(mesh.nodes[0].rotation.q, [0.0, 1.0, 0.0, 0.0])
+
+    # Rebinding a node or adding a node invalidates the arrays.
+    mesh.nodes[1].rotation = Rotation()
+    assert mesh.get_nodal_arrays() is not nodal_arrays
+    nodal_arrays = mesh.get_nodal_arrays()
+    mesh.add(Node([0.0, 0.0, 0.0]))
+    assert mesh.get_nodal_arrays() is not nodal_arrays
+
+    # A copied mesh is not bound to the arrays of the original mesh.
+    mesh_copy = mesh.copy()
+    mesh_copy.translate([1.0, 0.0, 0.0])
+    assert np.array_equal(mesh.nodes[0].coordinates, [1.0, 2.0, 3.0])
+    assert np.array_equal(mesh_copy.nodes[0].coordinates, [2.0, 2.0, 3.0])
+
+
 @pytest.mark.parametrize("origin", [False, True])
 @pytest.mark.parametrize("flip", [False, True])
 def test_mesh_reflection(origin, flip, assert_results_close):
@@ -378,6 +414,27 @@ def test_wrap_cylinder_not_on_same_plane(
     assert_results_close(get_corresponding_reference_file_path(), mesh)
 
 
+def test_wrap_around_cylinder_advanced_warning():
+    """Check the warning for elements that are not in a plane parallel to the
+    y-z or x-z plane when wrapping around a cylinder."""
+
+    mat = MaterialReissner(radius=0.05)
+
+    # Lines in planes parallel to the y-z and x-z planes.
+    mesh = Mesh()
+    create_beam_mesh_line(mesh, Beam3rHerm2Line3, mat, [1, 0, 0], [1, 1, 1], n_el=2)
+    create_beam_mesh_line(mesh, Beam3rHerm2Line3, mat, [1, 0, 0], [2, 0, 1], n_el=2)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        mesh.wrap_around_cylinder(radius=1.0)
+
+    # Line that is not parallel to one of the planes.
+    mesh = Mesh()
+    create_beam_mesh_line(mesh, Beam3rHerm2Line3, mat, [1, 0, 0], [2, 1, 0], n_el=2)
+    with pytest.warns(UserWarning, match="There are elements which are not parallel"):
+        mesh.wrap_around_cylinder(radius=1.0)
+
+
 def test_get_nodes_by_function(assert_results_close):
     """Check if the get_nodes_by_function method of Mesh works properly."""
 
@@ -1005,6 +1062,79 @@ def test_geometry_set_get_geometry_objects():
         assert element == mesh.elements[i_element]
 
 
+@pytest.mark.parametrize("use_nodal_geometry_sets", [True, False])
+def test_geometry_set_operations(use_nodal_geometry_sets):
+    """Test the set operations and the dump of geometry sets."""
+
+    nodes = [Node([i, 0, 0]) for i in range(5)]
+    for i_node, node in enumerate(nodes):
+        node.i_global = 4 - i_node
+
+    def create_set(set_nodes):
+        """Create a point set with the given nodes."""
+        if use_nodal_geometry_sets:
+            return GeometrySetNodes(bme.geo.point, set_nodes)
+        else:
+            return GeometrySet(set_nodes)
+
+    set_1 = create_set(nodes[:3])
+    set_2 = create_set([nodes[4], nodes[2], nodes[1]])
+
+    assert set_1.union(set_2).get_points() == nodes[:3] + [nodes[4]]
+    assert set_1.intersection(set_2).get_points() == nodes[1:3]
+    assert set_1.difference(set_2).get_points() == [nodes[0]]
+    assert set_1.difference(set_1).get_points() == []
+    assert set_1.get_points() == nodes[:3]
+    assert type(set_1.union(set_2)) is type(set_1)
+
+    with pytest.raises(TypeError):
+        set_1.union(GeometrySetNodes(bme.geo.line, nodes))
+
+    assert np.array_equal(set_2.get_node_indices(), [0, 2, 3])
+    set_2.i_global = 1
+    assert set_2.dump_to_list() == [
+        {"type": "NODE", "node_id": node_id, "d_type": "DNODE", "d_id": 2}
+        for node_id in [1, 3, 4]
+    ]
+
+
+def test_geometry_set_container_membership():
+    """Test the identity based membership check of the geometry set
+    container."""
+
+    mesh = Mesh()
+    node_sets = [GeometrySet(Node([i, 0, 0])) for i in range(3)]
+    mesh.add(node_sets[0])
+    mesh.add(node_sets[1])
+    assert mesh.geometry_sets.has_item(bme.geo.point, node_sets[0])
+    assert not mesh.geometry_sets.has_item(bme.geo.point, node_sets[2])
+    assert not mesh.geometry_sets.has_item(bme.geo.line, node_sets[0])
+    with pytest.raises(ValueError, match="already in this container"):
+        mesh.add(node_sets[1])
+
+    # Direct modifications of the lists are detected.
+    mesh.geometry_sets[bme.geo.point].append(node_sets[2])
+    assert mesh.geometry_sets.has_item(bme.geo.point, node_sets[2])
+    mesh.geometry_sets[bme.geo.point] = [node_sets[2]]
+    assert not mesh.geometry_sets.has_item(bme.geo.point, node_sets[0])
+    mesh.geometry_sets[bme.geo.point][0] = node_sets[1]
+    assert mesh.geometry_sets.has_item(bme.geo.point, node_sets[1])
+    assert not mesh.geometry_sets.has_item(bme.geo.point, node_sets[2])
+    mesh.geometry_sets[bme.geo.point][:] = [node_sets[0]]
+    assert mesh.geometry_sets.has_item(bme.geo.point, node_sets[0])
+    assert not mesh.geometry_sets.has_item(bme.geo.point, node_sets[1])
+    mesh.geometry_sets[bme.geo.point].pop()
+    assert not mesh.geometry_sets.has_item(bme.geo.point, node_sets[0])
+    mesh.geometry_sets[bme.geo.point].append(node_sets[2])
+
+    # A copied container has its own membership index.
+    mesh_copy = mesh.copy()
+    assert not mesh_copy.geometry_sets.has_item(bme.geo.point, node_sets[2])
+    assert mesh_copy.geometry_sets.has_item(
+        bme.geo.point, mesh_copy.geometry_sets[bme.geo.point][0]
+    )
+
+
 @pytest.mark.parametrize("use_nodal_geometry_sets", [True, False])
 def test_replace_nodes_geometry_set(
     get_bc_data, use_nodal_geometry_sets, assert_results_close
@@ -1168,6 +1298,79 @@ def test_replace_nodes_geometry_set(
     assert_results_close(mesh_ref, mesh_couple)
 
 
+def test_mesh_replace_nodes():
+    """Test that multiple nodes can be replaced at once in the mesh."""
+
+    mat = MaterialReissner()
+    mesh = Mesh()
+    beam_sets = [
+        create_beam_mesh_line(
+            mesh, Beam3rHerm2Line3, mat, [i_beam, 0, 0], [i_beam + 1, 0, 0]
+        )
+        for i_beam in range(3)
+    ]
+    start_nodes = [beam_set["start"].get_points()[0] for beam_set in beam_sets]
+    end_nodes = [beam_set["end"].get_points()[0] for beam_set in beam_sets]
+    point_set = GeometrySetNodes(bme.geo.point, start_nodes)
+    mesh.add(point_set)
+
+    # Replace the nodes, the second replacement is given as a chain.
+    mesh.replace_nodes({start_nodes[1]: end_nodes[0], start_nodes[2]: start_nodes[1]})
+
+    assert len(mesh.nodes) == 7
+    assert start_nodes[1] not in mesh.nodes
+    assert start_nodes[2] not in mesh.nodes
+    assert mesh.elements[1].nodes[0] is end_nodes[0]
+    assert mesh.elements[2].nodes[0] is end_nodes[0]
+    assert point_set.get_points() == [start_nodes[0], end_nodes[0]]
+    assert start_nodes[1].get_master_node() is end_nodes[0]
+    assert start_nodes[2].get_master_node() is end_nodes[0]
+
+    # Check the errors for invalid replacements.
+    with pytest.raises(ValueError, match="is not in the mesh"):
+        mesh.replace_nodes({start_nodes[1]: end_nodes[0]})
+    with pytest.raises(ValueError, match="The new node is not in the mesh"):
+        mesh.replace_nodes({end_nodes[1]: start_nodes[1]})
+    with pytest.raises(ValueError, match="contain a cycle"):
+        mesh.replace_nodes({end_nodes[1]: end_nodes[2], end_nodes[2]: end_nodes[1]})
+    node = Node([0, 0, 0])
+    mesh.add(node)
+    with pytest.raises(TypeError, match="same type"):
+        mesh.replace_nodes({node: end_nodes[1]})
+
+
+def test_mesh_replace_node_index_map():
+    """Test that replacing single nodes keeps the node index map of the mesh
+    consistent with the node list."""
+
+    mat = MaterialReissner()
+    mesh = Mesh()
+    beam_sets = [
+        create_beam_mesh_line(
+            mesh, Beam3rHerm2Line3, mat, [i_beam, 0, 0], [i_beam + 1, 0, 0]
+        )
+        for i_beam in range(3)
+    ]
+    start_nodes = [beam_set["start"].get_points()[0] for beam_set in beam_sets]
+    end_nodes = [beam_set["end"].get_points()[0] for beam_set in beam_sets]
+
+    # Create the index map before the nodes are replaced.
+    mesh.set_node_links()
+    mesh._get_node_index_map()
+    start_nodes[1].replace_with(end_nodes[0])
+    start_nodes[2].replace_with(end_nodes[1])
+
+    assert len(mesh.nodes) == 7
+    assert mesh._get_node_index_map() == {node: i for i, node in enumerate(mesh.nodes)}
+    assert mesh.elements[1].nodes[0] is end_nodes[0]
+    assert mesh.elements[2].nodes[0] is end_nodes[1]
+
+    with pytest.raises(ValueError, match="The new node is not in the mesh"):
+        mesh.replace_node(end_nodes[2], start_nodes[1])
+    with pytest.raises(ValueError, match="should be replaced is not in the mesh"):
+        mesh.replace_node(start_nodes[1], end_nodes[2])
+
+
 def create_beam_to_solid_conditions_model(
     get_corresponding_reference_file_path, full_import: bool
 ):
@@ -1531,6 +1734,126 @@ def test_point_couplings(
     )
 
 
+@pytest.mark.parametrize(
+    "coupling_type", [bme.bc.point_coupling, bme.bc.point_coupling_penalty]
+)
+def test_point_couplings_incremental(coupling_type):
+    """Test that incremental couplings result in the same coupled nodes as a
+    single coupling of all nodes."""
+
+    def create_step(mesh, i_step):
+        """Add a ring of beams around the origin to the mesh, that is connected
+        to the previous rings."""
+        material = MaterialReissner()
+        for i_beam in range(4):
+            angle = [np.pi * 0.5 * i_beam, np.pi * 0.5 * (i_beam + 1)]
+            points = [
+                [(i_step + 1) * np.cos(angle[i]), (i_step + 1) * np.sin(angle[i]), 0]
+                for i in range(2)
+            ]
+            create_beam_mesh_line(mesh, Beam3rHerm2Line3, material, *points)
+            if i_step > 0:
+                create_beam_mesh_line(
+                    mesh,
+                    Beam3rHerm2Line3,
+                    material,
+                    [i_step * np.cos(angle[0]), i_step * np.sin(angle[0]), 0],
+                    points[0],
+                )
+
+    def get_coupled_nodes(mesh):
+        """Return the indices of the coupled nodes for each coupling."""
+        node_index = {node: i for i, node in enumerate(mesh.nodes)}
+        return sorted(
+            [node_index[node] for node in coupling.geometry_set.get_points()]
+            for coupling in mesh.boundary_conditions[coupling_type, bme.geo.point]
+        )
+
+    mesh_full = Mesh()
+    mesh_incremental = Mesh()
+    for i_step in range(3):
+        create_step(mesh_full, i_step)
+        create_step(mesh_incremental, i_step)
+        mesh_incremental.couple_nodes(coupling_type=coupling_type, incremental=True)
+    mesh_full.couple_nodes(coupling_type=coupling_type)
+
+    assert len(get_coupled_nodes(mesh_full)) > 0
+    assert get_coupled_nodes(mesh_full) == get_coupled_nodes(mesh_incremental)
+
+    with pytest.raises(ValueError, match="coupling type"):
+        mesh_incremental.couple_nodes(
+            coupling_type=coupling_type,
+            coupling_dof_type=bme.coupling_dof.joint,
+            incremental=True,
+        )
+    mesh_incremental.nodes.pop(0)
+    with pytest.raises(ValueError, match="only appending nodes"):
+        mesh_incremental.couple_nodes(coupling_type=coupling_type, incremental=True)
+
+
+def test_point_couplings_incremental_copy():
+    """Test that the incremental coupling can be continued on a copied mesh."""
+
+    def get_coupled_nodes(mesh):
+        """Return the indices of the coupled nodes for each coupling."""
+        node_index = {node: i for i, node in enumerate(mesh.nodes)}
+        return sorted(
+            sorted(node_index[node] for node in coupling.geometry_set.get_points())
+            for coupling in mesh.boundary_conditions[
+                bme.bc.point_coupling, bme.geo.point
+            ]
+        )
+
+    material = MaterialReissner()
+    mesh = Mesh()
+    create_beam_mesh_line(mesh, Beam3rHerm2Line3, material, [0, 0, 0], [1, 0, 0])
+    create_beam_mesh_line(mesh, Beam3rHerm2Line3, material, [1, 0, 0], [2, 0, 0])
+    mesh.couple_nodes(incremental=True)
+    mesh_copy = mesh.copy()
+
+    for mesh_step in [mesh_copy, mesh]:
+        create_beam_mesh_line(
+            mesh_step, Beam3rHerm2Line3, material, [2, 0, 0], [3, 0, 0]
+        )
+        mesh_step.couple_nodes(incremental=True)
+        assert get_coupled_nodes(mesh_step) == [[2, 3], [5, 6]]
+
+    # The couplings of the copy must only reference the nodes of the copy.
+    nodes_copy = set(mesh_copy.nodes)
+    for coupling in mesh_copy.boundary_conditions[bme.bc.point_coupling, bme.geo.point]:
+        assert set(coupling.geometry_set.get_points()) <= nodes_copy
+
+
+def test_point_couplings_periodic():
+    """Test that nodes are coupled across the boundaries of a periodic box."""
+
+    mesh = Mesh()
+    material = MaterialReissner()
+    # Beams that cross the box in x-direction and a beam from the corner of
+    # the box to the opposite corner.
+    create_beam_mesh_line(
+        mesh, Beam3rHerm2Line3, material, [0, 0.5, 0], [1, 0.5, 0], n_el=2
+    )
+    create_beam_mesh_line(
+        mesh, Beam3rHerm2Line3, material, [0, 1.5, 0], [1, 1.5, 0], n_el=2
+    )
+    create_beam_mesh_line(mesh, Beam3rHerm2Line3, material, [0, 0, 0], [1, 2, 0])
+    mesh.couple_nodes(periods=[1.0, 2.0, None])
+
+    coupled_coordinates = sorted(
+        sorted(node.coordinates.tolist() for node in coupling.geometry_set.get_points())
+        for coupling in mesh.boundary_conditions[bme.bc.point_coupling, bme.geo.point]
+    )
+    assert coupled_coordinates == [
+        [[0.0, 0.0, 0.0], [1.0, 2.0, 0.0]],
+        [[0.0, 0.5, 0.0], [1.0, 0.5, 0.0]],
+        [[0.0, 1.5, 0.0], [1.0, 1.5, 0.0]],
+    ]
+
+    with pytest.raises(ValueError, match="Periodic couplings"):
+        mesh.couple_nodes(periods=[1.0, 2.0, None], reuse_matching_nodes=True)
+
+
 def test_point_couplings_check():
     """Test that the check for points at the same spatial position works for
     point couplings."""
@@ -1873,6 +2196,236 @@ def test_deep_copy(get_bc_data, assert_results_close):
     assert_results_close(mesh, mesh_copy)
 
 
+def test_mesh_copy():
+    """Test that the copy of a mesh only shares the materials and functions
+    with the original mesh."""
+
+    mat = MaterialReissner()
+    fun = Function("COMPONENT 0 SYMBOLIC_FUNCTION_OF_SPACE_TIME t")
+    mesh = Mesh()
+    mesh.add(mat, fun)
+    beam_set = create_beam_mesh_line(
+        mesh, Beam3rHerm2Line3, mat, [0, 0, 0], [1, 0, 0], n_el=2
+    )
+    mesh.add(beam_set)
+    mesh.add(
+        BoundaryCondition(beam_set["start"], {"FUNCT": fun}, bc_type=bme.bc.dirichlet)
+    )
+    mesh.add(Node([0, 1, 0], data={"value": [1]}))
+    mesh.elements[0].vtk_cell_data["value"] = (np.array([1.0]), bme.vtk_type.float)
+
+    mesh_copy = mesh.copy()
+    node_index = {node: i for i, node in enumerate(mesh.nodes)}
+
+    # Check the new nodes and elements.
+    assert mesh_copy.materials == [mat]
+    assert mesh_copy.functions == [fun]
+    for node, node_copy in zip(mesh.nodes, mesh_copy.nodes):
+        assert node_copy is not node
+        assert type(node_copy) is type(node)
+        assert np.array_equal(node_copy.coordinates, node.coordinates)
+        if isinstance(node, NodeCosserat):
+            assert node_copy.rotation is not node.rotation
+            assert node_copy.rotation == node.rotation
+    assert mesh_copy.nodes[-1].data == {"value": [1]}
+    assert mesh_copy.nodes[-1].data is not mesh.nodes[-1].data
+    for element, element_copy in zip(mesh.elements, mesh_copy.elements):
+        assert element_copy is not element
+        assert element_copy.material is mat
+        assert [mesh_copy.nodes.index(node) for node in element_copy.nodes] == [
+            node_index[node] for node in element.nodes
+        ]
+    assert (
+        mesh_copy.elements[0].vtk_cell_data["value"][0]
+        is not mesh.elements[0].vtk_cell_data["value"][0]
+    )
+
+    # Check that the sets and boundary conditions contain the new items.
+    bc_copy = mesh_copy.boundary_conditions[bme.bc.dirichlet, bme.geo.point][0]
+    assert bc_copy.data["FUNCT"] is fun
+    assert bc_copy.geometry_set.get_points() == [mesh_copy.nodes[0]]
+    assert (
+        mesh_copy.geometry_sets[bme.geo.line][0].get_all_nodes()
+        == (mesh_copy.nodes[:5])
+    )
+
+    # Modifications of the copy don't affect the original mesh.
+    mesh_copy.translate([1, 2, 3])
+    mesh_copy.rotate(Rotation([0, 0, 1], np.pi / 2))
+    assert np.allclose(mesh.nodes[2].coordinates, [0.5, 0, 0])
+    assert mesh.nodes[2].rotation == Rotation()
+
+
+def test_mesh_node_element_adjacency():
+    """Test the node-element adjacency of a mesh."""
+
+    mat = MaterialReissner()
+    mesh = Mesh()
+    create_beam_mesh_line(mesh, Beam3rHerm2Line3, mat, [0, 0, 0], [1, 0, 0], n_el=2)
+    create_beam_mesh_line(mesh, Beam3rHerm2Line3, mat, [1, 0, 0], [2, 0, 0])
+    mesh.add(Node([0, 1, 0]))
+
+    adjacency = mesh.get_node_element_adjacency()
+    assert np.array_equal(adjacency.element_offsets, [0, 3, 6, 9])
+    assert np.array_equal(adjacency.element_node_indices, [0, 1, 2, 2, 3, 4, 5, 6, 7])
+    assert np.array_equal(adjacency.node_offsets, [0, 1, 2, 4, 5, 6, 7, 8, 9, 9])
+    assert np.array_equal(adjacency.node_element_indices, [0, 0, 0, 1, 1, 1, 2, 2, 2])
+    assert mesh.get_node_element_adjacency() is adjacency
+
+    assert mesh.get_connected_elements([mesh.nodes[2]]) == mesh.elements[:2]
+    assert (
+        mesh.get_connected_elements([mesh.nodes[4], mesh.nodes[5]])
+        == (mesh.elements[1:])
+    )
+    assert mesh.get_connected_elements([mesh.nodes[-1]]) == []
+
+    # The adjacency is updated if the connectivity changes.
+    mesh.replace_nodes({mesh.nodes[5]: mesh.nodes[4]})
+    adjacency = mesh.get_node_element_adjacency()
+    assert np.array_equal(adjacency.element_node_indices, [0, 1, 2, 2, 3, 4, 4, 5, 6])
+    assert mesh.get_connected_elements([mesh.nodes[4]]) == mesh.elements[1:]
+
+    # Set the links in the nodes.
+    mesh.set_node_links()
+    assert mesh.nodes[2].element_link == mesh.elements[:2]
+    assert mesh.nodes[4].element_link == mesh.elements[1:]
+    assert mesh.nodes[-1].element_link == []
+    assert all(node.mesh is mesh for node in mesh.nodes)
+
+
+def test_mesh_node_spatial_queries():
+    """Test the spatial queries for the nodes of a mesh."""
+
+    mat = MaterialReissner()
+    mesh = Mesh()
+    for i_y in range(3):
+        create_beam_mesh_line(
+            mesh, Beam3rHerm2Line3, mat, [0, i_y, 0], [2, i_y, 0], n_el=2
+        )
+
+    def get_node_indices(node_set):
+        """Return the indices of the nodes in the given set."""
+        assert isinstance(node_set, GeometrySetNodes)
+        assert node_set.geometry_type is bme.geo.point
+        return [mesh.nodes.index(node) for node in node_set.get_points()]
+
+    assert get_node_indices(mesh.nodes_on_plane([0, 1, 0], [0, 1, 0])) == [5, 7, 9]
+    assert get_node_indices(
+        mesh.nodes_on_plane([0, 2, 0], [0, 1, 0], middle_nodes=True)
+    ) == list(range(5, 10))
+    assert get_node_indices(mesh.nodes_in_box([0.5, 0.5, -1], [2, 2, 1])) == [
+        7,
+        9,
+        12,
+        14,
+    ]
+    assert get_node_indices(mesh.nodes_in_sphere([2, 2, 0], 1.0)) == [9, 12, 14]
+    assert get_node_indices(
+        mesh.nodes_on_cylinder([0, 0, 1], [0, 0, 0], 2.0, middle_nodes=True)
+    ) == [4, 10]
+    assert get_node_indices(mesh.nodes_on_plane([0, 0, 1], [0, 0, 1])) == []
+
+    # The index is reused and the KD-tree is updated if the mesh is
+    # transformed.
+    spatial_index = mesh.get_node_spatial_index()
+    assert mesh.get_node_spatial_index() is spatial_index
+    kd_tree = spatial_index.kd_tree
+    assert spatial_index.kd_tree is kd_tree
+    mesh.translate([0, 1, 0])
+    assert get_node_indices(mesh.nodes_on_plane([0, 1, 0], [0, 1, 0])) == [0, 2, 4]
+    assert get_node_indices(mesh.nodes_in_sphere([2, 3, 0], 1.0)) == [9, 12, 14]
+    assert mesh.get_node_spatial_index() is spatial_index
+    assert spatial_index.kd_tree is not kd_tree
+
+    # The index is recreated if the nodes of the mesh are changed.
+    create_beam_mesh_line(mesh, Beam3rHerm2Line3, mat, [0, 0, 0], [0, 1, 0])
+    assert mesh.get_node_spatial_index() is not spatial_index
+
+
+def test_mesh_node_spatial_index_lazy_kd_tree():
+    """Test that the KD-tree of the node spatial index is only created for
+    queries that use it."""
+
+    mesh = Mesh()
+    create_beam_mesh_line(
+        mesh, Beam3rHerm2Line3, MaterialReissner(), [0, 0, 0], [2, 0, 0], n_el=2
+    )
+    spatial_index = mesh.get_node_spatial_index()
+
+    assert len(mesh.nodes_on_plane([1, 0, 0], [1, 0, 0]).get_points()) == 1
+    assert len(mesh.nodes_on_cylinder([1, 0, 0], [0, 1, 0], 1.0).get_points()) == 3
+    assert spatial_index._kd_tree is None
+
+    assert len(mesh.nodes_in_sphere([0, 0, 0], 1.0).get_points()) == 2
+    assert spatial_index._kd_tree is not None
+
+
+def test_mesh_instance(assert_results_close):
+    """Test that mesh instances result in the same input file and VTK
+    representation as transformed copies of the base mesh."""
+
+    mat = MaterialReissner()
+    cell = Mesh()
+    beam_set = create_beam_mesh_line(
+        cell, Beam3rHerm2Line3, mat, [0, 0, 0], [1, 0, 0], n_el=2
+    )
+    cell.add(
+        BoundaryCondition(beam_set["start"], {"COMPONENT": 1}, bc_type=bme.bc.dirichlet)
+    )
+    rotations = [Rotation([0, 0, 1], 0.1 * i) for i in range(3)]
+    translations = [[0, i, 0] for i in range(3)]
+    final_rotation = Rotation([1, 0, 0], 0.3)
+
+    # Create the reference mesh with explicit copies of the base mesh.
+    mesh_ref = Mesh()
+    for rotation, translation in zip(rotations, translations):
+        cell_copy = cell.copy()
+        cell_copy.rotate(rotation)
+        cell_copy.translate(translation)
+        mesh_ref.add(cell_copy)
+    mesh_ref.rotate(final_rotation)
+    mesh_ref.translate([1, 2, 3])
+
+    # Create the same mesh with instances.
+    mesh = Mesh()
+    mesh_instance = MeshInstance(cell, rotations=rotations, translations=translations)
+    mesh.add(mesh_instance)
+    mesh.rotate(final_rotation)
+    mesh.translate([1, 2, 3])
+
+    assert len(mesh_instance) == 3
+    assert len(mesh.nodes) == 0
+    assert mesh.copy().mesh_instances[0].mesh is cell
+
+    assert_results_close(mesh, mesh_ref)
+    vtk_beam, _ = mesh.get_vtk_representation()
+    vtk_beam_ref, _ = mesh_ref.get_vtk_representation()
+    assert vtk_beam.grid.GetNumberOfCells() == vtk_beam_ref.grid.GetNumberOfCells()
+    assert np.allclose(vtk_beam.points.GetData(), vtk_beam_ref.points.GetData())
+
+    # Check the errors for operations that are not possible for instances.
+    with pytest.raises(ValueError, match="can not be reflected"):
+        mesh.reflect([1, 0, 0])
+    with pytest.raises(ValueError, match="can not be coupled"):
+        mesh.couple_nodes()
+    with pytest.raises(ValueError, match="single rotation"):
+        mesh.rotate(final_rotation, only_rotate_triads=True)
+    with pytest.raises(ValueError, match="expected 1 or 3"):
+        MeshInstance(cell, rotations=rotations, translations=[[0, 0, 0]] * 2)
+
+    # Check the different types of arrays for the rotations.
+    quaternions = np.array([rotation.get_quaternion() for rotation in rotations])
+    for instance_rotations in [
+        quaternions,
+        quaternion.from_float_array(quaternions),
+        RotationArray.from_quaternion(quaternions),
+    ]:
+        assert np.allclose(
+            MeshInstance(cell, rotations=instance_rotations).quaternions,
+            quaternions,
+        )
+
+
 def test_mesh_add_checks():
     """This test checks that Mesh raises an error when double objects are added
     to the mesh."""
@@ -1993,6 +2546,11 @@ def test_check_double_elements(
     with pytest.raises(ValueError):
         mesh.check_overlapping_elements()
 
+    # Check that the overlapping element pairs are returned.
+    with pytest.warns(UserWarning, match="multiple middle nodes"):
+        overlapping_element_pairs = mesh.check_overlapping_elements(raise_error=False)
+    assert np.array_equal(overlapping_element_pairs, [[0, 2]])
+
     # Check if the overlapping elements are written to the vtk output.
     warnings.filterwarnings("ignore")
     ref_file = get_corresponding_reference_file_path(
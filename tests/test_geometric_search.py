@@ -23,6 +23,7 @@
 module."""
 
 import random
+import warnings
 
 import numpy as np
 import pytest
@@ -31,9 +32,28 @@ from beamme.core.mesh import Mesh
 from beamme.core.rotation import Rotation
 from beamme.four_c.element_beam import Beam3rHerm2Line3
 from beamme.four_c.material import MaterialReissner
+from beamme.geometric_search.beam_proximity import (
+    FindCloseSegmentAlgorithm,
+    find_close_beams,
+    find_close_segment_pairs,
+    get_segment_distances,
+)
+from beamme.geometric_search.benchmark import calibrate_find_close_points, main
+from beamme.geometric_search.calibration import (
+    get_calibrated_algorithm_name,
+    load_calibration,
+    save_calibration,
+)
+from beamme.geometric_search.chunked import find_close_points_chunked
+from beamme.geometric_search.connected_components import (
+    pairs_to_point_partners,
+    point_partners_to_pairs,
+)
 from beamme.geometric_search.find_close_points import (
     FindClosePointAlgorithm,
+    _get_calibrated_algorithm,
     find_close_points,
+    find_close_points_segmented,
     partner_indices_to_point_partners,
     point_partners_to_partner_indices,
     point_partners_to_unique_indices,
@@ -41,6 +61,10 @@ from beamme.geometric_search.find_close_points import (
 from beamme.mesh_creation_functions.applications.beam_honeycomb import (
     create_beam_mesh_honeycomb_flat,
 )
+from beamme.mesh_creation_functions.beam_arc import (
+    create_beam_mesh_arc_segment_via_axis,
+)
+from beamme.mesh_creation_functions.beam_line import create_beam_mesh_line
 from beamme.utils.nodes import filter_nodes, get_nodal_coordinates
 
 PYTEST_GEOMETRIC_SEARCH_PARAMETRIZE = [
@@ -48,6 +72,8 @@ PYTEST_GEOMETRIC_SEARCH_PARAMETRIZE = [
     [
         FindClosePointAlgorithm.kd_tree_scipy,
         FindClosePointAlgorithm.brute_force_cython,
+        FindClosePointAlgorithm.spatial_hash_numpy,
+        FindClosePointAlgorithm.binning_cython,
         pytest.param(
             FindClosePointAlgorithm.boundary_volume_hierarchy_arborx,
             marks=pytest.mark.arborx,
@@ -554,6 +580,470 @@ def test_find_close_points_tolerance_precision(algorithm, assert_results_close):
     assert_results_close(has_partner, [0, 0, 1, 1])
 
 
+@pytest.mark.parametrize(*PYTEST_GEOMETRIC_SEARCH_PARAMETRIZE)
+def test_find_close_points_chain(algorithm):
+    """Test that chains of close points, where the first and last points of
+    the chain are not close, are combined to a single cluster."""
+
+    tol = 1e-8
+    coords = np.zeros([7, 3])
+    coords[:, 0] = [2.0, 0.0, 1.0, 2.0 + 0.6 * tol, 1.0, 2.0 + 1.2 * tol, 3.0]
+    coords[:, 1] = [0.0, 0.0, 0.0, 0.0, 0.8 * tol, 0.0, 0.0]
+
+    has_partner, n_partner = find_close_points(coords, algorithm=algorithm, tol=tol)
+    assert list(has_partner) == [0, -1, 1, 0, 1, 0, -1]
+    assert n_partner == 2
+
+    # The clusters are numbered in the order of their first point.
+    has_partner, n_partner = find_close_points(
+        coords[::-1], algorithm=algorithm, tol=tol
+    )
+    assert list(has_partner) == [-1, 0, 1, 0, 1, -1, 0]
+    assert n_partner == 2
+
+
+@pytest.mark.parametrize(*PYTEST_GEOMETRIC_SEARCH_PARAMETRIZE)
+def test_find_close_points_dense_chain(algorithm):
+    """Test that dense chains of close points, where each point has multiple
+    partners in both directions, are combined to a single cluster."""
+
+    tol = 1e-8
+    coords = np.zeros([1000, 3])
+    coords[:500, 0] = 0.3 * tol * np.arange(500)
+    coords[500:, 0] = 1.0 + 0.3 * tol * np.arange(500)
+    np.random.seed(seed=1)
+    permutation = np.random.permutation(len(coords))
+
+    has_partner, n_partner = find_close_points(
+        coords[permutation], algorithm=algorithm, tol=tol
+    )
+    assert n_partner == 2
+    has_partner = np.asarray(has_partner)[np.argsort(permutation)]
+    assert np.all(has_partner[:500] == has_partner[0])
+    assert np.all(has_partner[500:] == has_partner[500])
+    assert has_partner[0] != has_partner[500]
+
+
+@pytest.mark.parametrize(*PYTEST_GEOMETRIC_SEARCH_PARAMETRIZE)
+def test_find_close_points_zero_tolerance(algorithm):
+    """Test that duplicated points are found with a vanishing tolerance."""
+
+    np.random.seed(seed=1)
+    n_unique = 100 if algorithm is FindClosePointAlgorithm.brute_force_cython else 200
+    coords = np.repeat(np.random.rand(n_unique, 3), 20, axis=0)
+
+    has_partner, n_partner = find_close_points(coords, algorithm=algorithm, tol=0.0)
+    assert n_partner == n_unique
+    assert list(has_partner) == list(np.repeat(np.arange(n_unique), 20))
+
+    # All points at the same position.
+    has_partner, n_partner = find_close_points(
+        np.ones([50, 3]), algorithm=algorithm, tol=0.0
+    )
+    assert list(has_partner) == [0] * 50
+    assert n_partner == 1
+
+
+@pytest.mark.parametrize(*PYTEST_GEOMETRIC_SEARCH_PARAMETRIZE)
+def test_find_close_points_tolerance_tie(algorithm):
+    """Test that points with a distance equal to the tolerance are
+    partners."""
+
+    coords = np.zeros([3, 3])
+    coords[1, 0] = 0.5
+    coords[2, 0] = 2.0
+
+    has_partner, n_partner = find_close_points(coords, algorithm=algorithm, tol=0.5)
+    assert list(has_partner) == [0, 0, -1]
+    assert n_partner == 1
+
+
+@pytest.mark.parametrize(*PYTEST_GEOMETRIC_SEARCH_PARAMETRIZE)
+def test_find_close_points_segmented(algorithm):
+    """Test that the segmented search gives the same results as separate
+    searches for each segment."""
+
+    np.random.seed(seed=1)
+    tol = 0.1
+    coords = np.random.rand(60, 2)
+    coords[40:] = coords[:20]
+    segment_offsets = [0, 10, 10, 35, 41, 60]
+
+    has_partner, n_partners = find_close_points_segmented(
+        coords, segment_offsets, algorithm=algorithm, tol=tol
+    )
+    for i_segment, (start, end) in enumerate(
+        zip(segment_offsets[:-1], segment_offsets[1:])
+    ):
+        has_partner_ref, n_partner_ref = find_close_points(
+            coords[start:end], algorithm=algorithm, tol=tol
+        )
+        assert list(has_partner[start:end]) == list(has_partner_ref)
+        assert n_partners[i_segment] == n_partner_ref
+    assert np.sum(n_partners) > 0
+
+    with pytest.raises(ValueError):
+        find_close_points_segmented(coords, [0, 30, 20, 60])
+
+
+def test_find_close_points_partner_conversions():
+    """Test the conversions between the different partner layouts."""
+
+    point_partners = [-1, 0, 1, 0, -1, 2, 1, 2, 2]
+    partner_indices = [[1, 3], [2, 6], [5, 7, 8]]
+
+    assert point_partners_to_partner_indices(point_partners, 3) == partner_indices
+    assert partner_indices_to_point_partners(partner_indices, 9) == (
+        point_partners,
+        3,
+    )
+    assert point_partners_to_unique_indices(point_partners) == (
+        [0, 1, 2, 4, 5],
+        [0, 1, 2, 1, 3, 4, 2, 4, 4],
+    )
+    with pytest.raises(ValueError):
+        point_partners_to_unique_indices([-1, 1, 0, 0, 1])
+
+
+@pytest.mark.parametrize(
+    ("algorithm", "kwargs"),
+    [
+        (FindClosePointAlgorithm.spatial_hash_numpy, {}),
+        (FindClosePointAlgorithm.binning_cython, {"n_threads": 1}),
+        (FindClosePointAlgorithm.binning_cython, {"n_threads": 3}),
+    ],
+)
+def test_find_close_points_spatial_hash(algorithm, kwargs, monkeypatch):
+    """Test the algorithms based on spatial hashing for different point
+    distributions, and if the candidates are checked in multiple chunks."""
+
+    monkeypatch.setattr("beamme.geometric_search.spatial_hash._MAX_CANDIDATES", 100)
+
+    np.random.seed(seed=1)
+    tol = 1e-3
+    points = np.random.rand(2000, 3)
+    duplicate_points = points[:500] + tol * (np.random.rand(500, 3) - 0.5)
+    point_clouds = [
+        # Uniformly distributed points with coincident points.
+        np.concatenate([points, duplicate_points]),
+        # Points on a line in 3D, i.e., much more points per cell as
+        # estimated for a uniform distribution.
+        np.outer(np.linspace(0.0, 1.0, 2000) ** 2, [1.0, 2.0, 3.0]),
+        # Points on a plane with more than 3 dimensions.
+        np.concatenate([points[:, :2], np.zeros((2000, 1)), points], axis=1),
+        # Points where the first dimensions are equal for all points.
+        np.concatenate([np.ones((2000, 3)), points[:, :1]], axis=1),
+    ]
+    for point_cloud in point_clouds:
+        has_partner, n_partner = find_close_points(
+            point_cloud, algorithm=algorithm, tol=tol, **kwargs
+        )
+        has_partner_ref, n_partner_ref = find_close_points(
+            point_cloud, algorithm=FindClosePointAlgorithm.kd_tree_scipy, tol=tol
+        )
+        assert list(has_partner) == list(has_partner_ref)
+        assert n_partner == n_partner_ref
+
+
+@pytest.mark.parametrize(
+    "file_content",
+    [
+        '{"version": 1, "crossovers": {"small_tolerance": [[0, "kd_tr',
+        '{"version": 1}',
+        '{"version": 0, "crossovers": {}}',
+        '[[0, "kd_tree_scipy"]]',
+        '{"version": 1, "crossovers": {"small_tolerance": [0, "kd_tree_scipy"]}}',
+    ],
+)
+def test_find_close_points_calibration_invalid_file(
+    file_content, tmp_path, monkeypatch
+):
+    """Test that an invalid calibration file results in a single warning and
+    the default algorithm selection."""
+
+    calibration_file = tmp_path / "calibration.json"
+    calibration_file.write_text(file_content)
+    monkeypatch.setenv("BEAMME_GEOMETRIC_SEARCH_CALIBRATION", str(calibration_file))
+    coords = np.zeros([4, 3])
+    coords[2:, 0] = 1.0
+
+    with pytest.warns(UserWarning, match="could not be read"):
+        assert load_calibration() is None
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        has_partner, n_partner = find_close_points(coords, tol=1e-8)
+    assert list(has_partner) == [0, 0, 1, 1]
+    assert n_partner == 2
+
+
+def test_find_close_points_calibration(tmp_path, monkeypatch):
+    """Test the calibration of the automatic algorithm selection."""
+
+    calibration_file = tmp_path / "calibration.json"
+    monkeypatch.setenv("BEAMME_GEOMETRIC_SEARCH_CALIBRATION", str(calibration_file))
+    coords = np.random.rand(100, 3)
+    assert load_calibration() is None
+    assert _get_calibrated_algorithm(coords, 1e-8) is None
+
+    # Run the calibration.
+    crossovers = calibrate_find_close_points(n_points_list=[10, 300], n_repetitions=1)
+    assert load_calibration() == crossovers
+    for tolerance_type in ["small_tolerance", "large_tolerance"]:
+        assert crossovers[tolerance_type][0][0] == 0
+        assert (
+            get_calibrated_algorithm_name(crossovers, 10, tolerance_type)
+            == crossovers[tolerance_type][0][1]
+        )
+
+    # The calibrated algorithm is used for the automatic selection.
+    save_calibration(
+        {
+            "small_tolerance": [[0, "kd_tree_scipy"], [50, "spatial_hash_numpy"]],
+            "large_tolerance": [[0, "not_an_algorithm"]],
+        }
+    )
+    assert (
+        _get_calibrated_algorithm(coords[:10], 1e-8)
+        == FindClosePointAlgorithm.kd_tree_scipy
+    )
+    assert (
+        _get_calibrated_algorithm(coords, 1e-8)
+        == FindClosePointAlgorithm.spatial_hash_numpy
+    )
+    assert _get_calibrated_algorithm(coords, 1.0) is None
+    has_partner, n_partner = find_close_points(
+        np.concatenate([coords, coords[:3]]), tol=1e-8
+    )
+    assert list(has_partner) == [0, 1, 2] + [-1] * 97 + [0, 1, 2]
+    assert n_partner == 3
+
+    # Run the calibration from the command line.
+    main(
+        [
+            "--calibration-file",
+            str(tmp_path / "calibration_main.json"),
+            "--n-points",
+            "10",
+            "--n-repetitions",
+            "1",
+        ]
+    )
+    assert load_calibration(tmp_path / "calibration_main.json") is not None
+
+
+def test_find_close_points_calibration_cache(tmp_path, monkeypatch):
+    """Test that a missing calibration file is cached and that the point
+    spacing is only estimated for calibrations with data."""
+
+    calibration_file = tmp_path / "calibration.json"
+    monkeypatch.setenv("BEAMME_GEOMETRIC_SEARCH_CALIBRATION", str(calibration_file))
+    coords = np.random.rand(100, 3)
+
+    def estimate_point_spacing(*args):
+        """Fail if the point spacing is estimated."""
+        raise AssertionError("The point spacing must not be estimated")
+
+    monkeypatch.setattr(
+        "beamme.geometric_search.find_close_points._estimate_point_spacing",
+        estimate_point_spacing,
+    )
+
+    # The missing file is only checked once per process.
+    assert _get_calibrated_algorithm(coords, 1e-8) is None
+    calibration_file.write_text(
+        '{"version": 1, "crossovers": {"small_tolerance": [[0, "kd_tree_scipy"]]}}'
+    )
+    assert load_calibration() is None
+
+    # A calibration saved in this process is used directly.
+    save_calibration({"small_tolerance": [], "large_tolerance": []})
+    assert load_calibration() == {"small_tolerance": [], "large_tolerance": []}
+    assert _get_calibrated_algorithm(coords, 1e-8) is None
+
+
+@pytest.mark.parametrize(*PYTEST_GEOMETRIC_SEARCH_PARAMETRIZE)
+def test_find_close_points_periodic(algorithm):
+    """Test that points are found across the boundaries of a periodic box,
+    compared to a search with all periodic images of the points."""
+
+    np.random.seed(seed=1)
+    tol = 1e-2
+    periods = np.array([1.0, 2.0, 0.0])
+    points = np.random.rand(500, 3) * [1.0, 2.0, 1.0]
+    duplicate_points = (
+        points[:200]
+        + np.random.randint(-1, 2, size=(200, 3)) * periods
+        + tol * 0.5 * (np.random.rand(200, 3) - 0.5)
+    )
+    # Points in the corners of the box.
+    corner_points = np.array(
+        [[0.0, 0.0, 0.5], [1.0, 0.0, 0.5], [0.0, 2.0, 0.5], [-1.0, 4.0 - tol, 0.5]]
+    )
+    coords = np.concatenate([points, duplicate_points, corner_points])
+
+    # Reference solution with the images in all periodic directions, the
+    # clusters of the images are mapped back to the original points.
+    image_coords = np.concatenate(
+        [
+            coords + [i * periods[0], j * periods[1], 0.0]
+            for i in [-1, 0, 1]
+            for j in [-1, 0, 1]
+        ]
+    )
+    image_partners, _ = find_close_points(
+        image_coords, algorithm=FindClosePointAlgorithm.kd_tree_scipy, tol=tol
+    )
+    has_partner_ref, n_partner_ref = pairs_to_point_partners(
+        point_partners_to_pairs(image_partners) % len(coords), len(coords)
+    )
+
+    has_partner, n_partner = find_close_points(
+        coords, algorithm=algorithm, tol=tol, periods=[1.0, 2.0, None]
+    )
+    assert has_partner[-4:].tolist() == [has_partner[-4]] * 4
+    assert list(has_partner) == list(has_partner_ref)
+    assert n_partner == n_partner_ref
+
+    with pytest.raises(ValueError):
+        find_close_points(coords, algorithm=algorithm, tol=tol, periods=[1.0, 2.0])
+    with pytest.raises(ValueError):
+        find_close_points(coords, algorithm=algorithm, tol=0.6, periods=[1.0, 0, 0])
+
+
+@pytest.mark.parametrize(
+    "algorithm",
+    [
+        FindCloseSegmentAlgorithm.kd_tree_scipy,
+        pytest.param(
+            FindCloseSegmentAlgorithm.boundary_volume_hierarchy_arborx,
+            marks=pytest.mark.arborx,
+        ),
+    ],
+)
+def test_find_close_segment_pairs(algorithm):
+    """Test the search for close line segments and beam elements."""
+
+    # Crossing, parallel, skew and degenerated segments.
+    distances = get_segment_distances(
+        [[0, 0, 0], [0, 0, 0], [0, 0, 0], [0, 0, 0]],
+        [[1, 0, 0], [1, 0, 0], [1, 0, 0], [0, 0, 0]],
+        [[0.5, -1, 1], [2, 1, 0], [0.2, 1, 0], [0, 0, 2]],
+        [[0.5, 1, 1], [3, 1, 0], [0.8, 1, 0], [0, 0, 2]],
+    )
+    assert np.allclose(distances, [1.0, np.sqrt(2.0), 1.0, 2.0])
+
+    # Segment-point, point-segment and point-point pairs.
+    distances = get_segment_distances(
+        [[0, 0, 0], [5, 1, 0], [5, 1, 0], [-1, 0, 0]],
+        [[10, 0, 0], [5, 1, 0], [5, 1, 0], [10, 0, 0]],
+        [[5, 1, 0], [0, 0, 0], [5, 3, 0], [-3, 0, 0]],
+        [[5, 1, 0], [10, 0, 0], [5, 3, 0], [-3, 0, 0]],
+    )
+    assert np.allclose(distances, [1.0, 1.0, 2.0, 2.0])
+    pairs, distances = find_close_segment_pairs(
+        [[0, 0, 0], [5, 0.5, 0]], [[10, 0, 0], [5, 0.5, 0]], 0.6, algorithm=algorithm
+    )
+    assert pairs.tolist() == [[0, 1]]
+    assert np.allclose(distances, [0.5])
+
+    # Compare with the distances of all pairs.
+    np.random.seed(seed=1)
+    tol = 0.05
+    segment_starts = np.random.rand(300, 3)
+    segment_ends = segment_starts + 0.1 * (np.random.rand(300, 3) - 0.5)
+    # Some long segments that cross the whole domain.
+    segment_ends[:2] = segment_starts[:2] + [[1.5, 0.2, 0.1], [0.1, -1.2, 0.3]]
+    pairs, distances = find_close_segment_pairs(
+        segment_starts, segment_ends, tol, algorithm=algorithm
+    )
+    first, second = np.triu_indices(300, k=1)
+    distances_ref = get_segment_distances(
+        segment_starts[first],
+        segment_ends[first],
+        segment_starts[second],
+        segment_ends[second],
+    )
+    is_close = distances_ref <= tol
+    sort_indices = np.lexsort((pairs[:, 1], pairs[:, 0]))
+    assert (
+        pairs[sort_indices].tolist()
+        == np.stack([first[is_close], second[is_close]], axis=1).tolist()
+    )
+    assert np.allclose(distances[sort_indices], distances_ref[is_close])
+
+    # Beams crossing a line, and a curved beam that is only close to the
+    # line with the Hermite interpolation of the centerline.
+    mesh = Mesh()
+    material = MaterialReissner(radius=0.05)
+    create_beam_mesh_line(
+        mesh, Beam3rHerm2Line3, material, [0, 0, 0], [2, 0, 0], n_el=2
+    )
+    create_beam_mesh_line(
+        mesh, Beam3rHerm2Line3, material, [1.5, -1, 0.08], [1.5, 1, 0.08], n_el=2
+    )
+    start_angle = 0.125 * np.pi
+    create_beam_mesh_arc_segment_via_axis(
+        mesh,
+        Beam3rHerm2Line3,
+        material,
+        [0, -1, 0],
+        [0.5, 0, 1.05],
+        [0.5 - np.sin(start_angle), 0, 1.05 - np.cos(start_angle)],
+        0.5 * np.pi,
+    )
+    pairs, distances = find_close_beams(mesh.elements, 0.1, algorithm=algorithm)
+    assert pairs.tolist() == [[1, 2], [1, 3]]
+    assert np.allclose(distances, 0.08)
+
+    pairs, distances = find_close_beams(
+        mesh.elements,
+        0.1,
+        n_segments_between_nodes=10,
+        exclude_connected_beams=False,
+        algorithm=algorithm,
+    )
+    assert pairs.tolist() == [[0, 1], [0, 4], [1, 2], [1, 3], [2, 3]]
+    assert np.allclose(distances, [0.0, 0.05, 0.08, 0.08, 0.0], atol=5e-3)
+
+
+def test_find_close_points_chunked(tmp_path):
+    """Test that the chunked search over slabs gives the same results as the
+    search over all points, for a memory map and an iterator of blocks."""
+
+    np.random.seed(seed=1)
+    tol = 1e-2
+    points = np.random.rand(1000, 3)
+    duplicate_points = points[:300] + tol * 0.5 * (np.random.rand(300, 3) - 0.5)
+    coords = np.concatenate([points, duplicate_points])
+    coords = coords[np.random.permutation(len(coords))]
+    has_partner_ref, n_partner_ref = find_close_points(coords, tol=tol)
+
+    file_path = tmp_path / "coordinates.bin"
+    coords.tofile(file_path)
+    memory_map = np.memmap(file_path, dtype=float, mode="r", shape=coords.shape)
+    has_partner, n_partner = find_close_points_chunked(
+        memory_map, chunk_size=100, tol=tol, temporary_directory=tmp_path
+    )
+    assert list(has_partner) == list(has_partner_ref)
+    assert n_partner == n_partner_ref
+
+    blocks = (coords[i : i + 77] for i in range(0, len(coords), 77))
+    has_partner, n_partner = find_close_points_chunked(
+        blocks, chunk_size=100, tol=tol, temporary_directory=tmp_path
+    )
+    assert list(has_partner) == list(has_partner_ref)
+    assert n_partner == n_partner_ref
+
+    # Points that are all in a plane normal to the slab direction.
+    coords[:, 0] = 0.0
+    has_partner, n_partner = find_close_points_chunked(coords, chunk_size=100, tol=tol)
+    assert list(has_partner) == list(find_close_points(coords, tol=tol)[0])
+
+    has_partner, n_partner = find_close_points_chunked(np.zeros((0, 3)), tol=tol)
+    assert len(has_partner) == 0
+    assert n_partner == 0
+
+
 @pytest.mark.performance
 def test_performance_find_close_points_brute_force_cython(
     evaluate_execution_time,
@@ -29,9 +29,11 @@ import pytest
 import splinepy
 from autograd import jacobian
 
+from beamme.core.conf import bme
+from beamme.core.geometry_set import GeometrySet
 from beamme.core.mesh import Mesh
 from beamme.core.node import NodeCosserat
-from beamme.core.rotation import Rotation
+from beamme.core.rotation import Rotation, RotationArray
 from beamme.four_c.element_beam import Beam3eb, Beam3rHerm2Line3
 from beamme.four_c.material import MaterialEulerBernoulli, MaterialReissner
 from beamme.mesh_creation_functions.applications.beam_fibers_in_rectangle import (
@@ -48,7 +50,10 @@ from beamme.mesh_creation_functions.beam_arc import (
 )
 from beamme.mesh_creation_functions.beam_generic import create_beam_mesh_generic
 from beamme.mesh_creation_functions.beam_helix import create_beam_mesh_helix
-from beamme.mesh_creation_functions.beam_line import create_beam_mesh_line
+from beamme.mesh_creation_functions.beam_line import (
+    create_beam_mesh_line,
+    create_beam_mesh_lines,
+)
 from beamme.mesh_creation_functions.beam_node_continuation import (
     create_beam_mesh_arc_at_node,
     create_beam_mesh_line_at_node,
@@ -493,6 +498,14 @@ def test_mesh_creation_functions_fibers_in_rectangle_return_set(
     # Check the output.
     assert_results_close(get_corresponding_reference_file_path(), mesh)
 
+    # The returned node sets can be combined with other geometry sets.
+    for name in ["north", "east", "south", "west"]:
+        assert isinstance(beam_set[name], GeometrySet)
+    combined_set = beam_set["north"] + beam_set["south"]
+    assert combined_set.get_points() == (
+        beam_set["north"].get_points() + beam_set["south"].get_points()
+    )
+
 
 def test_mesh_creation_functions_wire(
     assert_results_close, get_corresponding_reference_file_path
@@ -514,6 +527,11 @@ def test_mesh_creation_functions_wire(
     # Check the output.
     assert_results_close(get_corresponding_reference_file_path(), mesh)
 
+    # The returned node sets can be combined with other geometry sets.
+    combined_set = set_1["start"] + GeometrySet(mesh_1.nodes[1])
+    assert isinstance(set_1["start"], GeometrySet)
+    assert combined_set.get_points() == set_1["start"].get_points() + [mesh_1.nodes[1]]
+
 
 @pytest.mark.parametrize(
     ("name", "curve_creation_function", "ref_length"),
@@ -662,6 +680,98 @@ def test_mesh_creation_functions_node_continuation_accumulated(assert_results_cl
     assert_results_close(rotation_actual.q, quaternion_expected)
 
 
+def test_mesh_creation_functions_lines():
+    """Test that the bulk creation of lines gives the same mesh as creating
+    each line separately."""
+
+    np.random.seed(seed=1)
+    start_points = np.random.rand(6, 3)
+    end_points = np.random.rand(6, 3)
+    # Lines along the coordinate axes and lines with shared end points.
+    start_points[:3] = 0.0
+    end_points[:3] = np.eye(3)
+    start_points[3] = end_points[2]
+
+    for beam_class, material in [
+        (Beam3rHerm2Line3, MaterialReissner()),
+        (Beam3eb, MaterialEulerBernoulli()),
+    ]:
+        mesh_ref = Mesh()
+        for start_point, end_point in zip(start_points, end_points):
+            create_beam_mesh_line(
+                mesh_ref,
+                beam_class,
+                material,
+                start_point,
+                end_point,
+                n_el=3,
+                set_nodal_arc_length=True,
+            )
+        mesh = Mesh()
+        create_beam_mesh_line(mesh, beam_class, material, [0, 0, 0], [0, 0, -1])
+        return_indices = create_beam_mesh_lines(
+            mesh,
+            beam_class,
+            material,
+            start_points,
+            end_points,
+            n_el=3,
+            set_nodal_arc_length=True,
+        )
+
+        nodes = mesh.nodes[len(mesh.nodes) - len(mesh_ref.nodes) :]
+        assert len(nodes) == len(mesh_ref.nodes)
+        for node, node_ref in zip(nodes, mesh_ref.nodes):
+            assert np.allclose(node.coordinates, node_ref.coordinates)
+            assert node.rotation == node_ref.rotation
+            assert node.is_middle_node == node_ref.is_middle_node
+            assert node.is_end_node == node_ref.is_end_node
+            assert node.arc_length == pytest.approx(node_ref.arc_length)
+        node_indices = {node: i for i, node in enumerate(nodes)}
+        node_indices_ref = {node: i for i, node in enumerate(mesh_ref.nodes)}
+        assert [
+            [node_indices[node] for node in element.nodes]
+            for element in mesh.elements[1:]
+        ] == [
+            [node_indices_ref[node] for node in element.nodes]
+            for element in mesh_ref.elements
+        ]
+
+        assert np.allclose(
+            get_nodal_coordinates([mesh.nodes[i] for i in return_indices["start"]]),
+            start_points,
+        )
+        assert np.allclose(
+            get_nodal_coordinates([mesh.nodes[i] for i in return_indices["end"]]),
+            end_points,
+        )
+        assert (
+            return_indices["line"].tolist()
+            == (1 + np.arange(18).reshape(6, 3)).tolist()
+        )
+
+    # Couple the end nodes that are at the same position.
+    mesh = Mesh()
+    create_beam_mesh_lines(
+        mesh,
+        Beam3rHerm2Line3,
+        MaterialReissner(),
+        start_points,
+        end_points,
+        n_el=2,
+        couple_end_nodes=True,
+    )
+    assert sorted(
+        len(coupling.geometry_set.get_points())
+        for coupling in mesh.boundary_conditions[bme.bc.point_coupling, bme.geo.point]
+    ) == [2, 3]
+
+    with pytest.raises(ValueError, match="number of start and end points"):
+        create_beam_mesh_lines(
+            mesh, Beam3rHerm2Line3, MaterialReissner(), start_points, end_points[:3]
+        )
+
+
 def test_mesh_creation_functions_element_length_option(
     assert_results_close, get_corresponding_reference_file_path
 ):
@@ -862,6 +972,113 @@ def test_mesh_creation_functions_argument_checks():
         )
 
 
+def test_mesh_creation_functions_array_function():
+    """Test that the bulk creation with an array function gives the same mesh
+    as the element wise creation."""
+
+    axis = np.array([0.0, 0.0, 1.0])
+    radius = 2.0
+    start_rotation = Rotation.from_basis([0, 1, 0], [-1, 0, 0])
+
+    def function_generator(alpha, beta):
+        """Return a function for the position and rotation along an arc."""
+
+        def beam_function(xi):
+            """Return the position and rotation at xi."""
+            phi = 0.5 * (xi + 1) * (beta - alpha) + alpha
+            arc_rotation = Rotation(axis, phi)
+            return (
+                arc_rotation * [radius, 0, 0],
+                arc_rotation * start_rotation,
+                phi * radius,
+            )
+
+        return beam_function
+
+    def array_function(parameters):
+        """Return the positions, quaternions and arc lengths along the arc."""
+        arc_rotations = RotationArray(axis, parameters)
+        return (
+            arc_rotations * [radius, 0, 0],
+            (arc_rotations * start_rotation).q,
+            parameters * radius,
+        )
+
+    def create_mesh(use_array_function):
+        """Create arcs with the different options of the generic function."""
+        mesh = Mesh()
+        kwargs = {
+            "beam_class": Beam3rHerm2Line3,
+            "material": MaterialReissner(),
+            "function_generator": function_generator,
+            "array_function": array_function if use_array_function else None,
+        }
+        arc_set = create_beam_mesh_generic(
+            mesh,
+            interval=[0.0, 0.5 * np.pi],
+            n_el=3,
+            set_nodal_arc_length=True,
+            **kwargs,
+        )
+        create_beam_mesh_generic(
+            mesh,
+            interval=[0.5 * np.pi, 2.0 * np.pi],
+            node_positions_of_elements=[0.0, 0.2, 1.0],
+            start_node=arc_set["end"],
+            end_node=arc_set["start"],
+            **kwargs,
+        )
+        create_beam_mesh_generic(
+            mesh,
+            interval=[0.0, 2.0 * np.pi],
+            n_el=4,
+            close_beam=True,
+            **kwargs,
+        )
+        create_beam_mesh_generic(
+            mesh,
+            beam_class=Beam3eb,
+            material=MaterialEulerBernoulli(),
+            function_generator=function_generator,
+            array_function=array_function if use_array_function else None,
+            interval=[0.0, 1.0],
+            n_el=2,
+        )
+        return mesh
+
+    mesh_ref = create_mesh(False)
+    mesh = create_mesh(True)
+    assert len(mesh.nodes) == len(mesh_ref.nodes)
+    for node, node_ref in zip(mesh.nodes, mesh_ref.nodes):
+        assert np.allclose(node.coordinates, node_ref.coordinates, rtol=0, atol=1e-14)
+        assert node.rotation == node_ref.rotation
+        assert node.is_middle_node == node_ref.is_middle_node
+        assert node.is_end_node == node_ref.is_end_node
+        assert node.arc_length == pytest.approx(node_ref.arc_length)
+    node_indices = {node: i for i, node in enumerate(mesh.nodes)}
+    node_indices_ref = {node: i for i, node in enumerate(mesh_ref.nodes)}
+    assert [
+        [node_indices[node] for node in element.nodes] for element in mesh.elements
+    ] == [
+        [node_indices_ref[node] for node in element.nodes]
+        for element in mesh_ref.elements
+    ]
+
+    # The given nodes are checked against the array function.
+    start_node = NodeCosserat([0, 0, 0], start_rotation)
+    mesh.add(start_node)
+    with pytest.raises(ValueError, match="start_node position does not match"):
+        create_beam_mesh_generic(
+            mesh,
+            beam_class=Beam3rHerm2Line3,
+            material=MaterialReissner(),
+            function_generator=function_generator,
+            array_function=array_function,
+            interval=[0.0, 1.0],
+            start_node=start_node,
+        )
+
+
 @pytest.mark.parametrize(
     "basic_creation_function",
     ["line", "arc"],
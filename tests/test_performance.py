@@ -21,10 +21,18 @@
 # THE SOFTWARE.
 """Create a couple of different mesh cases and test the performance."""
 
+import copy
+import time
+import tracemalloc
+
 import numpy as np
 import pytest
 
+from beamme.core.boundary_condition import BoundaryCondition
+from beamme.core.conf import bme
+from beamme.core.geometry_set import GeometrySet
 from beamme.core.mesh import Mesh
+from beamme.core.node import Node, NodeCosserat
 from beamme.core.rotation import Rotation
 from beamme.four_c.element_beam import Beam3rHerm2Line3
 from beamme.four_c.input_file import InputFile
@@ -259,6 +267,37 @@ def test_performance_create_beams(evaluate_execution_time, cache_data):
     )
 
 
+@pytest.mark.performance
+def test_performance_memory_nodes_and_elements():
+    """Test the memory footprint of beam nodes and elements."""
+
+    n_items = 10000
+    rotation = Rotation()
+    material = MaterialReissner()
+
+    tracemalloc.start()
+    try:
+        start_memory = tracemalloc.get_traced_memory()[0]
+        nodes = [NodeCosserat([0.0, 0.0, 0.0], rotation) for _ in range(n_items)]
+        node_memory = tracemalloc.get_traced_memory()[0]
+        elements = [
+            Beam3rHerm2Line3(material=material, nodes=nodes[i : i + 3])
+            for i in range(n_items)
+        ]
+        element_memory = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    bytes_per_node = (node_memory - start_memory) / len(nodes)
+    bytes_per_element = (element_memory - node_memory) / len(elements)
+    print(
+        f"BeamMe: Memory per node: {bytes_per_node:.0f} bytes, "
+        f"memory per element: {bytes_per_element:.0f} bytes"
+    )
+    assert bytes_per_node < 500
+    assert bytes_per_element < 250
+
+
 @pytest.mark.performance
 def test_performance_rotate(evaluate_execution_time, cache_data):
     """Test the performance of rotating a large beam mesh."""
@@ -303,7 +342,7 @@ def test_performance_mespy_wrap_around_cylinder(evaluate_execution_time, cache_d
         "BeamMe: Wrap large beam mesh around cylinder",
         cache_data.mesh.wrap_around_cylinder,
         kwargs={"radius": 1.0},
-        expected_time=1.75,
+        expected_time=0.5,
     )
 
 
@@ -334,6 +373,70 @@ def test_performance_find_close_nodes(evaluate_execution_time, cache_data):
     )
 
 
+@pytest.mark.performance
+def test_performance_copy(evaluate_execution_time, cache_data):
+    """Test the performance of copying a large beam mesh.
+
+    The copy has to be at least 10 times faster than a generic deep copy
+    of the mesh.
+    """
+
+    start_time = time.time()
+    copy.deepcopy(cache_data.mesh)
+    deepcopy_time = time.time() - start_time
+
+    evaluate_execution_time(
+        "BeamMe: Copy large beam mesh",
+        cache_data.mesh.copy,
+        expected_time=deepcopy_time / 10,
+    )
+
+
+@pytest.mark.performance
+def test_performance_couple_nodes_reuse_matching_nodes(evaluate_execution_time):
+    """Test the performance of merging coincident nodes in a large beam
+    mesh."""
+
+    mesh = Mesh()
+    material = MaterialReissner(radius=0.01)
+    for i_y in range(150):
+        for i_x in range(150):
+            create_beam_mesh_line(
+                mesh, Beam3rHerm2Line3, material, [i_x, i_y, 0], [i_x + 1, i_y, 0]
+            )
+
+    evaluate_execution_time(
+        "BeamMe: Merge coincident nodes in large beam mesh",
+        mesh.couple_nodes,
+        kwargs={"reuse_matching_nodes": True},
+        expected_time=1.0,
+    )
+
+
+@pytest.mark.performance
+def test_performance_get_unique_geometry_sets(evaluate_execution_time):
+    """Test the performance of collecting the geometry sets of a mesh with a
+    large number of point boundary conditions."""
+
+    mesh = Mesh()
+    nodes = [Node([i_node, 0, 0]) for i_node in range(50000)]
+    mesh.add(nodes)
+    mesh.add(
+        [
+            BoundaryCondition(
+                GeometrySet(node), {"NUMDOF": 3}, bc_type=bme.bc.dirichlet
+            )
+            for node in nodes
+        ]
+    )
+
+    evaluate_execution_time(
+        "BeamMe: Get unique geometry sets with many point boundary conditions",
+        mesh.get_unique_geometry_sets,
+        expected_time=1.0,
+    )
+
+
 @pytest.mark.performance
 def test_performance_add_mesh_to_input_file(evaluate_execution_time, cache_data):
     """Test the performance of adding a mesh to an input file."""
@@ -22,9 +22,16 @@
 """This script is used to test the functionality of the Rotation class."""
 
 import numpy as np
+import pytest
 
 from beamme.core.conf import bme
-from beamme.core.rotation import Rotation, smallest_rotation
+from beamme.core.rotation import (
+    Rotation,
+    RotationArray,
+    get_rotation_vectors,
+    parallel_transport,
+    smallest_rotation,
+)
 
 
 def get_rotation_matrix(axis, alpha):
@@ -171,6 +178,132 @@ def test_rotation_vector(assert_results_close):
     assert_results_close(rotation_vector, rotation_from_vec.get_rotation_vector())
 
 
+def test_rotation_vectors(assert_results_close):
+    """Test that the vectorized rotation vectors match the ones of the
+    rotation objects."""
+
+    rotations = [
+        Rotation(),
+        Rotation([1, 0, 0], 1e-12),
+        Rotation([0, 0, 1], np.pi),
+        Rotation([0, -1, 1], np.pi),
+        Rotation([1.36568, -2.96784, 3.23346878], 0.7189467),
+        Rotation.from_quaternion(-Rotation([1, 2, 3], 0.3).q),
+    ]
+    quaternions = np.array([rotation.q for rotation in rotations])
+
+    assert_results_close(
+        get_rotation_vectors(quaternions),
+        [rotation.get_rotation_vector() for rotation in rotations],
+    )
+
+    with pytest.raises(ValueError, match="The rotation object is corrupted"):
+        get_rotation_vectors([[2.0, 0.0, 0.0, 0.0]])
+
+
+def test_rotation_array():
+    """Test that the vectorized rotation array gives the same results as the
+    scalar rotation objects."""
+
+    rng = np.random.default_rng(seed=1)
+    quaternions = rng.normal(size=(200, 4))
+    quaternions[:6] = [
+        Rotation().q,
+        Rotation([1, 0, 0], 1e-12).q,
+        Rotation([0, 0, 1], np.pi).q,
+        Rotation([0, -1, 1], np.pi).q,
+        Rotation([1, 0, 0], 1e-6).q,
+        -Rotation([1, 2, 3], 0.3).q,
+    ]
+    vectors = rng.normal(size=(200, 3))
+    other_vectors = rng.normal(size=(200, 3))
+
+    def get_rotations():
+        """Return the scalar rotations and the rotation array."""
+        return (
+            [Rotation.from_quaternion(q) for q in quaternions],
+            RotationArray.from_quaternion(quaternions),
+        )
+
+    def assert_equal(rotation_array_result, scalar_results):
+        """Check that the results are exactly the same."""
+        if isinstance(rotation_array_result, RotationArray):
+            rotation_array_result = rotation_array_result.q
+            scalar_results = [result.q for result in scalar_results]
+        assert np.array_equal(rotation_array_result, scalar_results)
+
+    rotations, rotation_array = get_rotations()
+    assert len(rotation_array) == len(rotations)
+    assert_equal(rotation_array, rotations)
+    assert rotation_array[3] == rotations[3]
+    assert_equal(rotation_array[1:3], rotations[1:3])
+
+    # Rotation vectors and transformation matrices (the rotation vector
+    # changes the sign of the quaternions).
+    for method in [
+        "get_rotation_matrix",
+        "get_rotation_vector",
+        "get_transformation_matrix",
+        "get_transformation_matrix_inv",
+    ]:
+        rotations, rotation_array = get_rotations()
+        assert_equal(
+            getattr(rotation_array, method)(),
+            [getattr(rotation, method)() for rotation in rotations],
+        )
+
+    # Creation of rotations.
+    assert_equal(
+        RotationArray(vectors, vectors[:, 0]),
+        [Rotation(axis, phi) for axis, phi in zip(vectors, vectors[:, 0])],
+    )
+    assert_equal(
+        RotationArray.from_rotation_vector(vectors),
+        [Rotation.from_rotation_vector(vector) for vector in vectors],
+    )
+    assert_equal(
+        RotationArray.from_rotation_matrix(rotation_array.get_rotation_matrix()),
+        [
+            Rotation.from_rotation_matrix(rotation.get_rotation_matrix())
+            for rotation in rotations
+        ],
+    )
+    assert_equal(
+        RotationArray.from_basis(vectors, other_vectors),
+        [Rotation.from_basis(t1, t2) for t1, t2 in zip(vectors, other_vectors)],
+    )
+    assert_equal(RotationArray.from_rotations(rotations), rotations)
+
+    # Operations on rotations.
+    assert_equal(rotation_array.inv(), [rotation.inv() for rotation in rotations])
+    assert_equal(
+        rotation_array * rotation_array[::-1],
+        [
+            rotation_1 * rotation_2
+            for rotation_1, rotation_2 in zip(rotations, rotations[::-1])
+        ],
+    )
+    assert_equal(
+        rotation_array * rotations[10],
+        [rotation * rotations[10] for rotation in rotations],
+    )
+    assert_equal(
+        rotations[10] * rotation_array,
+        [rotations[10] * rotation for rotation in rotations],
+    )
+    assert_equal(
+        rotation_array * vectors,
+        [rotation * vector for rotation, vector in zip(rotations, vectors)],
+    )
+    assert_equal(
+        smallest_rotation(rotation_array, vectors),
+        [
+            smallest_rotation(rotation, vector)
+            for rotation, vector in zip(rotations, vectors)
+        ],
+    )
+
+
 def test_rotation_operator_overload(assert_results_close):
     """Test if the operator overloading gives a correct result."""
 
@@ -266,6 +399,29 @@ def test_smallest_rotation_triad(assert_results_close):
     assert_results_close(rot_smallest.q, rot_smallest_ref)
 
 
+@pytest.mark.parametrize("n_tangents", [1, 2, 7, 100])
+def test_parallel_transport(assert_results_close, n_tangents):
+    """Test that the parallel transport gives the same triads as successive
+    smallest rotations."""
+
+    arc_length = np.linspace(0.0, 4.0, n_tangents)
+    tangents = np.array(
+        [-np.sin(arc_length), np.cos(arc_length), 0.3 + 0.1 * arc_length]
+    ).T
+    start_rotation = Rotation([1, 2, 3], 0.431 * np.pi)
+
+    rotation = start_rotation
+    quaternions_ref = []
+    for tangent in tangents:
+        rotation = smallest_rotation(rotation, tangent)
+        quaternions_ref.append(rotation.q)
+
+    assert_results_close(parallel_transport(start_rotation, tangents), quaternions_ref)
+    assert_results_close(
+        parallel_transport(start_rotation.q, tangents), quaternions_ref
+    )
+
+
 def test_error_accumulation_multiplication(assert_results_close):
     """Test that error accumulation of successive multiplications of rotations
     does not affect the results."""